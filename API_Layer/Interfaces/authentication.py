@@ -1,5 +1,6 @@
 from pydantic import BaseModel
 from typing import Optional
+from datetime import datetime
 
 class LoginRequest(BaseModel):
     mail: str
@@ -63,4 +64,32 @@ class CreateUserResponse(BaseModel):
 
 class CreateWalletResponse(BaseModel):
     wallet_address: str
-    message: str
\ No newline at end of file
+    message: str
+
+class UserSummary(BaseModel):
+    id: int
+    tenant_id: int
+    customer_id: str
+    name: str
+    mail: str
+    phone_number: Optional[str] = None
+    wallet_address: Optional[str] = None
+    is_active: bool
+    is_wallet: bool
+    created_at: Optional[datetime] = None
+
+class TenantSummary(BaseModel):
+    id: int
+    tenant_name: str
+    chain_id: int
+    is_active: bool
+    created_at: Optional[datetime] = None
+
+class SetTenantAdminRequest(BaseModel):
+    customer_id: str
+
+class TenantAdminResponse(BaseModel):
+    tenant_id: int
+    customer_id: str
+    wallet_address: Optional[str] = None
+    message: str
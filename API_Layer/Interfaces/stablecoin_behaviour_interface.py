@@ -1,5 +1,8 @@
 from pydantic import BaseModel, Field
 from enum import Enum
+from typing import List
+
+from API_Layer.Interfaces.wallet_interface import BATCH_MAX_RECIPIENTS
 
 # --------------------------------------------------
 # Token Type Enum (Dropdown in Swagger UI)
@@ -15,4 +18,18 @@ class TokenType(str, Enum):
 # --------------------------------------------------
 class TokenActionRequest(BaseModel):
     tenant_id: int = Field(..., example=1)
-    amount: float = Field(..., gt=0, example=10)
\ No newline at end of file
+    amount: float = Field(..., gt=0, example=10)
+
+
+# --------------------------------------------------
+# Batch Mint Models
+# --------------------------------------------------
+class BatchRecipient(BaseModel):
+    address: str = Field(..., example="0x742d35Cc6634C0532925a3b844Bc955e2e75d30f")
+    amount: float = Field(..., gt=0, example=10)
+
+
+class BatchMintRequest(BaseModel):
+    tenant_id: int = Field(..., example=2)
+    token_type: TokenType
+    recipients: List[BatchRecipient] = Field(..., max_length=BATCH_MAX_RECIPIENTS)
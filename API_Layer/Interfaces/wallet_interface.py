@@ -1,6 +1,15 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import Optional, List
 import enum
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Addresses accepted in one bulk balance request
+BATCH_MAX_ADDRESSES = int(os.getenv("BALANCE_BATCH_MAX_ADDRESSES", 1000))
+# Recipients accepted in one batch faucet / batch mint request
+BATCH_MAX_RECIPIENTS = int(os.getenv("BATCH_MAX_RECIPIENTS", 10000))
 
 class WalletAddress(BaseModel):
     address: str
@@ -56,6 +65,18 @@ class BalResponse(BaseModel):
     stablecoins: list[StablecoinBalance]
     totalStablecoinValue: float
 
+class BatchBalanceRequest(BaseModel):
+    addresses: Optional[List[str]] = Field(None, max_length=BATCH_MAX_ADDRESSES)
+    tenant_id: Optional[int] = None
+
+class FaucetRecipient(BaseModel):
+    address: str
+    amount: float = Field(..., gt=0)
+
+class BatchFaucetRequest(BaseModel):
+    type: AssetType
+    recipients: List[FaucetRecipient] = Field(..., max_length=BATCH_MAX_RECIPIENTS)
+
 class SearchResponse(BaseModel):
     customer_id: str
     name: str
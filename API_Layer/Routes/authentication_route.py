@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from http import HTTPStatus
@@ -12,11 +13,16 @@ from ..Interfaces.authentication import (
     CreateUserResponse,
     CreateWalletResponse,
     UpdateUserRequest,
-    UpdateAdminRequest
+    UpdateAdminRequest,
+    UserSummary,
+    TenantSummary,
+    SetTenantAdminRequest,
+    TenantAdminResponse
 )
 
 from Business_Layer.authentication_service import AuthenticationService
 from DataAccess_Layer.utils.session import get_db 
+from DataAccess_Layer.utils.keyset import PAGE_DEFAULT_LIMIT, PAGE_MAX_LIMIT
 
 router = APIRouter()
 
@@ -28,7 +34,7 @@ async def create_user(
     db: Session = Depends(get_db)
 ):
     try:
-        service = AuthenticationService(db)
+        service = await run_in_threadpool(AuthenticationService, db)
         result = await run_in_threadpool(
             service.create_user,
             request.tenant_id,
@@ -57,8 +63,8 @@ async def create_wallet_for_user(
     db: Session = Depends(get_db)
 ):
     try:
-        service = AuthenticationService(db)
-        result = service.create_wallet_for_user(request)
+        service = await run_in_threadpool(AuthenticationService, db)
+        result = await run_in_threadpool(service.create_wallet_for_user, request)
         return CreateWalletResponse(
             wallet_address=result,
             message="Wallet created successfully"
@@ -77,7 +83,7 @@ async def login_user(
     db: Session = Depends(get_db)
 ):
     try:
-        service = AuthenticationService(db)
+        service = await run_in_threadpool(AuthenticationService, db)
         result = await run_in_threadpool(
             service.authenticate_user,
             request.mail,
@@ -92,3 +98,77 @@ async def login_user(
         )
 
 
+# ---------------- ADMIN LISTINGS ---------------- #
+#
+# Keyset-paginated: pass the X-Next-Cursor header of a response as
+# ?cursor= to fetch the next page; no header means the last page.
+
+@router.get("/admin/users", response_model=List[UserSummary])
+async def list_users(
+    response: Response,
+    tenant_id: Optional[int] = None,
+    limit: int = Query(PAGE_DEFAULT_LIMIT, ge=1, le=PAGE_MAX_LIMIT),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    try:
+        service = await run_in_threadpool(AuthenticationService, db)
+        users, next_cursor = await run_in_threadpool(
+            service.get_users, tenant_id, limit, cursor
+        )
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
+        return users
+    except HTTPException as he:
+        raise he
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=str(e)
+        )
+
+
+@router.get("/admin/tenants", response_model=List[TenantSummary])
+async def list_tenants(
+    response: Response,
+    limit: int = Query(PAGE_DEFAULT_LIMIT, ge=1, le=PAGE_MAX_LIMIT),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    try:
+        service = await run_in_threadpool(AuthenticationService, db)
+        tenants, next_cursor = await run_in_threadpool(
+            service.get_tenants, limit, cursor
+        )
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
+        return tenants
+    except HTTPException as he:
+        raise he
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=str(e)
+        )
+
+
+# ---------------- TENANT ADMIN ---------------- #
+
+@router.put("/admin/tenants/{tenant_id}/admin", response_model=TenantAdminResponse)
+async def set_tenant_admin(
+    tenant_id: int,
+    request: SetTenantAdminRequest,
+    db: Session = Depends(get_db)
+):
+    try:
+        service = await run_in_threadpool(AuthenticationService, db)
+        return await run_in_threadpool(
+            service.set_tenant_admin, tenant_id, request.customer_id
+        )
+    except HTTPException as he:
+        raise he
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=str(e)
+        )
@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from fastapi.concurrency import run_in_threadpool
 from Business_Layer.bank_detail_service import BankDetailService
 from DataAccess_Layer.utils.session import get_db
 from sqlalchemy.orm import Session
 from API_Layer.Interfaces.bank_detail_interface import (Userdetails, CreateUserRequest, CreateUserResponse, UpdateUserRequest, UpdateAdminRequest,
                                                         CreatePayeeRequest, CreatePayeeResponse, PayeeDetails)
+from DataAccess_Layer.utils.keyset import PAGE_DEFAULT_LIMIT, PAGE_MAX_LIMIT
 from http import HTTPStatus
 
 router = APIRouter()
@@ -17,7 +19,7 @@ async def get_user_details(
 ):
     try:
         print("customer_id in route:", customer_id)
-        service = BankDetailService(db)
+        service = await run_in_threadpool(BankDetailService, db)
 
         user = await run_in_threadpool(
             service.user_dao.get_user_by_customer_id, customer_id)
@@ -56,9 +58,9 @@ async def update_user_details(
     db: Session = Depends(get_db)
 ):
     try:
-        service = BankDetailService(db)
-        result = service.update_user_details(
-            customer_id, request)
+        service = await run_in_threadpool(BankDetailService, db)
+        result = await run_in_threadpool(
+            service.update_user_details, customer_id, request)
         return CreateUserResponse(
             customer_id=customer_id,
             message="User details updated successfully"
@@ -154,10 +156,19 @@ def create_payee(
             status_code=500,
             detail=str(e))
 @router.get("/payees/{customer_id}", response_model=list[PayeeDetails])
-def get_payees(customer_id: str, tenant_id: int, db: Session = Depends(get_db)):
+def get_payees(
+    customer_id: str,
+    tenant_id: int,
+    response: Response,
+    limit: int = Query(PAGE_DEFAULT_LIMIT, ge=1, le=PAGE_MAX_LIMIT),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor header of the previous page"),
+    db: Session = Depends(get_db)
+):
     try:
         service = BankDetailService(db)
-        payees = service.get_payees(customer_id, tenant_id)
+        payees, next_cursor = service.get_payees(customer_id, tenant_id, limit, cursor)
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
         return payees
     except HTTPException as he:
         raise he
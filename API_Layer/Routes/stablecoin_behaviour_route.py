@@ -1,10 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
-from API_Layer.Interfaces.stablecoin_behaviour_interface import TokenType, TokenActionRequest
+from API_Layer.Interfaces.stablecoin_behaviour_interface import TokenType, TokenActionRequest, BatchMintRequest
 from DataAccess_Layer.utils.session import get_db
 
 from Business_Layer.stablecoin_service import StableCoinService
+from Business_Layer.batch_job_service import get_job_status
 from pydantic import BaseModel, Field
 from enum import Enum
 
@@ -60,6 +61,45 @@ def mint_tokens(
         )
 
 
+@router.post("/mint:batch", status_code=202)
+def mint_tokens_batch(
+    request: BatchMintRequest,
+    db: Session = Depends(get_db),
+):
+    """Mint to many recipients in the background; returns a job to poll"""
+    try:
+        if request.tenant_id in [1]:
+            raise HTTPException(
+                status_code=403,
+                detail="Minting not allowed for this tenant"
+            )
+
+        service = StableCoinService(db)
+
+        return service.mint_tokens_batch(
+            token_symbol=request.token_type,
+            tenant_id=request.tenant_id,
+            recipients=request.recipients
+        )
+
+    except HTTPException:
+        raise
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=str(e)
+        )
+
+
+@router.get("/jobs/{job_id}")
+def batch_job_status(job_id: str):
+    job = get_job_status(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
 @router.post("/burn")
 def burn_tokens(
     token_type: TokenType,
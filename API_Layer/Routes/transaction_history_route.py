@@ -3,8 +3,8 @@ Transaction History Routes
 Endpoints for retrieving wallet transaction history from Tenderly
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Response
+from typing import List, Optional
 import logging
 
 # Import your models
@@ -23,6 +23,7 @@ router = APIRouter()
 
 @router.get("/transactions/{address}", response_model=List[TransactionHistoryResponse])
 def transaction_history(
+    response: Response,
     address: str = Path(
         ...,
         description="Ethereum wallet address (format: 0x...)",
@@ -39,6 +40,14 @@ def transaction_history(
         ge=0,
         description="Number of transactions to skip for pagination"
     ),
+    cursor: Optional[str] = Query(
+        None,
+        description=(
+            "Opaque cursor pagination: pass an empty value (?cursor=) for the "
+            "first page, then the X-Next-Cursor header of the previous response. "
+            "Overrides offset."
+        )
+    ),
     db: Session = Depends(get_db)
 ):
     """
@@ -54,7 +63,15 @@ def transaction_history(
         logger.info(f"Fetching transaction history for {address}")
         
         service = TransactionService(db)
-        result = service.transaction_history(address, limit=limit, offset=offset)
+
+        if cursor is not None:
+            result, next_cursor = service.transaction_history_page(
+                address, limit=limit, cursor=cursor
+            )
+            if next_cursor:
+                response.headers["X-Next-Cursor"] = next_cursor
+        else:
+            result = service.transaction_history(address, limit=limit, offset=offset)
         
         logger.info(f"Successfully retrieved {len(result)} transactions for {address}")
         return result
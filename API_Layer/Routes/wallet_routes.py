@@ -1,11 +1,17 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from Business_Layer.wallet_service import WalletService
+from Business_Layer.async_wallet_service import AsyncWalletService
+from Business_Layer.receipt_tracker import get_receipt_tracker
+from Business_Layer.batch_job_service import get_job_status
+from Business_Layer.search_service import SearchService, SEARCH_MAX_LIMIT
 from ..Interfaces.wallet_interface import (CreateWalletResponse, BalanceResponse, TransferRequest, 
                                            FaucetRequest, FaucetResponse, VerifyAddressResponse , FiatBalanceResponse, BalResponse, SearchResponse,
-                                           AssetType)
+                                           AssetType, BatchBalanceRequest, BatchFaucetRequest)
 from sqlalchemy.orm import Session
-from DataAccess_Layer.utils.session import get_db 
+from sqlalchemy.ext.asyncio import AsyncSession
+from DataAccess_Layer.utils.session import get_db, get_async_db
 
 router = APIRouter()
 
@@ -30,10 +36,10 @@ def create_wallet():
     )
 
 @router.get("/balance", response_model=BalResponse)
-def balance(wallet_address: str = Query(...), db: Session = Depends(get_db)):
+async def balance(wallet_address: str = Query(...), db: AsyncSession = Depends(get_async_db)):
     try:
-        service = WalletService(db)
-        result = service.check_balance(wallet_address)
+        service = AsyncWalletService(db)
+        result = await service.check_balance(wallet_address)
         return result
     except HTTPException as he:
         raise he
@@ -44,11 +50,33 @@ def balance(wallet_address: str = Query(...), db: Session = Depends(get_db)):
         }
 
 
+@router.post("/balances:batch")
+def batch_balances(request: BatchBalanceRequest, db: Session = Depends(get_db)):
+    """
+    Stream fiat + native + stablecoin balances for many wallets as NDJSON.
+    One line per address, emitted as each multicall chunk completes.
+    """
+    try:
+        service = WalletService(db)
+        lines = service.stream_wallet_balances(request.addresses, request.tenant_id)
+        return StreamingResponse(lines, media_type="application/x-ndjson")
+    except HTTPException as he:
+        raise he
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post("/free-tokens")
-def create_free_tokens(address: str, type: AssetType, amount: float = 0.0,db: Session = Depends(get_db)):
+def create_free_tokens(
+    address: str,
+    type: AssetType,
+    amount: float = 0.0,
+    wait: bool = Query(True, description="Block until mined; false returns PENDING and settles in the background"),
+    db: Session = Depends(get_db)
+):
     try:
         service = WalletService(db)
-        result = service.create_free_tokens(FaucetRequest(address=address, type=type, amount=amount))
+        result = service.create_free_tokens(FaucetRequest(address=address, type=type, amount=amount), wait=wait)
 
         return result
 
@@ -69,11 +97,35 @@ def create_free_tokens(address: str, type: AssetType, amount: float = 0.0,db: Se
 
 
 
+@router.post("/free-tokens:batch", status_code=202)
+def create_free_tokens_batch(request: BatchFaucetRequest, db: Session = Depends(get_db)):
+    """Faucet many wallets in the background; returns a job to poll"""
+    try:
+        service = WalletService(db)
+        return service.create_free_tokens_batch(request.type.value, request.recipients)
+    except HTTPException as he:
+        raise he
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/jobs/{job_id}")
+def batch_job_status(job_id: str):
+    job = get_job_status(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
 @router.post("/transfer")
-def transfer(request: TransferRequest, db: Session = Depends(get_db)):
+def transfer(
+    request: TransferRequest,
+    wait: bool = Query(True, description="Block until mined; false returns PENDING and settles in the background"),
+    db: Session = Depends(get_db)
+):
     try:
         service = WalletService(db)
-        result = service.transfer(request)
+        result = service.transfer(request, wait=wait)
         return result
     except HTTPException as he:
         raise he
@@ -83,6 +135,18 @@ def transfer(request: TransferRequest, db: Session = Depends(get_db)):
             "message": str(e)
         }
     
+@router.get("/tx/{tx_hash}")
+async def transaction_status(
+    tx_hash: str,
+    wait: int = Query(0, ge=0, le=60, description="Seconds to long-poll for a final status")
+):
+    """Status of a transaction submitted with wait=false (PENDING / CONFIRMED / FAILED / TIMEOUT)"""
+    status = await get_receipt_tracker().wait_for_status(tx_hash, timeout=wait)
+    if status is None:
+        raise HTTPException(status_code=404, detail="Transaction not tracked")
+    return status
+
+
 @router.post("/verify-address/{address}", response_model=VerifyAddressResponse)
 def verify_address(address: str):
     try:
@@ -109,9 +173,9 @@ async def get_fiat_balance_by_customer_id(
     tenant_id: int,
     db: Session = Depends(get_db)
 ):
-    service = WalletService(db)
-
     try:
+        # WalletService() connects to the RPC and Redis - keep it off the loop
+        service = await run_in_threadpool(WalletService, db)
         return await run_in_threadpool(
             service.get_fiat_balance_by_customer_id,
             customer_id,tenant_id
@@ -123,20 +187,32 @@ async def get_fiat_balance_by_customer_id(
 
 
 @router.get("/search-users", response_model=list[SearchResponse])
-def search_users(query: str, tenant_id: int, current_customer_id: str, db: Session = Depends(get_db)):
+def search_users(
+    query: str,
+    tenant_id: int,
+    current_customer_id: str,
+    limit: int = Query(None, ge=1, le=SEARCH_MAX_LIMIT),
+    db: Session = Depends(get_db)
+):
     try:
-        service = WalletService(db)
-        return service.search_users(query, tenant_id, current_customer_id)
+        service = SearchService(db)
+        return service.search_users(query, tenant_id, current_customer_id, limit)
     except HTTPException as he:
         raise he
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/search-payees", response_model=list[SearchResponse])
-def search_payees(customer_id: str, tenant_id: int, query: str, db: Session = Depends(get_db)):
+def search_payees(
+    customer_id: str,
+    tenant_id: int,
+    query: str,
+    limit: int = Query(None, ge=1, le=SEARCH_MAX_LIMIT),
+    db: Session = Depends(get_db)
+):
     try:
-        service = WalletService(db)
-        result = service.search_payees(customer_id, tenant_id, query)
+        service = SearchService(db)
+        result = service.search_payees(customer_id, tenant_id, query, limit)
         return result
     except HTTPException as he:
         raise he
@@ -0,0 +1,134 @@
+"""
+Async Wallet Service - Event-loop native read paths for the async routes
+
+Mirrors WalletService's read methods over AsyncWeb3, AsyncRedisClient and
+an AsyncSession, so balance reads never park a threadpool worker on RPC,
+Redis or MySQL I/O.
+"""
+
+import logging
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from API_Layer.Interfaces.wallet_interface import BalResponse
+from Business_Layer.balance_engine import AsyncBalanceEngine
+from Business_Layer.wallet_service import ERC20_ABI, USDC_ADDRESS, USDT_ADDRESS
+from DataAccess_Layer.dao.async_wallet_dao import AsyncWalletDAO
+from utils.redis_client import get_async_redis
+from utils.token_registry import TokenRegistry
+from utils.web3_client import get_async_web3
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncWalletService:
+
+    # (rpc_url, checksum address) -> AsyncContract
+    CONTRACT_CACHE = {}
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.dao = AsyncWalletDAO(db)
+        self.redis = get_async_redis()
+
+    @classmethod
+    def _get_contract(cls, web3, rpc_url, contract_address):
+        address = web3.to_checksum_address(contract_address)
+        key = (rpc_url, address)
+
+        if key not in cls.CONTRACT_CACHE:
+            cls.CONTRACT_CACHE[key] = web3.eth.contract(address=address, abi=ERC20_ABI)
+
+        return cls.CONTRACT_CACHE[key]
+
+    async def _balance_engine_for_tenant(self, tenant_id):
+        """Async counterpart of WalletService._balance_engine_for_tenant"""
+
+        # ======================================================
+        # CASE 1 — TENANT HAS NO CUSTOM TOKENS (DEFAULT TOKENS)
+        # ======================================================
+        if not await self.dao.tenant_has_tokens(tenant_id):
+
+            web3 = get_async_web3()
+            rpc_url = web3.provider.endpoint_uri
+
+            usdc, usdt = await TokenRegistry.aload(web3, [USDC_ADDRESS, USDT_ADDRESS])
+
+            tokens = [
+                {"symbol": symbol, "contract": self._get_contract(web3, rpc_url, address), "decimals": meta["decimals"]}
+                for symbol, address, meta in (("USDC", USDC_ADDRESS, usdc), ("USDT", USDT_ADDRESS, usdt))
+                if meta is not None  # unresolvable tokens are left out, not fatal
+            ]
+
+            return AsyncBalanceEngine(web3), tokens
+
+        # ======================================================
+        # CASE 2 — TENANT HAS CUSTOM TOKENS
+        # ======================================================
+        tenant = await self.dao.get_tenant_by_id(tenant_id)
+        web3 = get_async_web3(tenant.rpc_url)
+
+        token_configs = await self.dao.get_tokens_by_tenant(tenant_id)
+        metadata = await TokenRegistry.aload(
+            web3,
+            [token.contract_address for token in token_configs],
+            token_configs
+        )
+
+        tokens = [
+            {
+                "symbol": token.token_symbol,
+                "contract": self._get_contract(web3, tenant.rpc_url, token.contract_address),
+                "decimals": meta["decimals"]
+            }
+            for token, meta in zip(token_configs, metadata)
+            if meta is not None  # unresolvable tokens are left out, not fatal
+        ]
+
+        return AsyncBalanceEngine(web3), tokens
+
+    async def check_balance(self, address: str) -> BalResponse:
+        try:
+            web3 = get_async_web3()
+
+            if not web3.is_address(address):
+                raise HTTPException(status_code=400, detail="Invalid address")
+
+            address = web3.to_checksum_address(address)
+
+            # ================= CACHE READ =================
+            cached_balance = await self.redis.get_wallet_balance(address.lower())
+
+            if cached_balance:
+                logger.info(f"✅ Wallet balance served from cache for {address.lower()}")
+                return BalResponse(**cached_balance)
+
+            holder = await self.dao.get_wallet_holder(address)
+            tenant_id = holder.tenant_id if holder else None
+            fiat_total_balance = holder.fiat_bank_balance if holder else 0.0
+
+            engine, tokens = await self._balance_engine_for_tenant(tenant_id)
+
+            # Native ETH + every token balance in one awaited round trip
+            balances = await engine.get_balances(address, tokens)
+
+            stablecoin_balance = balances["tokens"]
+            total_stablecoin_value = sum(
+                token["balance"] for token in stablecoin_balance
+            )
+
+            response = BalResponse(
+                totalFiat=fiat_total_balance,
+                stablecoins=stablecoin_balance,
+                totalStablecoinValue=total_stablecoin_value
+            ).dict()
+
+            # ================= CACHE WRITE =================
+            await self.redis.set_wallet_balance(address.lower(), response, ttl=60)
+
+            return BalResponse(**response)
+
+        except HTTPException as he:
+            raise he
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
@@ -4,7 +4,9 @@ import re
 from fastapi import HTTPException, status
 from passlib.context import CryptContext
 from sqlalchemy.orm import Session
-from utils.web3_client import Web3Client
+from utils.web3_client import Web3Client, get_web3
+from utils.nonce_manager import NonceManager
+from utils.fee_oracle import FeeOracle
 import os
 from dotenv import load_dotenv
 # import bcrypt
@@ -15,6 +17,8 @@ from eth_account import Account
 from API_Layer.Interfaces.wallet_interface import FaucetRequest
 from web3 import Web3
 from DataAccess_Layer.dao.tenant_dao import TenantDAO
+from DataAccess_Layer.utils.keyset import PAGE_DEFAULT_LIMIT, PAGE_MAX_LIMIT
+from utils.cursor import encode_keyset_cursor, decode_keyset_cursor
 
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -191,7 +195,7 @@ class AuthenticationService:
             if request.tenant_id == 2:
                 amount = Decimal(str(0.01))
                 # Connect to tenant RPC
-                web3_rpc = Web3(Web3.HTTPProvider(rpc))
+                web3_rpc = get_web3(rpc)
 
                 # Get main wallet ETH balance
                 balance_wei = web3_rpc.eth.get_balance(main_wallet)
@@ -262,46 +266,92 @@ class AuthenticationService:
             )
 
         
-    def get_users(self):
-        return self.user_dao.get_all_users()
+    # ------------------ admin listings ------------------
+
+    def get_users(self, tenant_id=None, limit=PAGE_DEFAULT_LIMIT, cursor=None):
+        """One page of customers and the cursor of the next (None on the last)"""
+        scope = f"users:{tenant_id or ''}"
+        try:
+            after_id = decode_keyset_cursor(cursor, scope)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+        users, next_after = self.user_dao.get_users_page(
+            min(limit, PAGE_MAX_LIMIT), after_id, tenant_id
+        )
+        return users, encode_keyset_cursor(scope, next_after)
+
+    def get_tenants(self, limit=PAGE_DEFAULT_LIMIT, cursor=None):
+        """One page of active tenants and the cursor of the next"""
+        try:
+            after_id = decode_keyset_cursor(cursor, "tenants")
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+        tenants, next_after = self.tenant_dao.get_tenants_page(
+            min(limit, PAGE_MAX_LIMIT), after_id
+        )
+        return tenants, encode_keyset_cursor("tenants", next_after)
+
+    def set_tenant_admin(self, tenant_id, customer_id):
+        """Make one of the tenant's customers its admin (central fiat balance, main wallet)"""
+        user = self.user_dao.get_user_by_customer_id_tenant_id(customer_id, tenant_id)
+        if not user:
+            raise HTTPException(
+                status_code=404,
+                detail="Customer not found for this tenant"
+            )
+
+        if not self.tenant_dao.set_admin(tenant_id, user.id):
+            raise HTTPException(
+                status_code=404,
+                detail="Tenant not found"
+            )
+
+        return {
+            "tenant_id": tenant_id,
+            "customer_id": user.customer_id,
+            "wallet_address": user.wallet_address,
+            "message": "Tenant admin updated"
+        }
     
 
     def add_eth_wallet_creation(self, to_address, amount, main_wallet, rpc):
 
-        # Create Web3 instance using provided RPC
-        web3 = Web3(Web3.HTTPProvider(rpc))
+        # Shared Web3 for the provided RPC
+        web3 = get_web3(rpc)
         print("rpc:", rpc)
-
-        if not web3.is_connected():
-            raise Exception("RPC connection failed")
         
         print(main_wallet)
 
         # Get private key from DB
         private_key = self.wallet_dao.get_private_key_by_address(main_wallet)
 
-        # Nonce from RPC network
-        nonce = web3.eth.get_transaction_count(main_wallet, "pending")
-
-        tx = {
-            "from": main_wallet,
-            "to": Web3.to_checksum_address(to_address),
-            "value": web3.to_wei(amount, "ether"),
-            "nonce": nonce,
-            "chainId": web3.eth.chain_id,
-            "gasPrice": web3.eth.gas_price,
-            "gas": 21000
-        }
+        # Nonce reserved locally - concurrent wallet creations share this sender
+        nonces = NonceManager(web3, main_wallet)
 
-        signed_tx = web3.eth.account.sign_transaction(tx, private_key)
+        with nonces.reserve() as nonce:
 
-        raw_tx = (
-            signed_tx.raw_transaction
-            if hasattr(signed_tx, "raw_transaction")
-            else signed_tx.rawTransaction
-        )
+            tx = {
+                "from": main_wallet,
+                "to": Web3.to_checksum_address(to_address),
+                "value": web3.to_wei(amount, "ether"),
+                "nonce": nonce,
+                "chainId": nonces.chain_id,
+                "gasPrice": FeeOracle.for_web3(web3).gas_price(),
+                "gas": 21000
+            }
+
+            signed_tx = web3.eth.account.sign_transaction(tx, private_key)
+
+            raw_tx = (
+                signed_tx.raw_transaction
+                if hasattr(signed_tx, "raw_transaction")
+                else signed_tx.rawTransaction
+            )
+
+            tx_hash = nonces.send(raw_tx)
 
-        tx_hash = web3.eth.send_raw_transaction(raw_tx)
         print("Transaction sent with hash:", tx_hash.hex())
         return web3.to_hex(tx_hash)
 
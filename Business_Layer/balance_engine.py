@@ -0,0 +1,132 @@
+"""
+Balance Engine - Reads native + token balances in a single RPC round trip
+"""
+
+import os
+from decimal import Decimal
+import logging
+from dotenv import load_dotenv
+
+from utils.multicall import Multicall, AsyncMulticall
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Addresses per aggregate3 call and concurrent chunks for bulk reads
+BATCH_CHUNK_SIZE = int(os.getenv("BALANCE_BATCH_CHUNK_SIZE", 100))
+BATCH_MAX_WORKERS = int(os.getenv("BALANCE_BATCH_WORKERS", 8))
+
+
+class BalanceEngine:
+    """
+    Aggregates every balance read for an address (native balance plus each
+    token's balanceOf / decimals) into one Multicall3 aggregate3 call.
+    """
+
+    def __init__(self, web3):
+        self.web3 = web3
+        self.multicall = Multicall(web3)
+
+    def get_balances(self, address: str, tokens: list) -> dict:
+        """
+        Fetch native and token balances for one address
+
+        Args:
+            address: Checksummed wallet address
+            tokens: List of {"symbol", "contract", "decimals"} dicts; when
+                decimals is None it is read on-chain in the same round trip
+
+        Returns:
+            {"native": Decimal ETH, "tokens": [{"symbol", "balance"}]}
+            Tokens whose reads reverted are omitted.
+        """
+        return self.get_balances_many([address], tokens)[address]
+
+    def get_balances_many(self, addresses: list, tokens: list) -> dict:
+        """
+        Fetch balances for several addresses in one aggregate3 call
+
+        Unknown decimals are read once for the whole call, not per address.
+
+        Returns:
+            {address: {"native", "tokens"}} for every requested address
+        """
+        plan = self._plan(addresses, tokens)
+        results = self.multicall.aggregate(plan["calls"])
+        return self._collect(plan, results)
+
+    def _plan(self, addresses: list, tokens: list) -> dict:
+        calls = []
+        decimals_slots = {}
+
+        for token in tokens:
+            if token.get("decimals") is None:
+                decimals_slots[token["symbol"]] = len(calls)
+                calls.append(token["contract"].functions.decimals())
+
+        address_slots = []
+
+        for address in addresses:
+            native_index = len(calls)
+            calls.append(self.multicall.eth_balance(address))
+
+            balance_slots = []
+            for token in tokens:
+                balance_slots.append((token, len(calls)))
+                calls.append(token["contract"].functions.balanceOf(address))
+
+            address_slots.append((address, native_index, balance_slots))
+
+        return {
+            "calls": calls,
+            "decimals_slots": decimals_slots,
+            "address_slots": address_slots,
+        }
+
+    def _collect(self, plan: dict, results: list) -> dict:
+        decimals_slots = plan["decimals_slots"]
+        balances = {}
+
+        for address, native_index, balance_slots in plan["address_slots"]:
+            token_balances = []
+
+            for token, balance_index in balance_slots:
+                raw_balance = results[balance_index]
+                decimals = (
+                    results[decimals_slots[token["symbol"]]]
+                    if token["symbol"] in decimals_slots
+                    else token["decimals"]
+                )
+
+                if raw_balance is None or decimals is None:
+                    logger.warning(f"Balance read failed for {token['symbol']} ({address})")
+                    continue
+
+                token_balances.append({
+                    "symbol": token["symbol"],
+                    "balance": Decimal(raw_balance) / (Decimal(10) ** decimals)
+                })
+
+            balances[address] = {
+                "native": Decimal(self.web3.from_wei(results[native_index] or 0, "ether")),
+                "tokens": token_balances
+            }
+
+        return balances
+
+
+class AsyncBalanceEngine(BalanceEngine):
+    """BalanceEngine over AsyncWeb3 - the single aggregate3 call is awaited"""
+
+    def __init__(self, web3):
+        self.web3 = web3
+        self.multicall = AsyncMulticall(web3)
+
+    async def get_balances(self, address: str, tokens: list) -> dict:
+        return (await self.get_balances_many([address], tokens))[address]
+
+    async def get_balances_many(self, addresses: list, tokens: list) -> dict:
+        plan = self._plan(addresses, tokens)
+        results = await self.multicall.aggregate(plan["calls"])
+        return self._collect(plan, results)
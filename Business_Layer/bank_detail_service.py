@@ -5,6 +5,9 @@ import re
 
 from DataAccess_Layer.dao.authentication_dao import UserAuthDAO
 from utils.web3_client import Web3Client
+from Business_Layer.search_service import SEARCH_CACHE, PAYEES
+from DataAccess_Layer.utils.keyset import PAGE_DEFAULT_LIMIT, PAGE_MAX_LIMIT
+from utils.cursor import encode_keyset_cursor, decode_keyset_cursor
 
 
 
@@ -72,13 +75,12 @@ class BankDetailService:
             )
     def add_fiat_balance(self, tenant_id, customer_id, fiat_balance):
         try:
-            user = self.dao.get_user_by_customer_id_and_tenant_id(customer_id, tenant_id)
-            if not user:
+            new_balance = self.dao.add_fiat_balance(tenant_id, customer_id, fiat_balance)
+            if new_balance is None:
                 raise HTTPException(
                     status_code=HTTPStatus.NOT_FOUND,
                     detail="User not found"
                 )
-            new_balance = self.dao.add_fiat_balance(tenant_id, customer_id, fiat_balance)
             return new_balance
         except HTTPException as he:
             raise he
@@ -107,6 +109,7 @@ class BankDetailService:
                     detail="Payee with this wallet address already exists"
                 )
             payee_id = self.dao.create_payee(user.id, request)
+            SEARCH_CACHE.forget((PAYEES, tenant_id, str(customer_id)))
             return payee_id.id
         except HTTPException as he: 
             raise he
@@ -115,17 +118,28 @@ class BankDetailService:
                 status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
                 detail=str(e)
             )
-    def get_payees(self, customer_id, tenant_id):
+    def get_payees(self, customer_id, tenant_id, limit=PAGE_DEFAULT_LIMIT, cursor=None):
+        """One page of payees and the cursor of the next (None on the last)"""
         try:
+            scope = f"payees:{tenant_id}:{customer_id}"
+            try:
+                after_id = decode_keyset_cursor(cursor, scope)
+            except ValueError:
+                raise HTTPException(
+                    status_code=HTTPStatus.BAD_REQUEST,
+                    detail="Invalid cursor"
+                )
+
             user = self.dao.get_user_by_customer_id_and_tenant_id(customer_id, tenant_id)
             if not user:
                 raise HTTPException(
                     status_code=HTTPStatus.NOT_FOUND,
                     detail="User not found"
                 )
-            print("User found:", user.id)
-            payees = self.dao.get_payees(user.id)
-            return payees
+            payees, next_after = self.dao.get_payees(
+                user.id, min(limit, PAGE_MAX_LIMIT), after_id
+            )
+            return payees, encode_keyset_cursor(scope, next_after)
         except HTTPException as he:
             raise he
         except Exception as e:
@@ -148,6 +162,7 @@ class BankDetailService:
                     detail="Payee not found"
                 )
             self.dao.delete_payee(payee_id)
+            SEARCH_CACHE.forget((PAYEES, tenant_id, str(customer_id)))
             return {"message": "Payee deleted successfully"}
         except HTTPException as he:
             raise he
@@ -0,0 +1,396 @@
+"""
+Batch Job Service - Runs bulk mint / faucet sends as background jobs
+
+A job is a list of (address, amount) items pushed through a small pool of
+sender threads. Each thread owns its own resources (DB session, configured
+token service) for the whole run, nonces come from the NonceManager and
+fees / gas from the FeeOracle, so an item costs a single send round trip
+and no item waits for the previous one to be mined.
+
+Progress is published to Redis (namespace "batch_job") so any worker can
+answer the status endpoint. A job holding a fiat reservation also keeps a
+durable record of the part not yet sent ("batch_jobs"), heartbeated while
+the job lives; if its worker dies, the reconciler refunds that part.
+"""
+
+import os
+import time
+import uuid
+import threading
+from decimal import Decimal
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Callable, List, Dict, Any
+from dotenv import load_dotenv
+
+from utils.redis_client import RedisClient
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+BATCH_SEND_CONCURRENCY = int(os.getenv("BATCH_SEND_CONCURRENCY", 8))
+BATCH_MAX_ERRORS = 100  # per-item errors kept in the job status
+# A reservation record not heartbeated for this long belongs to a dead worker
+BATCH_JOB_STALE = int(os.getenv("BATCH_JOB_STALE", 300))
+# Finished jobs stay in memory this long; Redis keeps their status after
+BATCH_JOB_RETENTION = int(os.getenv("BATCH_JOB_RETENTION", 3600))
+
+JOB_RECORDS = "batch_jobs"
+
+JOB_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("BATCH_JOB_WORKERS", 2)),
+    thread_name_prefix="batch-job"
+)
+
+QUEUED = "QUEUED"
+RUNNING = "RUNNING"
+COMPLETED = "COMPLETED"
+FAILED = "FAILED"
+
+
+class BatchJob:
+    """Progress counters for one batch, safe to update from sender threads"""
+
+    def __init__(self, kind: str, total: int, meta: Optional[dict] = None, reservation: Optional[dict] = None):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.total = total
+        self.meta = meta or {}
+        self.reservation = reservation  # {"tenant_id", "rate"}: admin fiat held for the items
+
+        self.status = QUEUED
+        self.submitted = 0
+        self.failed = 0
+        self.confirmed = 0
+        self.reverted = 0
+        self.unsent = Decimal("0")  # item amounts not handed to the node yet
+        self.errors: List[Dict[str, Any]] = []
+        self.created_at = time.time()
+        self.finished_at = None
+
+        self._lock = threading.Lock()
+        self._published_at = 0.0
+        self._persisted = False
+        self._settled = False
+        self.redis = RedisClient()
+
+    # ---------------- PROGRESS ---------------- #
+
+    def claim_item(self, item: dict):
+        """
+        An item is about to be sent: its share leaves the reservation
+
+        Saved before the send, so a crash mid-send under-refunds rather
+        than refunding a mint that went out.
+        """
+        with self._lock:
+            self.unsent -= Decimal(str(item["amount"]))
+        self.save()
+
+    def record_submitted(self):
+        with self._lock:
+            self.submitted += 1
+        self.publish()
+
+    def record_failed(self, item: dict, error: str, claimed: bool = True):
+        with self._lock:
+            self.failed += 1
+            if claimed:
+                self.unsent += Decimal(str(item.get("amount", 0)))
+            if len(self.errors) < BATCH_MAX_ERRORS:
+                self.errors.append({"address": item["address"], "error": error})
+        self.save()
+        self.publish()
+
+    def record_final(self, succeeded: bool):
+        """Receipt outcome for a submitted item (called by the receipt tracker)"""
+        with self._lock:
+            if succeeded:
+                self.confirmed += 1
+            else:
+                self.reverted += 1
+        self.publish()
+
+    # ---------------- STATUS ---------------- #
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "job_id": self.id,
+                "kind": self.kind,
+                "status": self.status,
+                "total": self.total,
+                "submitted": self.submitted,
+                "failed": self.failed,
+                "confirmed": self.confirmed,
+                "reverted": self.reverted,
+                "errors": list(self.errors),
+                "created_at": self.created_at,
+                "finished_at": self.finished_at,
+                **self.meta,
+            }
+
+    def publish(self, force: bool = False):
+        # At most once a second while sending; always on state changes
+        now = time.monotonic()
+        if not force and now - self._published_at < 1:
+            return
+
+        self._published_at = now
+        self.redis.cache_set("batch_job", self.id, value=self.snapshot())
+
+    # ---------------- RESERVATION ---------------- #
+
+    def save(self):
+        """Persist the unsent part of the reservation (also the heartbeat)"""
+        if self.reservation is None:
+            return
+
+        with self._lock:
+            if self._settled:
+                return
+
+            saved = self.redis.put_record(JOB_RECORDS, self.id, {
+                "kind": self.kind,
+                "reservation": self.reservation,
+                "unsent": str(self.unsent),
+                "updated_at": time.time(),
+            })
+            self._persisted = self._persisted or saved
+
+    def release_reservation(self):
+        """Refund the part of the reservation that was never sent"""
+        if self.reservation is None:
+            return
+
+        with self._lock:
+            if self._settled:
+                return
+
+            if self._persisted:
+                claimed = self.redis.claim_record(JOB_RECORDS, self.id)
+
+                if claimed is None:
+                    # The record outlives this job and is reconciled once Redis is back
+                    logger.warning(f"⚠️ Batch job {self.id} refund left to reconciliation")
+                    return
+
+                if not claimed:
+                    self._settled = True
+                    return  # already reconciled elsewhere
+
+            self._settled = True
+            unsent = self.unsent
+
+        _refund(self.reservation, unsent)
+
+
+def _refund(reservation: dict, unsent: Decimal):
+    if unsent <= 0:
+        return
+
+    # wallet_service imports this module, so resolve it at call time
+    from Business_Layer.wallet_service import settle_fiat
+
+    settle_fiat({
+        "tenant_id": reservation["tenant_id"],
+        "admin_delta": str(unsent * Decimal(reservation["rate"]))
+    })
+
+
+# job_id -> BatchJob for jobs started by this worker, evicted
+# BATCH_JOB_RETENTION seconds after they finish
+JOBS: Dict[str, BatchJob] = {}
+
+
+def start_job(
+    kind: str,
+    items: List[dict],
+    sender_factory: Callable,
+    on_finish: Optional[Callable[[BatchJob], None]] = None,
+    rejected: Optional[List[dict]] = None,
+    meta: Optional[dict] = None,
+    reservation: Optional[dict] = None,
+) -> dict:
+    """
+    Queue a batch and return its initial status
+
+    Args:
+        kind: Label shown in the status (e.g. "MINT", "FAUCET")
+        items: [{"address", "amount"}] to send
+        sender_factory: Context manager factory yielding send(item, job) -> tx_hash;
+            entered once per sender thread so resources are reused across items
+        on_finish: Called after every item was attempted
+        rejected: [{"address", "error"}] that failed validation up front;
+            reported as failed but not part of the reservation
+        meta: Extra fields echoed in the status
+        reservation: {"tenant_id", "rate"} when the admin's fiat for all
+            items (amount x rate) was debited up front; the unsent part is
+            refunded when the job finishes, or reconciled if it never does
+    """
+    rejected = rejected or []
+    job = BatchJob(kind, len(items) + len(rejected), meta, reservation)
+    job.unsent = sum((Decimal(str(item["amount"])) for item in items), Decimal("0"))
+
+    for item in rejected:
+        job.failed += 1
+        if len(job.errors) < BATCH_MAX_ERRORS:
+            job.errors.append({"address": item["address"], "error": item["error"]})
+
+    _evict_finished()
+    JOBS[job.id] = job
+    job.save()
+    job.publish(force=True)
+    start_reconciler()
+
+    JOB_EXECUTOR.submit(_run_job, job, items, sender_factory, on_finish)
+
+    logger.info(f"🚀 Batch {kind} job {job.id} queued ({len(items)} items)")
+    return job.snapshot()
+
+
+def get_job_status(job_id: str) -> Optional[dict]:
+    job = JOBS.get(job_id)
+    if job is not None:
+        return job.snapshot()
+    return RedisClient().cache_get("batch_job", job_id)
+
+
+def _evict_finished():
+    cutoff = time.time() - BATCH_JOB_RETENTION
+    for job_id, job in list(JOBS.items()):
+        if job.finished_at is not None and job.finished_at < cutoff:
+            JOBS.pop(job_id, None)
+
+
+# ---------------- EXECUTION ---------------- #
+
+def _run_slice(job: BatchJob, items: List[dict], sender_factory: Callable):
+    attempted = 0
+
+    try:
+        with sender_factory() as send:
+            for item in items:
+                attempted += 1
+                job.claim_item(item)
+                try:
+                    send(item, job)
+                    job.record_submitted()
+                except Exception as e:
+                    job.record_failed(item, getattr(e, "detail", None) or str(e))
+    except Exception as e:
+        # Sender setup failed: the rest of this slice was never sent (nor claimed)
+        for item in items[attempted:]:
+            job.record_failed(item, f"Sender unavailable: {e}", claimed=False)
+
+
+def _run_job(job: BatchJob, items: List[dict], sender_factory: Callable, on_finish):
+    job.status = RUNNING
+    job.publish(force=True)
+
+    concurrency = max(1, min(BATCH_SEND_CONCURRENCY, len(items)))
+    slices = [items[i::concurrency] for i in range(concurrency)]
+
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=f"batch-{job.id[:8]}") as pool:
+            for batch in slices:
+                pool.submit(_run_slice, job, batch, sender_factory)
+
+        job.release_reservation()
+
+        if on_finish is not None:
+            on_finish(job)
+
+        job.status = COMPLETED
+
+    except Exception as e:
+        logger.error(f"❌ Batch job {job.id} failed: {e}")
+        job.status = FAILED
+
+    job.finished_at = time.time()
+    job.publish(force=True)
+
+    logger.info(
+        f"✅ Batch job {job.id} {job.status}: "
+        f"{job.submitted} submitted, {job.failed} failed of {job.total}"
+    )
+
+
+# ---------------- RECONCILIATION ---------------- #
+
+def reconcile_jobs() -> int:
+    """
+    Heartbeat this worker's live jobs, then refund reservations of jobs
+    whose worker stopped heartbeating (crashed or restarted mid-run)
+
+    Returns:
+        Number of jobs reconciled
+    """
+    for job in list(JOBS.values()):
+        if job.finished_at is None:
+            job.save()
+
+    _evict_finished()
+
+    redis = RedisClient()
+    records = redis.get_records(JOB_RECORDS)
+    if not records:
+        return 0
+
+    stale = time.time() - BATCH_JOB_STALE
+    reconciled = 0
+
+    for job_id, record in records.items():
+        if job_id in JOBS or record.get("updated_at", 0) > stale:
+            continue
+
+        # Deleting the record is the claim: one worker refunds it
+        if not redis.claim_record(JOB_RECORDS, job_id):
+            continue
+
+        try:
+            _refund(record["reservation"], Decimal(record["unsent"]))
+        except Exception as e:
+            logger.error(f"❌ Refund for interrupted batch job {job_id} failed: {e} ({record})")
+            continue
+
+        status = redis.cache_get("batch_job", job_id) or {"job_id": job_id, "kind": record.get("kind")}
+        status.update(status=FAILED, finished_at=time.time(), interrupted=True)
+        redis.cache_set("batch_job", job_id, value=status)
+
+        reconciled += 1
+        logger.warning(f"♻️ Batch job {job_id} was interrupted; refunded {record['unsent']} unsent")
+
+    return reconciled
+
+
+def _reconcile_loop():
+    while True:
+        try:
+            reconcile_jobs()
+        except Exception as e:
+            logger.error(f"Batch job reconciliation failed: {e}")
+        time.sleep(BATCH_JOB_STALE / 3)
+
+
+_reconciler = None
+_reconciler_lock = threading.Lock()
+
+
+def start_reconciler():
+    global _reconciler
+
+    if _reconciler and _reconciler.is_alive():
+        return
+
+    with _reconciler_lock:
+        if _reconciler and _reconciler.is_alive():
+            return
+
+        _reconciler = threading.Thread(
+            target=_reconcile_loop,
+            name="batch-job-reconciler",
+            daemon=True
+        )
+        _reconciler.start()
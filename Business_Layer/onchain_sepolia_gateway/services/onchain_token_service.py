@@ -2,12 +2,16 @@ import json
 from web3 import Web3
 from eth_account import Account
 from decimal import Decimal
+from utils.token_registry import TokenRegistry
+from utils.nonce_manager import NonceManager
+from utils.fee_oracle import FeeOracle
+from utils.web3_client import get_web3, WEB3_CACHE
 
 
 class OnchainTokenService:
 
     ABI_CACHE = None
-    WEB3_CACHE = {}
+    WEB3_CACHE = WEB3_CACHE  # process-wide registry in utils.web3_client
     CONTRACT_CACHE = {}
 
     def __init__(self):
@@ -18,43 +22,48 @@ class OnchainTokenService:
         self.contract = None
         self.chain_id = None
 
-    # ---------------- TENANT CONFIG ---------------- #
-
-    def configure(self, rpc_url, contract_address, private_key, chain_id=None):
+    # ---------------- SHARED CACHES ---------------- #
 
-        self.rpc_url = rpc_url
-        self.contract_address = Web3.to_checksum_address(contract_address)
-        self.private_key = private_key
-        self.chain_id = chain_id
+    @classmethod
+    def get_web3(cls, rpc_url):
+        return get_web3(rpc_url)
 
-        # -------- Web3 connection caching -------- #
-        if rpc_url not in OnchainTokenService.WEB3_CACHE:
-            web3 = Web3(Web3.HTTPProvider(rpc_url))
-            if not web3.is_connected():
-                raise Exception("Web3 connection failed")
-            OnchainTokenService.WEB3_CACHE[rpc_url] = web3
+    @classmethod
+    def get_contract(cls, rpc_url, contract_address):
 
-        self.web3 = OnchainTokenService.WEB3_CACHE[rpc_url]
+        web3 = cls.get_web3(rpc_url)
 
         # -------- ABI caching -------- #
-        if not OnchainTokenService.ABI_CACHE:
+        if not cls.ABI_CACHE:
             with open(
                 r"Business_Layer\onchain_sepolia_gateway\abi\pavescoin_abi.json"
             ) as f:
-                OnchainTokenService.ABI_CACHE = json.load(f)
+                cls.ABI_CACHE = json.load(f)
 
         # -------- Contract caching -------- #
         contract_key = f"{rpc_url}_{contract_address}"
 
-        if contract_key not in OnchainTokenService.CONTRACT_CACHE:
-            OnchainTokenService.CONTRACT_CACHE[contract_key] = (
-                self.web3.eth.contract(
-                    address=self.contract_address,
-                    abi=OnchainTokenService.ABI_CACHE
+        if contract_key not in cls.CONTRACT_CACHE:
+            cls.CONTRACT_CACHE[contract_key] = (
+                web3.eth.contract(
+                    address=Web3.to_checksum_address(contract_address),
+                    abi=cls.ABI_CACHE
                 )
             )
 
-        self.contract = OnchainTokenService.CONTRACT_CACHE[contract_key]
+        return cls.CONTRACT_CACHE[contract_key]
+
+    # ---------------- TENANT CONFIG ---------------- #
+
+    def configure(self, rpc_url, contract_address, private_key, chain_id=None):
+
+        self.rpc_url = rpc_url
+        self.contract_address = Web3.to_checksum_address(contract_address)
+        self.private_key = private_key
+        self.chain_id = chain_id
+
+        self.web3 = OnchainTokenService.get_web3(rpc_url)
+        self.contract = OnchainTokenService.get_contract(rpc_url, contract_address)
 
     def _ensure_configured(self):
         if not self.web3 or not self.contract:
@@ -62,8 +71,11 @@ class OnchainTokenService:
 
     # ---------------- DECIMAL HELPER ---------------- #
 
+    def _decimals(self):
+        return TokenRegistry.decimals(self.web3, self.contract_address)
+
     def _to_token_units(self, amount):
-        decimals = self.contract.functions.decimals().call()
+        decimals = self._decimals()
         return int(Decimal(str(amount)) * (Decimal(10) ** decimals))
 
     # ---------------- READ METHODS ---------------- #
@@ -78,30 +90,15 @@ class OnchainTokenService:
 
         address = Web3.to_checksum_address(address)
         raw_balance = self.contract.functions.balanceOf(address).call()
-        decimals = self.contract.functions.decimals().call()
+        decimals = self._decimals()
 
         return Decimal(raw_balance) / (Decimal(10) ** decimals)
 
     # ---------------- GAS OPTIMIZATION ---------------- #
 
     def _get_fee_params(self):
-        try:
-            latest_block = self.web3.eth.get_block("latest")
-
-            if "baseFeePerGas" in latest_block:
-                base_fee = latest_block["baseFeePerGas"]
-                priority_fee = self.web3.eth.max_priority_fee
-
-                return {
-                    "maxFeePerGas": int(
-                        Decimal(base_fee) * 2 + Decimal(priority_fee)
-                    ),
-                    "maxPriorityFeePerGas": int(priority_fee),
-                }
-        except Exception:
-            pass
-
-        return {"gasPrice": int(self.web3.eth.gas_price)}
+        # Refreshed once per block by the oracle, not per transaction
+        return FeeOracle.for_web3(self.web3).fee_params()
 
     # ---------------- TX BUILDER ---------------- #
 
@@ -111,34 +108,41 @@ class OnchainTokenService:
 
         account = Account.from_key(self.private_key)
 
-        nonce = self.web3.eth.get_transaction_count(
-            account.address,
-            "pending"
-        )
+        nonces = NonceManager(self.web3, account.address, self.chain_id)
 
-        gas_estimate = function_call.estimate_gas({
-            "from": account.address
-        })
+        fees = FeeOracle.for_web3(self.web3)
 
-        fee_params = self._get_fee_params()
+        with nonces.reserve() as nonce:
 
-        tx = function_call.build_transaction({
-            "from": account.address,
-            "nonce": nonce,
-            "gas": int(Decimal(gas_estimate) * Decimal("1.2")),
-            "chainId": self.chain_id or self.web3.eth.chain_id,
-            **fee_params
-        })
+            gas_limit = fees.estimate_gas({
+                "from": account.address,
+                "to": function_call.address,
+                "data": function_call._encode_transaction_data()
+            })
 
-        signed_tx = self.web3.eth.account.sign_transaction(
-            tx,
-            self.private_key
-        )
+            fee_params = self._get_fee_params()
+
+            tx = function_call.build_transaction({
+                "from": account.address,
+                "nonce": nonce,
+                "gas": gas_limit,
+                "chainId": nonces.chain_id,
+                **fee_params
+            })
+
+            signed_tx = self.web3.eth.account.sign_transaction(
+                tx,
+                self.private_key
+            )
 
-        raw_tx = getattr(signed_tx, "raw_transaction", None) \
-                 or getattr(signed_tx, "rawTransaction")
+            raw_tx = getattr(signed_tx, "raw_transaction", None) \
+                     or getattr(signed_tx, "rawTransaction")
 
-        tx_hash = self.web3.eth.send_raw_transaction(raw_tx)
+            try:
+                tx_hash = nonces.send(raw_tx)
+            except Exception:
+                fees.forget_gas_estimate(tx)  # e.g. a cached limit that is now too low
+                raise
 
         return tx_hash.hex()
 
@@ -1,15 +1,55 @@
 import os
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 from utils.redis_client import RedisClient
+from utils.cursor import encode_cursor, decode_cursor
+from utils.cache_codec import project_page
 from DataAccess_Layer.dao.token_dao import TokenDAO
 from DataAccess_Layer.dao.authentication_dao import UserAuthDAO
+from DataAccess_Layer.dao.tenant_dao import TenantDAO
 
 
 load_dotenv()
 
 ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
 
+ALCHEMY_TIMEOUT = float(os.getenv("ALCHEMY_TIMEOUT", 10))
+ALCHEMY_POOL_SIZE = int(os.getenv("ALCHEMY_POOL_SIZE", 20))
+
+DIRECTIONS = ("sent", "received")
+
+
+def _build_alchemy_session():
+    """Keep-alive session shared by every request; retries idempotent reads with backoff"""
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["POST"],  # alchemy_getAssetTransfers is a read
+    )
+    adapter = HTTPAdapter(
+        pool_connections=ALCHEMY_POOL_SIZE,
+        pool_maxsize=ALCHEMY_POOL_SIZE,
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
+
+
+ALCHEMY_SESSION = _build_alchemy_session()
+
+# Both directions of a page are fetched side by side
+ALCHEMY_EXECUTOR = ThreadPoolExecutor(
+    max_workers=ALCHEMY_POOL_SIZE,
+    thread_name_prefix="alchemy"
+)
+
+
 
 class SepoliaTransactionService:
 
@@ -21,6 +61,7 @@ class SepoliaTransactionService:
 
         self.redis = RedisClient()
         self.user_dao =  UserAuthDAO(db)
+        self.tenant_dao = TenantDAO(db)
 
     # ---------------------------------------------------------
     # Classify transaction type
@@ -47,143 +88,365 @@ class SepoliaTransactionService:
         return "UNKNOWN"
 
     # ---------------------------------------------------------
-    # Fetch transfers from Alchemy
+    # Fetch one direction's page from Alchemy
     # ---------------------------------------------------------
-    def _fetch_alchemy_page(self, wallet, contracts, page_key=None):
+    def _fetch_direction(self, wallet, contracts, direction, page_key, to_block=None):
 
-        base_params = {
+        params = {
             "fromBlock": "0x0",
-            "toBlock": "latest",
+            "toBlock": hex(to_block) if to_block is not None else "latest",
             "contractAddresses": contracts,
             "category": ["erc20"],
             "withMetadata": True,
             "maxCount": "0x32",
-            "pageKey": page_key,
+            "order": "desc",  # newest first, so the two streams can be merged
+            "fromAddress" if direction == "sent" else "toAddress": wallet,
         }
 
-        sent_body = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "alchemy_getAssetTransfers",
-            "params": [{**base_params, "fromAddress": wallet}],
-        }
+        if page_key:
+            params["pageKey"] = page_key
 
-        received_body = {
+        body = {
             "jsonrpc": "2.0",
-            "id": 2,
+            "id": 1 if direction == "sent" else 2,
             "method": "alchemy_getAssetTransfers",
-            "params": [{**base_params, "toAddress": wallet}],
+            "params": [params],
         }
 
-        sent_res = requests.post(self.alchemy_url, json=sent_body).json()
-        received_res = requests.post(self.alchemy_url, json=received_body).json()
+        response = ALCHEMY_SESSION.post(
+            self.alchemy_url,
+            json=body,
+            timeout=ALCHEMY_TIMEOUT
+        )
+        response.raise_for_status()
 
-        sent = sent_res.get("result", {})
-        received = received_res.get("result", {})
+        payload = response.json()
+        if "error" in payload:
+            raise RuntimeError(f"Alchemy error: {payload['error']}")
 
-        transfers = [
-            *(sent.get("transfers") or []),
-            *(received.get("transfers") or []),
-        ]
+        return payload.get("result", {})
 
-        unique = {tx["hash"]: tx for tx in transfers}.values()
+    # ---------------------------------------------------------
+    # Fetch pages from Alchemy (cached per direction + pageKey)
+    # ---------------------------------------------------------
+    def _fetch_pages(self, wallet, contracts, scope, cursors, to_block=None):
+        """
+        Fetch one page per requested direction, concurrently
+
+        Args:
+            scope: (tenant_id, chain_id) used to namespace the page cache
+            cursors: {direction: pageKey}; None fetches the newest page
+            to_block: Newest block to include, None for the chain head
+
+        Returns:
+            {direction: Alchemy result ({"transfers", "pageKey"})}
+        """
+        pages = {}
+        futures = {}
+
+        for direction, page_key in cursors.items():
+            cache_scope = (*scope, wallet, direction, "latest" if to_block is None else to_block, page_key or "head")
+            cached = self.redis.cache_get("alchemy_page", *cache_scope)
+
+            if cached is not None:
+                pages[direction] = cached
+            else:
+                futures[direction] = (
+                    cache_scope,
+                    ALCHEMY_EXECUTOR.submit(
+                        self._fetch_direction, wallet, contracts, direction, page_key, to_block
+                    ),
+                )
+
+        for direction, (cache_scope, future) in futures.items():
+            # Drop rawContract / metadata we never read before caching
+            pages[direction] = project_page(future.result())
+            self.redis.cache_set("alchemy_page", *cache_scope, value=pages[direction])
+
+        return pages
 
-        unique = sorted(
-            unique,
-            key=lambda x: int(x.get("blockNum", "0x0"), 16),
-            reverse=True,
+    # ---------------------------------------------------------
+    # K-way merge over the sent / received streams
+    # ---------------------------------------------------------
+    @staticmethod
+    def _block(tx):
+        return int(tx.get("blockNum", "0x0"), 16)
+
+    def _merge_transfers(self, wallet, contracts, scope, count, after=None):
+        """
+        Merge the two newest-first transfer streams by block number
+
+        Args:
+            after: (block, hashes) of the last block a previous page emitted
+                from; the streams are read with toBlock=block and those
+                hashes skipped, so transfers landing at the head meanwhile
+                can neither shift nor repeat what the caller already has
+
+        Returns:
+            (transfers, has_more)
+        """
+        to_block, emitted = after if after else (None, ())
+        emitted = set(emitted)
+
+        state = {direction: {"key": None, "pos": 0, "done": False} for direction in DIRECTIONS}
+
+        pages = self._fetch_pages(
+            wallet, contracts, scope, {d: None for d in DIRECTIONS}, to_block
         )
 
+        def head(direction):
+            transfers = pages[direction].get("transfers") or []
+            pos = state[direction]["pos"]
+            return transfers[pos] if pos < len(transfers) else None
+
+        merged = []
+        seen = set()
+
+        while len(merged) < count:
+
+            # Move exhausted buffers on to their next page
+            refill = {}
+            for direction in DIRECTIONS:
+                if state[direction]["done"] or head(direction) is not None:
+                    continue
+
+                next_key = pages[direction].get("pageKey")
+                if next_key:
+                    refill[direction] = next_key
+                else:
+                    state[direction]["done"] = True
+
+            if refill:
+                pages.update(self._fetch_pages(wallet, contracts, scope, refill, to_block))
+                for direction, page_key in refill.items():
+                    state[direction] = {"key": page_key, "pos": 0, "done": False}
+                continue
+
+            live = [
+                d for d in DIRECTIONS
+                if not state[d]["done"] and head(d) is not None
+            ]
+            if not live:
+                break
+
+            direction = max(live, key=lambda d: self._block(head(d)))
+            tx = head(direction)
+            state[direction]["pos"] += 1
+
+            # Self-transfers show up in both streams; the boundary block
+            # holds what the previous page already returned
+            if tx["hash"] in seen or (self._block(tx) == to_block and tx["hash"] in emitted):
+                continue
+
+            seen.add(tx["hash"])
+            merged.append(tx)
+
+        has_more = any(
+            not state[d]["done"]
+            and (head(d) is not None or pages[d].get("pageKey"))
+            for d in DIRECTIONS
+        )
+
+        return merged, has_more
+
+    @staticmethod
+    def decode_page_cursor(cursor, wallet_address):
+        """
+        (block, hashes) to resume after, None for the first page
+
+        Raises:
+            ValueError: If the cursor is malformed or for another wallet
+        """
+        if not cursor:
+            return None
+
+        decoded = decode_cursor(cursor)
+        block, hashes = decoded.get("b"), decoded.get("h")
+
+        if (
+            decoded.get("w") != wallet_address.lower()
+            or not isinstance(block, int)
+            or not isinstance(hashes, list)
+        ):
+            raise ValueError("Invalid cursor")
+
+        return block, hashes
+
+    def _next_cursor(self, wallet_address, transfers, after):
+        """Cursor on the last block emitted, with every hash emitted from it"""
+        last_block = self._block(transfers[-1])
+        hashes = [tx["hash"] for tx in transfers if self._block(tx) == last_block]
+
+        # A page that never left the previous boundary block keeps its hashes
+        if after and after[0] == last_block:
+            hashes = list(after[1]) + hashes
+
+        return encode_cursor({"w": wallet_address, "b": last_block, "h": hashes})
+
+    # ---------------------------------------------------------
+    # Normalise an Alchemy transfer once, before indexing
+    # ---------------------------------------------------------
+    def _normalize_transfer(self, tx):
+
         return {
-            "transfers": unique,
-            "pageKey": sent.get("pageKey") or received.get("pageKey"),
+            "tx_hash": tx.get("hash"),
+            "from_address": (tx.get("from") or "").lower(),
+            "to_address": (tx.get("to") or "").lower(),
+            "amount": tx.get("value"),
+            "asset": tx.get("asset"),
+            "timestamp": tx.get("metadata", {}).get("blockTimestamp"),
+            "status": "SUCCESS",
         }
 
     # ---------------------------------------------------------
-    # PUBLIC METHOD WITH REDIS CACHE
+    # Attach the viewer-dependent transaction type on read
     # ---------------------------------------------------------
-    def get_transactions(self, tenant_id, wallet_address, offset=0, limit=10):
+    def _present_transfer(self, record, wallet, main_wallet):
 
-        wallet_address = wallet_address.lower()
+        return {
+            **record,
+            "transaction_type": self._classify_tx(
+                {"from": record["from_address"], "to": record["to_address"]},
+                wallet,
+                main_wallet
+            ),
+        }
+
+    # ---------------------------------------------------------
+    # Tenant context shared by the read paths
+    # ---------------------------------------------------------
+    def _tenant_context(self, tenant_id):
 
         main_wallet = self.user_dao.get_main_wallet_address(tenant_id)
-        # ========= STEP 1: CACHE CHECK =========
-        cached_all_txs = self.redis.get_full_chain_transactions()
 
-        if cached_all_txs is not None:
-            print("✅ Using cached Alchemy transactions")
-            return self._filter_transactions_for_address(
-                cached_all_txs,
-                wallet_address,
-                offset,
-                limit
-            )
+        tenant = self.tenant_dao.get_tenant_by_id(tenant_id)
+        chain_id = tenant.chain_id if tenant else None
 
-        # ========= STEP 2: GET TOKEN CONTRACTS =========
-        tokens = self.token_dao.get_tokens_by_tenant(tenant_id)
-        contracts = [t.contract_address for t in tokens]
+        return main_wallet, (tenant_id, chain_id)
 
-        if not contracts:
-            return []
+    def _index_transfers(self, index_namespace, wallet_address, transfers):
 
-        # ========= STEP 3: FETCH FROM ALCHEMY =========
-        all_tx = []
-        page_key = None
+        records = []
+        entries = []
 
-        while len(all_tx) < offset + limit:
+        for tx in transfers:
+            record = self._normalize_transfer(tx)
+            records.append(record)
+            entries.append({
+                "tx_hash": record["tx_hash"],
+                "score": int(tx.get("blockNum", "0x0"), 16),
+                "record": record,
+                "addresses": [wallet_address],
+            })
 
-            result = self._fetch_alchemy_page(
-                wallet_address,
-                contracts,
-                page_key
-            )
+        indexed = self.redis.index_transactions(index_namespace, entries)
+        return records, indexed
 
-            all_tx.extend(result.get("transfers", []))
+    # ---------------------------------------------------------
+    # PUBLIC METHOD WITH PER-ADDRESS REDIS INDEX
+    # ---------------------------------------------------------
+    def get_transactions(self, tenant_id, wallet_address, offset=0, limit=10):
 
-            page_key = result.get("pageKey")
-            if not page_key:
-                break
+        wallet_address = wallet_address.lower()
+
+        main_wallet, scope = self._tenant_context(tenant_id)
+
+        # Index and coverage marker are scoped per tenant + chain
+        index_namespace = "sepolia:{}:{}".format(*scope)
+        meta_scope = (*scope, wallet_address)
+
+        # ========= STEP 1: INDEX COVERAGE CHECK =========
+        meta = self.redis.cache_get("tx_index_meta", *meta_scope)
+        covered = bool(meta) and (
+            meta["complete"] or meta["fetched"] >= offset + limit
+        )
 
-        # ========= STEP 4: FORMAT =========
         formatted = []
 
-        for tx in all_tx:
-            formatted.append({
-                "tx_hash": tx.get("hash"),
-                "from_address": tx.get("from"),
-                "to_address": tx.get("to"),
-                "amount": tx.get("value"),
-                "asset": tx.get("asset"),
-                "timestamp": tx.get("metadata", {}).get("blockTimestamp"),
-                "transaction_type": self._classify_tx(tx, wallet_address,main_wallet ),
-                "status": "SUCCESS",
-            })
+        if not covered:
 
-        # ========= STEP 5: CACHE FULL CHAIN =========
-        self.redis.set_full_chain_transactions(formatted, ttl=300)
+            # ========= STEP 2: GET TOKEN CONTRACTS =========
+            tokens = self.token_dao.get_tokens_by_tenant(tenant_id)
+            contracts = [t.contract_address for t in tokens]
+
+            if not contracts:
+                return []
+
+            # ========= STEP 3: MERGE FROM ALCHEMY =========
+            all_tx, has_more = self._merge_transfers(
+                wallet_address,
+                contracts,
+                scope,
+                offset + limit
+            )
 
-        # ========= STEP 6: RETURN PAGINATED =========
-        return self._filter_transactions_for_address(
-            formatted,
+            # ========= STEP 4: NORMALISE + INDEX FOR THIS WALLET =========
+            formatted, indexed = self._index_transfers(
+                index_namespace, wallet_address, all_tx
+            )
+
+            if indexed:
+                self.redis.cache_set(
+                    "tx_index_meta",
+                    *meta_scope,
+                    value={"fetched": len(all_tx), "complete": not has_more}
+                )
+
+        # ========= STEP 5: READ ONLY THE REQUESTED PAGE =========
+        page = self.redis.get_indexed_transactions(
+            index_namespace,
             wallet_address,
-            offset,
-            limit
+            offset=offset,
+            limit=limit
         )
 
+        if page is None:
+            # Redis unavailable: serve straight from what was just fetched
+            page = formatted[offset:offset + limit]
+
+        return [
+            self._present_transfer(record, wallet_address, main_wallet)
+            for record in page
+        ]
+
     # ---------------------------------------------------------
-    # Filter transactions for specific wallet
+    # PUBLIC CURSOR METHOD (NO OFFSET RE-WALK)
     # ---------------------------------------------------------
-    def _filter_transactions_for_address(
-        self,
-        all_transactions,
-        address,
-        offset,
-        limit
-    ):
-        filtered = [
-            tx for tx in all_transactions
-            if tx["from_address"].lower() == address
-            or tx["to_address"].lower() == address
-        ]
+    def get_transactions_page(self, tenant_id, wallet_address, after=None, limit=10):
+        """
+        Cursor-paginated history
+
+        Args:
+            after: Position from decode_page_cursor, None for the first page
+
+        Returns:
+            (transactions, next_cursor) - next_cursor is None on the last page
+        """
+        wallet_address = wallet_address.lower()
+
+        main_wallet, scope = self._tenant_context(tenant_id)
+
+        tokens = self.token_dao.get_tokens_by_tenant(tenant_id)
+        contracts = [t.contract_address for t in tokens]
+
+        if not contracts:
+            return [], None
+
+        transfers, has_more = self._merge_transfers(
+            wallet_address, contracts, scope, limit, after
+        )
+
+        # Keep the per-address index warm for offset readers too
+        records, _ = self._index_transfers(
+            "sepolia:{}:{}".format(*scope), wallet_address, transfers
+        )
+
+        next_cursor = (
+            self._next_cursor(wallet_address, transfers, after)
+            if has_more and transfers else None
+        )
 
-        return filtered[offset:offset + limit]
+        return [
+            self._present_transfer(record, wallet_address, main_wallet)
+            for record in records
+        ], next_cursor
@@ -0,0 +1,471 @@
+"""
+Receipt Tracker - Confirms submitted transactions off the request path
+
+Write endpoints can return a tx hash as soon as it is broadcast. The hash is
+handed to this tracker, whose background thread fetches receipts for every
+pending hash with one batched eth_getTransactionReceipt per RPC per tick,
+then runs the deferred settlement and cache invalidation for the request.
+
+Statuses are published to Redis (namespace "tx_status") so any worker can
+answer GET /wallet/tx/{hash}. Pending settlements are persisted as durable
+records ("pending_settlements"), so a restarted or surviving worker adopts
+the ones nobody finished; whoever claims the record settles it, once.
+"""
+
+import os
+import time
+import asyncio
+import threading
+import logging
+from collections import OrderedDict
+from typing import Optional, Callable, Iterable, Dict, Any
+from dotenv import load_dotenv
+
+from utils.redis_client import RedisClient, get_async_redis
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+RECEIPT_POLL_INTERVAL = float(os.getenv("RECEIPT_POLL_INTERVAL", 2))
+RECEIPT_TIMEOUT = int(os.getenv("RECEIPT_TIMEOUT", 600))
+# Timed-out hashes (and records left by other workers) are re-checked this often
+RECEIPT_RECHECK_INTERVAL = float(os.getenv("RECEIPT_RECHECK_INTERVAL", 60))
+# Final statuses kept in memory; older ones are still served from Redis
+RECEIPT_STATUS_MEMORY = int(os.getenv("RECEIPT_STATUS_MEMORY", 1000))
+
+PENDING_RECORDS = "pending_settlements"
+
+PENDING = "PENDING"
+CONFIRMED = "CONFIRMED"
+FAILED = "FAILED"
+TIMEOUT = "TIMEOUT"
+
+
+def normalise_hash(tx_hash: str) -> str:
+    """0x-prefixed lowercase hex (HexBytes.hex() drops the prefix on web3 7)"""
+    tx_hash = tx_hash.lower()
+    return tx_hash if tx_hash.startswith("0x") else f"0x{tx_hash}"
+
+
+class ReceiptTracker:
+    """Background receipt poller with deferred confirm / fail settlements"""
+
+    def __init__(self):
+        self.redis = RedisClient()
+
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._statuses: Dict[str, Dict[str, Any]] = {}  # pending / timed out
+        self._final: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+        self._next_adopt = 0.0
+
+    # ---------------- SUBMISSION ---------------- #
+
+    def track(
+        self,
+        tx_hash: str,
+        rpc_url: str,
+        settle_confirmed: Optional[dict] = None,
+        settle_failed: Optional[dict] = None,
+        on_final: Optional[Callable[[bool], None]] = None,
+        invalidate: Iterable[str] = (),
+        refresh_history: bool = True,
+        meta: Optional[dict] = None,
+    ) -> dict:
+        """
+        Start tracking a broadcast transaction
+
+        Args:
+            tx_hash: Hex hash returned by send_raw_transaction
+            rpc_url: RPC the transaction was sent to
+            settle_confirmed: settle_fiat payload to apply once the receipt
+                has status 1; the result is attached to the status as "settlement"
+            settle_failed: settle_fiat payload compensating a reverted or
+                dropped transaction
+            on_final: Observer told whether the transaction succeeded, after
+                the settlement ran (e.g. batch job progress); in-process only
+            invalidate: Wallet addresses whose balance cache to drop when final
+            refresh_history: Nudge the history indexer when final
+            meta: Extra fields echoed in the status (e.g. {"type": "Transfer"})
+
+        Returns:
+            The PENDING status record
+        """
+        tx_hash = normalise_hash(tx_hash)
+        meta = meta or {}
+
+        status = {"tx_hash": tx_hash, "status": PENDING, **meta}
+
+        record = {
+            "rpc_url": rpc_url,
+            "settle_confirmed": settle_confirmed,
+            "settle_failed": settle_failed,
+            "invalidate": [a.lower() for a in invalidate],
+            "refresh_history": refresh_history,
+            "submitted_at": time.time(),
+            "meta": meta,
+        }
+
+        # Durable before the caller returns, so a restart cannot lose the settlement
+        persisted = self.redis.put_record(PENDING_RECORDS, tx_hash, record)
+        if not persisted and (settle_confirmed or settle_failed):
+            logger.warning(f"⚠️ Settlement for {tx_hash} held in memory only (Redis unavailable)")
+
+        with self._lock:
+            self._pending[tx_hash] = {
+                **record,
+                "on_final": on_final,
+                "persisted": persisted,
+                "next_check": 0.0,
+            }
+
+        self._publish(status)
+        self.start()
+        self._wake.set()
+
+        return status
+
+    def _adopt(self) -> int:
+        """
+        Take over persisted settlements older than RECEIPT_TIMEOUT
+
+        Younger records still belong to the worker that submitted them;
+        once they are past the timeout, that worker is gone or is only
+        re-checking, so tracking them here as well is safe - the claim
+        in _finalise lets exactly one worker settle.
+        """
+        records = self.redis.get_records(PENDING_RECORDS)
+        if not records:
+            return 0
+
+        cutoff = time.time() - RECEIPT_TIMEOUT
+        adopted = 0
+
+        with self._lock:
+            for tx_hash, record in records.items():
+                if tx_hash in self._pending or record.get("submitted_at", 0) > cutoff:
+                    continue
+
+                self._pending[tx_hash] = {
+                    **record,
+                    "on_final": None,
+                    "persisted": True,
+                    "next_check": 0.0,
+                }
+                self._statuses[tx_hash] = {
+                    "tx_hash": tx_hash, "status": TIMEOUT, **(record.get("meta") or {})
+                }
+                adopted += 1
+
+        if adopted:
+            logger.info(f"♻️ Adopted {adopted} pending settlement(s)")
+
+        return adopted
+
+    # ---------------- STATUS ---------------- #
+
+    def _publish(self, status: dict):
+        tx_hash = status["tx_hash"]
+
+        with self._lock:
+            if status["status"] in (PENDING, TIMEOUT):
+                self._statuses[tx_hash] = status
+            else:
+                self._statuses.pop(tx_hash, None)
+                self._final[tx_hash] = status
+                self._final.move_to_end(tx_hash)
+                while len(self._final) > RECEIPT_STATUS_MEMORY:
+                    self._final.popitem(last=False)
+
+        self.redis.cache_set("tx_status", tx_hash, value=status)
+
+    def _local_status(self, tx_hash: str) -> Optional[dict]:
+        return self._statuses.get(tx_hash) or self._final.get(tx_hash)
+
+    def get_status(self, tx_hash: str) -> Optional[dict]:
+        tx_hash = normalise_hash(tx_hash)
+        local = self._local_status(tx_hash)
+        if local is not None:
+            return local
+        return self.redis.cache_get("tx_status", tx_hash)
+
+    async def wait_for_status(self, tx_hash: str, timeout: float = 0) -> Optional[dict]:
+        """
+        Long-poll for a final status without holding a worker thread
+
+        Returns as soon as the status is no longer PENDING, or after
+        timeout seconds with whatever is known (None if untracked).
+        """
+        tx_hash = normalise_hash(tx_hash)
+        redis = get_async_redis()
+        deadline = time.monotonic() + timeout
+
+        while True:
+            status = (
+                self._local_status(tx_hash)
+                or await redis.cache_get("tx_status", tx_hash)
+            )
+
+            if status and status["status"] != PENDING:
+                return status
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return status
+
+            await asyncio.sleep(min(RECEIPT_POLL_INTERVAL, remaining))
+
+    # ---------------- RECEIPTS ---------------- #
+
+    @staticmethod
+    def _web3_for(rpc_url):
+        from Business_Layer.onchain_sepolia_gateway.services.onchain_token_service import (
+            OnchainTokenService,
+        )
+        return OnchainTokenService.get_web3(rpc_url)
+
+    @staticmethod
+    def _as_int(value) -> int:
+        if isinstance(value, str):
+            return int(value, 16) if value.startswith("0x") else int(value)
+        return int(value)
+
+    def _fetch_receipts(self, rpc_url: str, hashes: list) -> Dict[str, Optional[dict]]:
+        """One eth_getTransactionReceipt batch for every hash on an RPC"""
+        web3 = self._web3_for(rpc_url)
+
+        make_batch_request = getattr(web3.provider, "make_batch_request", None)
+
+        if make_batch_request is not None:
+            try:
+                responses = make_batch_request([
+                    ("eth_getTransactionReceipt", [tx_hash]) for tx_hash in hashes
+                ])
+                if isinstance(responses, list):
+                    return {
+                        tx_hash: response.get("result")
+                        for tx_hash, response in zip(hashes, responses)
+                    }
+                logger.warning(f"Receipt batch rejected: {responses}")
+            except Exception as e:
+                logger.warning(f"Receipt batch failed, reading sequentially: {e}")
+
+        # web3 < 7 has no JSON-RPC batching
+        receipts = {}
+        for tx_hash in hashes:
+            try:
+                receipts[tx_hash] = web3.eth.get_transaction_receipt(tx_hash)
+            except Exception:
+                receipts[tx_hash] = None  # not mined yet
+
+        return receipts
+
+    def _is_dropped(self, rpc_url: str, tx_hash: str) -> bool:
+        """Whether the node no longer knows the transaction at all"""
+        from web3.exceptions import TransactionNotFound
+
+        try:
+            return self._web3_for(rpc_url).eth.get_transaction(tx_hash) is None
+        except TransactionNotFound:
+            return True
+        except Exception as e:
+            logger.warning(f"Could not look up {tx_hash}: {e}")
+            return False
+
+    def poll_once(self) -> int:
+        """
+        Check every pending hash that is due once
+
+        Returns:
+            Number of transactions finalised
+        """
+        now = time.time()
+
+        with self._lock:
+            by_rpc = {}
+            for tx_hash, entry in self._pending.items():
+                if entry["next_check"] <= now:
+                    by_rpc.setdefault(entry["rpc_url"], []).append(tx_hash)
+
+        finalised = 0
+
+        for rpc_url, hashes in by_rpc.items():
+            try:
+                receipts = self._fetch_receipts(rpc_url, hashes)
+            except Exception as e:
+                logger.error(f"Receipt poll failed for {rpc_url}: {e}")
+                continue
+
+            for tx_hash in hashes:
+                receipt = receipts.get(tx_hash)
+                entry = self._pending.get(tx_hash)
+                if entry is None:
+                    continue
+
+                if receipt:
+                    finalised += self._finalise(tx_hash, entry, receipt)
+                elif now - entry["submitted_at"] > RECEIPT_TIMEOUT:
+                    finalised += self._expire(tx_hash, entry)
+
+        return finalised
+
+    # ---------------- FINALISATION ---------------- #
+
+    @staticmethod
+    def _settle(payload: dict) -> dict:
+        # wallet_service imports this module, so resolve it at call time
+        from Business_Layer.wallet_service import settle_fiat
+        return settle_fiat(payload)
+
+    def _finalise(self, tx_hash: str, entry: dict, receipt) -> bool:
+        """
+        Settle a transaction that has a receipt (receipt=None: dropped)
+
+        Returns:
+            True if this worker settled it
+        """
+        succeeded = receipt is not None and self._as_int(receipt["status"]) == 1
+
+        if entry["persisted"]:
+            claimed = self.redis.claim_record(PENDING_RECORDS, tx_hash)
+
+            if claimed is None:
+                # Can't tell whether another worker settled it; retry next tick
+                return False
+
+            if not claimed:
+                # Another worker settled it; only the local observer is left
+                with self._lock:
+                    self._pending.pop(tx_hash, None)
+                    self._statuses.pop(tx_hash, None)
+                self._notify(tx_hash, entry, succeeded)
+                return False
+
+        status = dict(self._local_status(tx_hash) or {"tx_hash": tx_hash})
+        status["status"] = CONFIRMED if succeeded else FAILED
+
+        if receipt is None:
+            status["dropped"] = True
+        else:
+            status["block_number"] = self._as_int(receipt["blockNumber"])
+
+        payload = entry["settle_confirmed"] if succeeded else entry["settle_failed"]
+        if payload:
+            try:
+                status["settlement"] = self._settle(payload)
+            except Exception as e:
+                # The chain state is final either way; surface it for reconciliation
+                logger.error(f"❌ Settlement for {tx_hash} failed: {e}")
+                status["settlement_error"] = str(e)
+
+        self._notify(tx_hash, entry, succeeded)
+
+        self._close(tx_hash, entry, status)
+        logger.info(f"✅ {tx_hash} {status['status']} in block {status.get('block_number')}")
+        return True
+
+    @staticmethod
+    def _notify(tx_hash: str, entry: dict, succeeded: bool):
+        if entry["on_final"] is not None:
+            try:
+                entry["on_final"](succeeded)
+            except Exception as e:
+                logger.warning(f"on_final observer for {tx_hash} failed: {e}")
+
+    def _expire(self, tx_hash: str, entry: dict) -> bool:
+        """
+        Past RECEIPT_TIMEOUT: report TIMEOUT and keep re-checking
+
+        The transaction may still be mined, so nothing is settled until a
+        receipt shows up - unless the node has forgotten the transaction,
+        in which case it was dropped and settles as failed.
+        """
+        if self._is_dropped(entry["rpc_url"], tx_hash):
+            return self._finalise(tx_hash, entry, None)
+
+        entry["next_check"] = time.time() + RECEIPT_RECHECK_INTERVAL
+
+        if tx_hash in self._statuses and self._statuses[tx_hash]["status"] == TIMEOUT:
+            return False
+
+        status = dict(self._local_status(tx_hash) or {"tx_hash": tx_hash})
+        status["status"] = TIMEOUT
+        self._publish(status)
+
+        logger.error(
+            f"⏱️ No receipt for {tx_hash} after {RECEIPT_TIMEOUT}s, "
+            f"re-checking every {RECEIPT_RECHECK_INTERVAL}s"
+        )
+        return False
+
+    def _close(self, tx_hash: str, entry: dict, status: dict):
+        with self._lock:
+            self._pending.pop(tx_hash, None)
+
+        self._publish(status)
+
+        for address in entry["invalidate"]:
+            self.redis.invalidate_wallet_balance(address)
+
+        if entry["refresh_history"]:
+            try:
+                from Business_Layer.transaction_indexer import get_tenderly_indexer
+                get_tenderly_indexer().request_sync()
+            except Exception as e:
+                logger.warning(f"History refresh failed (non-critical): {e}")
+
+    # ---------------- BACKGROUND LOOP ---------------- #
+
+    def _run(self):
+        while True:
+            if time.time() >= self._next_adopt:
+                self._next_adopt = time.time() + RECEIPT_RECHECK_INTERVAL
+                try:
+                    self._adopt()
+                except Exception as e:
+                    logger.error(f"Pending settlement reload failed: {e}")
+
+            if self._pending:
+                try:
+                    self.poll_once()
+                except Exception as e:
+                    logger.error(f"Receipt tracker poll failed: {e}")
+
+            self._wake.wait(RECEIPT_POLL_INTERVAL)
+            self._wake.clear()
+
+    def start(self):
+        """Start the poller; its first tick reloads persisted settlements"""
+        if self._thread and self._thread.is_alive():
+            return
+
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+
+            self._thread = threading.Thread(
+                target=self._run,
+                name="receipt-tracker",
+                daemon=True
+            )
+            self._thread.start()
+
+        logger.info(f"🚀 Receipt tracker started (every {RECEIPT_POLL_INTERVAL}s)")
+
+
+_tracker: Optional[ReceiptTracker] = None
+_tracker_lock = threading.Lock()
+
+
+def get_receipt_tracker() -> ReceiptTracker:
+    global _tracker
+
+    if _tracker is None:
+        with _tracker_lock:
+            if _tracker is None:
+                _tracker = ReceiptTracker()
+
+    return _tracker
@@ -0,0 +1,263 @@
+"""
+Search Service - User and payee type-ahead for the wallet search endpoints
+
+Candidates come from index-anchored prefix lookups (SearchDAO); this layer
+validates the query, ranks and de-duplicates the rows and applies the
+result limit.
+
+The frontend searches on every keystroke, so each (tenant, user) keeps a
+short-lived cache of its recent candidate sets. "abc" is answered by
+filtering the rows cached for "ab" in memory, provided that set was
+complete (not cut off at the fetch limit) - typing a name costs one
+database query instead of one per character.
+"""
+
+import os
+import time
+import threading
+from collections import OrderedDict
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+from dotenv import load_dotenv
+
+from DataAccess_Layer.dao.search_dao import (
+    SearchDAO, user_query_kind, fulltext_words, user_matches, payee_matches
+)
+
+load_dotenv()
+
+SEARCH_RESULT_LIMIT = int(os.getenv("SEARCH_RESULT_LIMIT", 20))
+SEARCH_MAX_LIMIT = 50
+SEARCH_MAX_QUERY_LENGTH = 100
+
+# Rows fetched per candidate query; a set smaller than this is complete
+# and can answer every longer prefix without the database
+SEARCH_FETCH_LIMIT = max(int(os.getenv("SEARCH_FETCH_LIMIT", 100)), SEARCH_MAX_LIMIT)
+SEARCH_CACHE_TTL = float(os.getenv("SEARCH_CACHE_TTL", 30))
+SEARCH_CACHE_SESSIONS = int(os.getenv("SEARCH_CACHE_SESSIONS", 1000))
+SEARCH_CACHE_QUERIES = 8  # recent queries kept per session
+
+USERS = "users"
+PAYEES = "payees"
+
+
+def match_rank(query: str, *fields) -> int:
+    """0 exact, 1 field prefix, 2 word prefix, 3 anything else"""
+    best = 3
+    for field in fields:
+        value = (field or "").lower()
+        if value == query:
+            return 0
+        if value.startswith(query):
+            best = min(best, 1)
+        elif any(word.startswith(query) for word in value.split()):
+            best = min(best, 2)
+    return best
+
+
+def _user_query_covers(cached: str, query: str) -> bool:
+    """
+    Whether the complete result set of `cached` contains every match of
+    `query`. Both must take the same path in SearchDAO.search_users, and a
+    name query can't gain word matches its prefix never fetched.
+    """
+    if user_query_kind(cached) != user_query_kind(query):
+        return False
+    return bool(fulltext_words(cached)) or not fulltext_words(query)
+
+
+class SearchSessionCache:
+    """
+    LRU of search sessions, each holding its last few candidate sets
+
+    Entries are keyed by (kind, tenant_id, user) and hold
+    {query: (rows, complete, fetched_at)}. Queries are kept as typed, since
+    the DAO's strategy depends on them ("0x" is an address, "0X" a name).
+    Rows are the DAO's projected tuples, immutable and safe to share
+    across requests. A set narrowed from a prefix keeps the prefix's
+    fetched_at, so TTL bounds staleness from the database read.
+    """
+
+    def __init__(self, ttl: float = SEARCH_CACHE_TTL, max_sessions: int = SEARCH_CACHE_SESSIONS):
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, session: tuple, query: str, covers=None):
+        """
+        Candidate rows for `query` from the session, or None
+
+        An exact entry is used as-is; otherwise the longest fresh,
+        complete entry for a prefix of `query` (that `covers` accepts)
+        is narrowed with the caller's matcher.
+
+        Returns:
+            (rows, complete, exact, fetched_at) or None
+        """
+        now = time.monotonic()
+
+        with self._lock:
+            queries = self._sessions.get(session)
+            if queries is None:
+                self.misses += 1
+                return None
+            self._sessions.move_to_end(session)
+
+            best = None
+            for cached, (rows, complete, fetched_at) in list(queries.items()):
+                if now - fetched_at > self.ttl:
+                    del queries[cached]
+                    continue
+                if cached == query:
+                    self.hits += 1
+                    return rows, complete, True, fetched_at
+                if (
+                    complete
+                    and query.startswith(cached)
+                    and (covers is None or covers(cached, query))
+                    and (best is None or len(cached) > len(best[0]))
+                ):
+                    best = (cached, rows, fetched_at)
+
+            if best is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return best[1], True, False, best[2]
+
+    def store(self, session: tuple, query: str, rows: list, complete: bool, fetched_at: float = None):
+        if fetched_at is None:
+            fetched_at = time.monotonic()
+
+        with self._lock:
+            queries = self._sessions.setdefault(session, OrderedDict())
+            self._sessions.move_to_end(session)
+
+            queries[query] = (rows, complete, fetched_at)
+            queries.move_to_end(query)
+            while len(queries) > SEARCH_CACHE_QUERIES:
+                queries.popitem(last=False)
+
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+
+    def forget(self, session: tuple):
+        """Drop a session, e.g. after its payees changed"""
+        with self._lock:
+            self._sessions.pop(session, None)
+
+    def stats(self) -> dict:
+        return {"sessions": len(self._sessions), "hits": self.hits, "misses": self.misses}
+
+
+SEARCH_CACHE = SearchSessionCache()
+
+
+class SearchService:
+
+    def __init__(self, db: Session):
+        self.dao = SearchDAO(db)
+
+    @staticmethod
+    def _normalise(query: str, limit) -> tuple:
+        query = (query or "").strip()
+        if not query:
+            raise HTTPException(400, "Search query is required")
+        if len(query) > SEARCH_MAX_QUERY_LENGTH:
+            raise HTTPException(400, "Search query too long")
+
+        limit = min(max(1, limit or SEARCH_RESULT_LIMIT), SEARCH_MAX_LIMIT)
+        return query, limit
+
+    @staticmethod
+    def _rank(rows, query: str, key, fields, limit: int) -> list:
+        needle = query.lower()
+        unique = {}
+        for row in rows:
+            unique.setdefault(key(row), row)
+
+        ranked = sorted(
+            unique.values(),
+            key=lambda row: (match_rank(needle, *fields(row)), (fields(row)[0] or "").lower())
+        )
+        return ranked[:limit]
+
+    @staticmethod
+    def _candidates(session: tuple, query: str, fetch, matches, covers=None) -> list:
+        """Rows for `query`, from the session cache when a prefix allows"""
+        cached = SEARCH_CACHE.lookup(session, query, covers)
+
+        if cached is not None:
+            rows, complete, exact, fetched_at = cached
+            if exact:
+                return rows
+            rows = [row for row in rows if matches(row, query)]
+        else:
+            rows, fetched_at = fetch(SEARCH_FETCH_LIMIT), None
+            # Conservative: a strategy that hit the limit pushes the total there
+            complete = len(rows) < SEARCH_FETCH_LIMIT
+
+        SEARCH_CACHE.store(session, query, rows, complete, fetched_at)
+        return rows
+
+    # ---------------- USERS ---------------- #
+
+    def search_users(self, query: str, tenant_id: int, current_customer_id: str, limit: int = None):
+        query, limit = self._normalise(query, limit)
+
+        rows = self._candidates(
+            (USERS, tenant_id, current_customer_id), query,
+            fetch=lambda fetch_limit: self.dao.search_users(query, tenant_id, current_customer_id, fetch_limit),
+            matches=user_matches,
+            covers=_user_query_covers
+        )
+        users = self._rank(
+            rows, query,
+            key=lambda row: row.customer_id,
+            fields=lambda row: (row.name, row.phone_number, row.wallet_address),
+            limit=limit
+        )
+
+        if not users:
+            raise HTTPException(status_code=404, detail="No users found matching the query")
+
+        return [
+            {
+                "customer_id": user.customer_id,
+                "name": user.name,
+                "phone_number": user.phone_number,
+                "wallet_address": user.wallet_address,
+            }
+            for user in users
+        ]
+
+    # ---------------- PAYEES ---------------- #
+
+    def search_payees(self, customer_id: str, tenant_id: int, query: str, limit: int = None):
+        query, limit = self._normalise(query, limit)
+
+        rows = self._candidates(
+            (PAYEES, tenant_id, str(customer_id)), query,
+            fetch=lambda fetch_limit: self.dao.search_payees(customer_id, tenant_id, query, fetch_limit),
+            matches=payee_matches
+        )
+        payees = self._rank(
+            rows, query,
+            key=lambda row: row.wallet_address.lower(),
+            fields=lambda row: (row.payee_name, row.phone_number, row.wallet_address),
+            limit=limit
+        )
+
+        return [
+            {
+                "customer_id": str(customer_id),
+                "name": payee.payee_name,
+                "phone_number": payee.phone_number,
+                "wallet_address": payee.wallet_address
+            }
+            for payee in payees
+        ]
@@ -1,5 +1,7 @@
 from fastapi import HTTPException
 from decimal import Decimal
+from contextlib import contextmanager
+from web3 import Web3
 
 from DataAccess_Layer.dao.token_dao import TokenDAO
 from DataAccess_Layer.dao.tenant_dao import TenantDAO
@@ -11,6 +13,9 @@ from Business_Layer.onchain_sepolia_gateway.services.onchain_token_service impor
     OnchainTokenService
 )
 from Business_Layer.wallet_service import get_usd_to_inr_rate
+from Business_Layer.receipt_tracker import get_receipt_tracker
+from Business_Layer.batch_job_service import start_job
+from API_Layer.Interfaces.wallet_interface import BATCH_MAX_RECIPIENTS
 
 
 class StableCoinService:
@@ -57,14 +62,18 @@ class StableCoinService:
     # FIAT BALANCE CHECK (NO UPDATE)
     # ---------------------------------------------------
 
-    def _check_admin_fiat_balance(self, tenant_id, amount, token_symbol):
+    def _inr_rate(self, token_symbol, operation=None):
 
         if token_symbol.upper() in ["USDC", "USDT"]:
-            inr_rate = get_usd_to_inr_rate()
+            return get_usd_to_inr_rate(operation)
         elif token_symbol.upper() == "ETH":
-            inr_rate = Decimal("100")
-        else:
-            raise HTTPException(400, "Unsupported asset")
+            return Decimal("100")
+
+        raise HTTPException(400, "Unsupported asset")
+
+    def _check_admin_fiat_balance(self, tenant_id, amount, token_symbol, operation="mint"):
+
+        inr_rate = self._inr_rate(token_symbol, operation)
 
         total_inr = Decimal(amount) * Decimal(inr_rate)
         admin_details = self.auth_dao.get_admin_details(tenant_id)
@@ -78,16 +87,14 @@ class StableCoinService:
     # UPDATE FIAT BALANCE (AFTER TX SUCCESS)
     # ---------------------------------------------------
 
-    def _update_admin_fiat_balance(self, admin_details, total_inr, minting=True):
+    def _update_admin_fiat_balance(self, admin_details, total_inr, minting=True, guard=False):
 
-        if minting:
-            updated_balance = admin_details.fiat_bank_balance - total_inr
-        else:
-            updated_balance = admin_details.fiat_bank_balance + total_inr
+        delta = -total_inr if minting else total_inr
 
-        self.wallet_dao.update_fiat_bank_balance_by_wallet_address(
-            admin_details.wallet_address,
-            updated_balance
+        # Atomic delta; guard=True rejects an overdraft instead of applying it
+        return self.wallet_dao.apply_fiat_deltas(
+            wallet_deltas={admin_details.wallet_address: delta},
+            guard=guard
         )
 
     # ---------------------------------------------------
@@ -140,7 +147,7 @@ class StableCoinService:
 
         # Optional balance check (depends on business logic)
         total_inr, admin_details = self._check_admin_fiat_balance(
-            tenant_id, amount, token_symbol
+            tenant_id, amount, token_symbol, operation="burn"
         )
 
         token_service, token = self._configure_token_service(
@@ -173,3 +180,95 @@ class StableCoinService:
 
         except Exception as e:
             raise HTTPException(500, f"Burn failed: {str(e)}")
+
+    # ---------------------------------------------------
+    # BATCH MINT (AIRDROP)
+    # ---------------------------------------------------
+
+    def mint_tokens_batch(self, token_symbol, tenant_id, recipients):
+        """
+        Mint to many recipients as a background job
+
+        The rate is read and the admin's fiat validated once for the whole
+        batch, then reserved up front. Amounts that are never broadcast are
+        refunded when the job finishes (or by reconciliation if the worker
+        dies first); reverted mints as their receipts land.
+
+        Returns:
+            Initial job status; poll GET /stablecoin/jobs/{job_id}
+        """
+        if not recipients:
+            raise HTTPException(400, "No recipients")
+
+        if len(recipients) > BATCH_MAX_RECIPIENTS:
+            raise HTTPException(400, f"At most {BATCH_MAX_RECIPIENTS} recipients per batch")
+
+        items, rejected = [], []
+        for recipient in recipients:
+            if Web3.is_address(recipient.address):
+                items.append({
+                    "address": Web3.to_checksum_address(recipient.address),
+                    "amount": Decimal(str(recipient.amount))
+                })
+            else:
+                rejected.append({"address": recipient.address, "error": "Invalid address"})
+
+        if not items:
+            raise HTTPException(400, "No valid recipient addresses")
+
+        total_amount = sum(item["amount"] for item in items)
+
+        # Step 1: One rate lookup + fiat check for the whole batch
+        total_inr, admin_details = self._check_admin_fiat_balance(
+            tenant_id, total_amount, token_symbol
+        )
+        inr_rate = total_inr / total_amount
+
+        token_service, token = self._configure_token_service(
+            tenant_id, token_symbol
+        )
+
+        if not token.mint_enabled:
+            raise HTTPException(400, "Minting disabled for this token")
+
+        # Step 2: Reserve fiat before anything is minted
+        if not self._update_admin_fiat_balance(
+            admin_details,
+            total_inr,
+            minting=True,
+            guard=True
+        ):
+            raise HTTPException(400, "Admin has insufficient fiat balance")
+
+        tracker = get_receipt_tracker()
+
+        @contextmanager
+        def sender():
+            # The configured token service only holds the contract and key,
+            # so every sender thread can share it
+
+            def send(item, job):
+                tx_hash = token_service.mint(item["address"], item["amount"])
+                tracker.track(
+                    tx_hash,
+                    token_service.rpc_url,
+                    settle_failed={
+                        "tenant_id": tenant_id,
+                        "admin_delta": str(item["amount"] * inr_rate)
+                    },
+                    on_final=job.record_final,
+                    refresh_history=False,
+                    meta={"type": "Mint", "job_id": job.id}
+                )
+                return tx_hash
+
+            yield send
+
+        return start_job(
+            "MINT",
+            items,
+            sender,
+            rejected=rejected,
+            meta={"tenant_id": tenant_id, "token": token_symbol},
+            reservation={"tenant_id": tenant_id, "rate": str(inr_rate)}
+        )
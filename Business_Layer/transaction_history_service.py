@@ -4,7 +4,6 @@ NOW WITH REDIS CACHING
 """
 
 import os
-import requests
 from typing import Optional, List
 from datetime import datetime, timezone
 from dateutil.parser import isoparse
@@ -28,6 +27,7 @@ from API_Layer.Interfaces.transaction_history_interface import (
 from DataAccess_Layer.dao.wallet_dao import WalletDAO
 # Import Redis client
 from utils.redis_client import RedisClient
+from utils.cursor import encode_cursor, decode_cursor
 
 from DataAccess_Layer.utils.session import get_db 
 
@@ -72,10 +72,12 @@ class TransactionService:
         """
         Fetch transaction history for a given address
         
-        CACHING STRATEGY:
-        1. Try to get full chain transactions from Redis cache
-        2. If cache hit: Filter for this address and return
-        3. If cache miss: Fetch from Tenderly, cache, filter, return
+        INDEX STRATEGY (Tenderly tenant):
+        1. The background indexer appends new chain transactions to a
+           per-address index in Redis
+        2. A read fetches only this address's page from the index
+        3. The chain is fetched synchronously only once, to bootstrap an
+           empty index
         
         Args:
             address: Wallet address to get transactions for (0x...)
@@ -103,77 +105,45 @@ class TransactionService:
         logger.info(f"📋 Fetching transaction history for {address}")
 
         if tenant_id == 1:
-        
-            # ========== STEP 1: TRY CACHE ==========
-            
-            cached_all_txs = self.redis.get_full_chain_transactions()
-            
-            if cached_all_txs is not None:
-                logger.info("✅ Using cached chain transactions")
-                # Filter for this user and return
-                return self._filter_transactions_for_address(cached_all_txs, address)
-            
-            # ========== STEP 2: CACHE MISS - FETCH FROM TENDERLY ==========
-            
-            logger.info("❌ Cache miss - Fetching from Tenderly")
-            
-            # Build the API URL for Virtual TestNets
-            url = f"{self.base_url}/account/{self.tenderly_account}/project/{self.tenderly_project}/vnets/{self.network_id}/transactions"
-            
-            # Query parameters (address is ignored by Tenderly, but we keep it for clarity)
-            params = {
-                "address": address,  # Ignored by Tenderly
-                "limit": min(limit, 100),
-                "offset": offset,
-                "sort": "blockNumber",
-                "order": "desc"
-            }
-            
-            # Make request to Tenderly API
-            response = requests.get(
-                url,
-                headers=self.headers,
-                params=params,
-                timeout=10
+
+            from Business_Layer.transaction_indexer import (
+                get_tenderly_indexer,
+                INDEX_NAMESPACE,
             )
-            
-            # Check for HTTP errors
-            if response.status_code == 401:
+
+            indexer = get_tenderly_indexer()
+
+            # ========== STEP 1: BOOTSTRAP INDEX (FIRST READ ONLY) ==========
+
+            # Without Redis there is nothing to sync into
+            if not self.redis.is_connected():
                 raise HTTPException(
-                    status_code=401,
-                    detail="Unauthorized: Invalid Tenderly credentials"
+                    status_code=503,
+                    detail="Transaction index unavailable"
                 )
-            
-            if response.status_code == 404:
+
+            if not indexer.ensure_bootstrapped():
                 raise HTTPException(
-                    status_code=404,
-                    detail="Tenderly project or account not found"
+                    status_code=503,
+                    detail="Transaction index is still being built, retry shortly"
                 )
-            
-            if response.status_code != 200:
-                error_detail = response.json().get("error", "Unknown error")
+
+            # ========== STEP 2: READ ONE PAGE FOR THIS ADDRESS ==========
+
+            page = self.redis.get_indexed_transactions(
+                INDEX_NAMESPACE,
+                address,
+                offset=offset,
+                limit=min(limit, 100)
+            )
+
+            if page is None:
                 raise HTTPException(
-                    status_code=response.status_code,
-                    detail=f"Tenderly API error: {error_detail}"
+                    status_code=503,
+                    detail="Transaction index unavailable"
                 )
-            
-            # Parse response
-            response_data = response.json()
-            
-            if isinstance(response_data, list):
-                all_transactions = response_data
-            else:
-                all_transactions = response_data.get("transactions", [])
-            
-            logger.info(f"📦 Retrieved {len(all_transactions)} total chain transactions from Tenderly")
-            
-            # ========== STEP 3: CACHE THE FULL CHAIN DATA ==========
-            
-            self.redis.set_full_chain_transactions(all_transactions, ttl=300)  # 5 min cache
-            
-            # ========== STEP 4: FILTER FOR THIS USER ==========
-            
-            return self._filter_transactions_for_address(all_transactions, address)
+
+            return [self._present_transaction(record, address) for record in page]
         
         else:
             from .onchain_sepolia_gateway.services.transaction_history import SepoliaTransactionService
@@ -182,75 +152,131 @@ class TransactionService:
             return sepolia_service.get_transactions(tenant_id, address, offset=offset, limit=limit)
         
     
-    def _filter_transactions_for_address(self, all_transactions: list, address: str) -> list:
+    def transaction_history_page(
+        self,
+        address: str,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ):
         """
-        Filter full chain transactions for a specific address
+        Cursor-paginated transaction history
         
         Args:
-            all_transactions: All chain transactions from Tenderly
-            address: Address to filter for (lowercase)
+            address: Wallet address to get transactions for (0x...)
+            limit: Page size
+            cursor: Opaque token from the previous page, None/"" for the first
             
         Returns:
-            List of transactions relevant to this address
+            (transactions, next_cursor) - next_cursor is None on the last page
+            
+        Raises:
+            HTTPException: If the address or cursor is invalid
         """
-        result = []
+        if not address or not address.startswith("0x") or len(address) != 42:
+            raise HTTPException(
+                status_code=400,
+                detail="Invalid Ethereum address format. Must be 0x followed by 40 hex characters"
+            )
+
+        tenant_id = self.wallet_dao.get_tenant_id_by_address(address)
+        address = address.lower()
+
+        if tenant_id != 1:
+            from .onchain_sepolia_gateway.services.transaction_history import SepoliaTransactionService
+
+            try:
+                after = SepoliaTransactionService.decode_page_cursor(cursor, address)
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+
+            sepolia_service = SepoliaTransactionService(self.db)
+            return sepolia_service.get_transactions_page(
+                tenant_id, address, after=after, limit=limit
+            )
+
+        offset = 0
+        if cursor:
+            try:
+                state = decode_cursor(cursor)
+                if state.get("w") != address:
+                    raise ValueError("Invalid cursor")
+                offset = int(state["offset"])
+            except (ValueError, KeyError, TypeError):
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+
+        # Tenderly index reads are O(log N + page) at any depth
+        page = self.transaction_history(address, limit=limit, offset=offset)
+
+        next_cursor = (
+            encode_cursor({"w": address, "offset": offset + limit})
+            if len(page) == limit else None
+        )
+
+        return page, next_cursor
+
+    def _normalize_transaction(self, tx: dict) -> Optional[dict]:
+        """
+        Parse a raw Tenderly transaction into the stored history record
+
+        Runs once per transaction, at index time. The viewer-dependent
+        transaction_type is added on read by _present_transaction.
         
-        for tx in all_transactions:
-            my_dict = {}
-            from_address = tx.get("from", "").lower()
-            asset = self.parse_asset(tx)
-            
-            if asset == "USDC" or asset == "USDT":
-                to_address = self.parse_to_address(tx)
-            else:
-                to_address = tx.get("to", "").lower()
+        Args:
+            tx: Raw chain transaction from Tenderly
             
-            # Only include if this address is involved
-            if from_address == address or to_address == address:
-                
-                if tx.get('rpc_method') == "eth_sendRawTransaction" and asset == "ETH":
-                    my_dict['from_address'] = from_address
-                    my_dict['to_address'] = to_address
-                    my_dict['amount'] = self.parse_amount(tx)
-                    my_dict['asset'] = asset
-                    my_dict['status'] = self.parse_status(tx)
-                    my_dict['tx_hash'] = tx.get("tx_hash", "")
-                    my_dict['timestamp'] = self.utc_iso_to_local_str(tx.get("created_at", ""))
-                    my_dict['transaction_type'] = self._determine_transaction_type(
-                        tx, address, from_address, to_address
-                    )
-                    result.append(my_dict)
-                
-                elif tx.get('rpc_method') == "eth_sendRawTransaction" and (asset == "USDC" or asset == "USDT"):
-                    my_dict['from_address'] = from_address
-                    my_dict["to_address"] = to_address
-                    my_dict['amount'] = self.parse_usdc_amount(tx)
-                    my_dict['asset'] = asset
-                    my_dict['status'] = self.parse_status(tx)
-                    my_dict['tx_hash'] = tx.get("tx_hash", "")
-                    my_dict['timestamp'] = self.utc_iso_to_local_str(tx.get("created_at", ""))
-                    my_dict['transaction_type'] = self._determine_transaction_type(
-                        tx, address, from_address, to_address
-                    )
-                    result.append(my_dict)
+        Returns:
+            Normalised record, None for transactions that are not history
+            entries (non eth_sendRawTransaction RPC calls)
+        """
+        if tx.get("rpc_method") != "eth_sendRawTransaction":
+            return None
+
+        from_address = tx.get("from", "").lower()
+        asset = self.parse_asset(tx)
         
-        logger.info(f"🔍 Filtered to {len(result)} transactions for {address}")
-        return result
+        if asset == "USDC" or asset == "USDT":
+            to_address = self.parse_to_address(tx)
+            amount = self.parse_usdc_amount(tx)
+        else:
+            to_address = tx.get("to", "").lower()
+            amount = self.parse_amount(tx)
+
+        return {
+            "from_address": from_address,
+            "to_address": to_address,
+            "amount": amount,
+            "asset": asset,
+            "status": self.parse_status(tx).value,
+            "tx_hash": tx.get("tx_hash", ""),
+            "timestamp": self.utc_iso_to_local_str(tx.get("created_at", "")),
+        }
+
+    def _present_transaction(self, record: dict, address: str) -> dict:
+        """Attach the transaction type as seen from the requesting address"""
+        return {
+            **record,
+            "transaction_type": self._determine_transaction_type(
+                record, address, record["from_address"], record["to_address"]
+            ),
+        }
     
     # ========== CACHE INVALIDATION METHOD ==========
     
     def invalidate_transaction_cache(self):
         """
-        Invalidate the full chain transaction cache
+        Ask the indexer to pick up a newly sent transaction
         
         CALL THIS AFTER:
         - /free-tokens (faucet claim)
         - /transfer (user-to-user transfer)
         
-        This forces the next history request to fetch fresh data from Tenderly
+        The index is append-only, so nothing is thrown away; the indexer
+        just syncs blocks above its high-water mark ahead of its next tick.
         """
-        logger.info("🗑️  Invalidating transaction cache...")
-        self.redis.invalidate_full_chain_cache()
+        from Business_Layer.transaction_indexer import get_tenderly_indexer
+
+        logger.info("🔔 Requesting transaction index sync...")
+        get_tenderly_indexer().request_sync()
     
     # ========== PARSING HELPERS (UNCHANGED) ==========
     
@@ -0,0 +1,244 @@
+"""
+Transaction Indexer - Incrementally indexes Tenderly VNet transactions
+
+Tracks a high-water block number and pulls only transactions newer than it,
+appending them to the per-address index in Redis, so history reads never
+have to refetch the chain.
+"""
+
+import os
+import threading
+import logging
+import requests
+from typing import Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+INDEX_NAMESPACE = "tenderly:v2"  # v2: normalised records
+
+INDEXER_ENABLED = os.getenv("TX_INDEXER_ENABLED", "true").lower() == "true"
+INDEXER_INTERVAL = int(os.getenv("TX_INDEXER_INTERVAL", 15))
+INDEXER_PAGE_SIZE = 100
+INDEXER_MAX_PAGES = int(os.getenv("TX_INDEXER_MAX_PAGES", 50))
+# How long a history read waits for a bootstrap another thread is running
+INDEXER_BOOTSTRAP_WAIT = float(os.getenv("TX_INDEXER_BOOTSTRAP_WAIT", 30))
+
+
+class TenderlyTransactionIndexer:
+    """Background indexer for the Tenderly Virtual TestNet transactions endpoint"""
+
+    def __init__(self):
+        # Lazy import: TransactionService reads from this indexer
+        from Business_Layer.transaction_history_service import TransactionService
+
+        # Reuse the service's Tenderly config, Redis client and parsers
+        self.service = TransactionService()
+        self.redis = self.service.redis
+
+        self.url = (
+            f"{self.service.base_url}/account/{self.service.tenderly_account}"
+            f"/project/{self.service.tenderly_project}"
+            f"/vnets/{self.service.network_id}/transactions"
+        )
+
+        self._sync_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+
+    # ---------------- FETCH ---------------- #
+
+    def _fetch_page(self, offset: int) -> list:
+        response = requests.get(
+            self.url,
+            headers=self.service.headers,
+            params={
+                "limit": INDEXER_PAGE_SIZE,
+                "offset": offset,
+                "sort": "blockNumber",
+                "order": "desc"
+            },
+            timeout=10
+        )
+        response.raise_for_status()
+
+        data = response.json()
+        return data if isinstance(data, list) else data.get("transactions", [])
+
+    @staticmethod
+    def _block_number(tx) -> int:
+        value = tx.get("block_number", tx.get("blockNumber", 0)) or 0
+        if isinstance(value, str):
+            return int(value, 16) if value.startswith("0x") else int(value)
+        return int(value)
+
+    # ---------------- INDEX ---------------- #
+
+    def _index_entry(self, tx) -> Optional[dict]:
+        """Normalise a raw Tenderly transaction and map it to its participants"""
+        record = self.service._normalize_transaction(tx)
+        if not record or not record["tx_hash"]:
+            return None
+
+        return {
+            "tx_hash": record["tx_hash"],
+            "score": self._block_number(tx),
+            "record": record,
+            "addresses": {
+                a for a in (record["from_address"], record["to_address"]) if a
+            },
+        }
+
+    def sync(self) -> int:
+        """
+        Pull transactions newer than the high-water mark into the index
+
+        Pages newest-first and stops at the first page that reaches an
+        already-indexed block. Transactions in the high-water block itself
+        are re-read, which is harmless since index writes are idempotent.
+
+        A walk that runs out of pages (INDEXER_MAX_PAGES) before reaching
+        the old mark leaves the mark alone and stores where it stopped; the
+        next sync continues from there. Transactions arriving at the head
+        meanwhile only push older ones to higher offsets, so the resumed
+        walk can re-read but never skip.
+
+        Returns:
+            Number of transactions fetched
+        """
+        if not self._sync_lock.acquire(blocking=False):
+            return 0  # another sync is already catching up
+
+        try:
+            return self._sync()
+        finally:
+            self._sync_lock.release()
+
+    def _sync(self) -> int:
+        high_water = self.redis.get_index_high_water(INDEX_NAMESPACE)
+        resume = self.redis.get_index_resume(INDEX_NAMESPACE)
+
+        if resume:
+            floor, top, offset = resume["floor"], resume["top"], resume["offset"]
+        else:
+            floor = high_water if high_water is not None else -1
+            top, offset = None, 0
+
+        fresh = []
+        reached_floor = False
+        for _ in range(INDEXER_MAX_PAGES):
+            page = self._fetch_page(offset)
+            offset += INDEXER_PAGE_SIZE
+
+            new_txs = [tx for tx in page if self._block_number(tx) >= floor]
+            fresh.extend(new_txs)
+
+            if len(new_txs) < len(page) or len(page) < INDEXER_PAGE_SIZE:
+                reached_floor = True
+                break
+
+        if fresh:
+            entries = [e for e in map(self._index_entry, fresh) if e]
+            if not self.redis.index_transactions(INDEX_NAMESPACE, entries):
+                return 0  # nothing recorded; the next sync repeats this walk
+
+            newest = max(self._block_number(tx) for tx in fresh)
+            top = newest if top is None else max(top, newest)
+
+        if reached_floor:
+            if top is not None:
+                self.redis.set_index_high_water(INDEX_NAMESPACE, top)
+            elif high_water is None:
+                # Empty chain: mark bootstrapped so reads stop syncing inline
+                self.redis.set_index_high_water(INDEX_NAMESPACE, 0)
+            if resume:
+                self.redis.set_index_resume(INDEX_NAMESPACE, None)
+        else:
+            self.redis.set_index_resume(
+                INDEX_NAMESPACE, {"floor": floor, "top": top, "offset": offset}
+            )
+            self._wake.set()  # keep catching up without waiting a full interval
+            logger.info(f"⏩ Indexer paused at offset {offset}, resuming next sync")
+
+        if fresh:
+            logger.info(f"🔄 Indexer synced {len(fresh)} transactions (from block {floor})")
+        return len(fresh)
+
+    def is_bootstrapped(self) -> bool:
+        return (
+            self.redis.get_index_high_water(INDEX_NAMESPACE) is not None
+            or self.redis.get_index_resume(INDEX_NAMESPACE) is not None
+        )
+
+    def ensure_bootstrapped(self, timeout: float = INDEXER_BOOTSTRAP_WAIT) -> bool:
+        """
+        Run the first sync, or wait for the one already in flight
+
+        Returns:
+            Whether the index now holds a first walk
+        """
+        if self.is_bootstrapped():
+            return True
+
+        if not self._sync_lock.acquire(timeout=timeout):
+            return False
+
+        try:
+            if not self.is_bootstrapped():
+                logger.info("📚 Transaction index empty - running initial sync")
+                self._sync()
+        finally:
+            self._sync_lock.release()
+
+        return self.is_bootstrapped()
+
+    # ---------------- BACKGROUND LOOP ---------------- #
+
+    def _safe_sync(self):
+        try:
+            self.sync()
+        except Exception as e:
+            logger.error(f"Transaction indexer sync failed: {e}")
+
+    def _run(self):
+        while True:
+            self._safe_sync()
+            self._wake.wait(INDEXER_INTERVAL)
+            self._wake.clear()
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._thread = threading.Thread(
+            target=self._run,
+            name="tenderly-tx-indexer",
+            daemon=True
+        )
+        self._thread.start()
+        logger.info(f"🚀 Transaction indexer started (every {INDEXER_INTERVAL}s)")
+
+    def request_sync(self):
+        """Catch up soon after a write instead of waiting for the next tick"""
+        if self._thread and self._thread.is_alive():
+            self._wake.set()
+            return
+
+        threading.Thread(target=self._safe_sync, daemon=True).start()
+
+
+_indexer: Optional[TenderlyTransactionIndexer] = None
+_indexer_lock = threading.Lock()
+
+
+def get_tenderly_indexer() -> TenderlyTransactionIndexer:
+    global _indexer
+
+    if _indexer is None:
+        with _indexer_lock:
+            if _indexer is None:
+                _indexer = TenderlyTransactionIndexer()
+
+    return _indexer
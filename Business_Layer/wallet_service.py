@@ -4,22 +4,40 @@ from fastapi import HTTPException, status
 from DataAccess_Layer.utils.price import get_usd_to_inr_rate
 from utils.web3_client import Web3Client
 from storage.wallet_repository import WalletRepository
-from API_Layer.Interfaces.wallet_interface import BalanceResponse, SearchResponse, TransferRequest, BalResponse
+from API_Layer.Interfaces.wallet_interface import BalanceResponse, SearchResponse, TransferRequest, BalResponse, FaucetRequest, BATCH_MAX_ADDRESSES, BATCH_MAX_RECIPIENTS
 from dotenv import load_dotenv
 from DataAccess_Layer.dao.wallet_dao import WalletDAO
 from DataAccess_Layer.dao.tenant_dao import TenantDAO
 from DataAccess_Layer.dao.token_dao import TokenDAO
 from DataAccess_Layer.dao.authentication_dao import UserAuthDAO
 from Business_Layer.transaction_history_service import TransactionService
+from Business_Layer.balance_engine import BalanceEngine, BATCH_CHUNK_SIZE, BATCH_MAX_WORKERS
+from Business_Layer.receipt_tracker import get_receipt_tracker
+from Business_Layer.batch_job_service import start_job
+from Business_Layer.search_service import SearchService
+from DataAccess_Layer.utils.keyset import PAGE_DEFAULT_LIMIT, PAGE_MAX_LIMIT
+from utils.cursor import encode_keyset_cursor, decode_keyset_cursor
 import os
+import json
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from DataAccess_Layer.utils.session import get_db
+from DataAccess_Layer.utils.database import SessionLocal
 import logging
 from utils.redis_client import RedisClient
+from utils.token_registry import TokenRegistry
+from utils.nonce_manager import NonceManager
+from utils.fee_oracle import FeeOracle
 
 
 logger = logging.getLogger(__name__)
 
 load_dotenv()
+
+# Default stablecoins for tenants without their own TokenConfig rows
+USDC_ADDRESS = "0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48"
+USDT_ADDRESS = "0xdAC17F958D2ee523a2206206994597C13D831ec7"
+
 ERC20_ABI = [
     {
         "constant": True,
@@ -60,19 +78,64 @@ ERC20_ABI = [
 ]
 
 
+def settle_fiat(settlement: dict) -> dict:
+    """
+    Apply deferred fiat deltas once a tracked transaction is final
+
+    Runs on the receipt tracker thread, so it opens its own session.
+
+    Args:
+        settlement: {"tenant_id", "admin_delta"} and/or {"wallet", "wallet_delta"};
+            deltas are Decimal strings
+
+    Returns:
+        Resulting balances, echoed in the transaction status
+    """
+    db = SessionLocal()
+    try:
+        dao = WalletDAO(db)
+        result = {}
+
+        wallet_deltas = None
+        admin_deltas = None
+        old_balance = None
+
+        if settlement.get("wallet_delta"):
+            wallet_deltas = {settlement["wallet"]: Decimal(settlement["wallet_delta"])}
+            old_balance = dao.get_fiat_bank_balance_by_wallet_address(settlement["wallet"])
+
+        if settlement.get("admin_delta"):
+            admin_deltas = {settlement["tenant_id"]: Decimal(settlement["admin_delta"])}
+
+        # Customer and admin legs commit together; the transaction is
+        # already final on-chain, so no overdraft guard
+        if not dao.apply_fiat_deltas(wallet_deltas, admin_deltas, guard=False):
+            raise RuntimeError(f"Fiat settlement found no account: {settlement}")
+
+        if wallet_deltas:
+            result = {
+                "old_fiat_bank_balance": float(old_balance),
+                "new_fiat_bank_balance": float(
+                    Decimal(str(old_balance)) + Decimal(settlement["wallet_delta"])
+                )
+            }
+
+        return result
+    finally:
+        db.close()
+
+
 class WalletService:
     def __init__(self, db=None):
         self.web3 = Web3Client().w3
         self.repo = WalletRepository()
 
         self.usdc_contract = self.web3.eth.contract(
-            address=self.web3.to_checksum_address(
-                "0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48"
-            ),
+            address=self.web3.to_checksum_address(USDC_ADDRESS),
             abi=ERC20_ABI
         )
         self.usdt_contract = self.web3.eth.contract(
-            address=self.web3.to_checksum_address("0xdAC17F958D2ee523a2206206994597C13D831ec7"),
+            address=self.web3.to_checksum_address(USDT_ADDRESS),
             abi=ERC20_ABI)
         self.db = db
         self.dao = WalletDAO(self.db)
@@ -132,150 +195,272 @@ class WalletService:
 
             fiat_total_balance = self.dao.get_fiat_bank_balance_by_wallet_address(address)
 
-            # Native ETH balance (optional)
-            balance_wei = self.web3.eth.get_balance(address)
-            balance_eth = self.web3.from_wei(balance_wei, "ether")
-
             tenant_id = self.dao.get_tenant_id_by_address(address)
 
-            stablecoin_balance = []
-            total_stablecoin_value = 0
+            engine, tokens = self._balance_engine_for_tenant(tenant_id)
 
-            # ======================================================
-            # CASE 1 — TENANT HAS NO CUSTOM TOKENS (DEFAULT TOKENS)
-            # ======================================================
-            if not self.tenant_dao.tenant_has_tokens(tenant_id):
+            # Native ETH + every token balance in one round trip
+            balances = engine.get_balances(address, tokens)
 
-                default_tokens = [
-                    {"symbol": "USDC", "contract": self.usdc_contract},
-                    {"symbol": "USDT", "contract": self.usdt_contract},
-                    # {"symbol": "DAI", "contract": self.dai_contract},
-                ]
+            stablecoin_balance = balances["tokens"]
+            total_stablecoin_value = sum(
+                token["balance"] for token in stablecoin_balance
+            )
 
-                for token in default_tokens:
-                    try:
-                        decimals = token["contract"].functions.decimals().call()
-                        raw_balance = token["contract"].functions.balanceOf(address).call()
+            response = BalResponse(
+                totalFiat=fiat_total_balance,
+                stablecoins=stablecoin_balance,
+                totalStablecoinValue=total_stablecoin_value
+            ).dict()
 
-                        balance = raw_balance / (10 ** decimals)
+            # ================= CACHE WRITE =================
+            self.redis.set_wallet_balance(address.lower(), response, ttl=60)
 
-                        stablecoin_balance.append({
-                            "symbol": token["symbol"],
-                            "balance": balance
-                        })
+            return BalResponse(**response)
 
-                        total_stablecoin_value += balance
+        except HTTPException as he:
+            raise he
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
 
-                    except Exception:
-                        continue
+        
+    
+    def _balance_engine_for_tenant(self, tenant_id):
+        """
+        Resolve the RPC and token set a tenant's balances are read from
 
-            # ======================================================
-            # CASE 2 — TENANT HAS CUSTOM TOKENS
-            # ======================================================
-            else:
+        Returns:
+            (BalanceEngine, tokens) ready for get_balances / get_balances_many
+        """
 
-                from Business_Layer.onchain_sepolia_gateway.services.onchain_token_service import (
-                    OnchainTokenService,
+        # ======================================================
+        # CASE 1 — TENANT HAS NO CUSTOM TOKENS (DEFAULT TOKENS)
+        # ======================================================
+        if not self.tenant_dao.tenant_has_tokens(tenant_id):
+
+            usdc, usdt = TokenRegistry.load(
+                self.web3,
+                [self.usdc_contract.address, self.usdt_contract.address]
+            )
+
+            tokens = [
+                {"symbol": symbol, "contract": contract, "decimals": meta["decimals"]}
+                for symbol, contract, meta in (
+                    ("USDC", self.usdc_contract, usdc),
+                    ("USDT", self.usdt_contract, usdt),
+                    # ("DAI", self.dai_contract, dai),
                 )
+                if meta is not None  # unresolvable tokens are left out, not fatal
+            ]
 
-                tenant = self.tenant_dao.get_tenant_by_id(tenant_id)
+            return BalanceEngine(self.web3), tokens
 
-                tokens = self.token_dao.get_tokens_by_tenant(tenant_id)
+        # ======================================================
+        # CASE 2 — TENANT HAS CUSTOM TOKENS
+        # ======================================================
+        from Business_Layer.onchain_sepolia_gateway.services.onchain_token_service import (
+            OnchainTokenService,
+        )
 
-                for token in tokens:
-                    print(f"Checking balance for {token.token_symbol} at {token.contract_address}")
+        tenant = self.tenant_dao.get_tenant_by_id(tenant_id)
+        tenant_web3 = OnchainTokenService.get_web3(tenant.rpc_url)
 
-                    token_service = OnchainTokenService()
+        token_configs = self.token_dao.get_tokens_by_tenant(tenant_id)
+        metadata = TokenRegistry.load(
+            tenant_web3,
+            [token.contract_address for token in token_configs],
+            token_configs
+        )
 
-                    token_service.configure(
-                        tenant.rpc_url,
-                        token.contract_address,
-                        token.encrypted_private_key,
-                        tenant.chain_id
-                    )
+        tokens = [
+            {
+                "symbol": token.token_symbol,
+                "contract": OnchainTokenService.get_contract(
+                    tenant.rpc_url,
+                    token.contract_address
+                ),
+                "decimals": meta["decimals"]
+            }
+            for token, meta in zip(token_configs, metadata)
+            if meta is not None  # unresolvable tokens are left out, not fatal
+        ]
 
-                    decimals = token.decimals or 18
+        return BalanceEngine(tenant_web3), tokens
 
-                    balance = token_service.get_balance_with_decimals(
-                        address
-                    )
+    def _fetch_balances_concurrently(self, jobs):
+        """
+        Run (engine, tokens, addresses) jobs as multicall chunks on a bounded pool
 
-                    stablecoin_balance.append({
-                        "symbol": token.token_symbol,
-                        "balance": balance
-                    })
+        Yields:
+            (address, balances | None, error | None) as each chunk completes
+        """
+        chunks = [
+            (engine, tokens, addresses[i:i + BATCH_CHUNK_SIZE])
+            for engine, tokens, addresses in jobs
+            for i in range(0, len(addresses), BATCH_CHUNK_SIZE)
+        ]
 
-                    total_stablecoin_value += balance
+        if not chunks:
+            return
 
-            response = BalResponse(
-                totalFiat=fiat_total_balance,
-                stablecoins=stablecoin_balance,
-                totalStablecoinValue=total_stablecoin_value
-            ).dict()
+        with ThreadPoolExecutor(max_workers=min(BATCH_MAX_WORKERS, len(chunks))) as pool:
+            futures = {
+                pool.submit(engine.get_balances_many, chunk, tokens): chunk
+                for engine, tokens, chunk in chunks
+            }
 
-            # ================= CACHE WRITE =================
-            self.redis.set_wallet_balance(address.lower(), response, ttl=60)
+            for future in as_completed(futures):
+                try:
+                    balances = future.result()
+                except Exception as e:
+                    logger.error(f"Balance chunk failed: {e}")
+                    for address in futures[future]:
+                        yield address, None, str(e)
+                    continue
 
-            return BalResponse(**response)
+                for address, result in balances.items():
+                    yield address, result, None
 
-        except HTTPException as he:
-            raise he
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e))
+    def stream_wallet_balances(self, addresses=None, tenant_id=None):
+        """
+        Bulk fiat + native + stablecoin balances as NDJSON lines
 
-        
-    
-    def list_wallets(self):
+        All DB reads happen before this returns; the returned generator only
+        performs on-chain reads, so it is safe to stream after the request's
+        session is closed.
         """
-        List all wallets stored in wallets.json
+        if not addresses and tenant_id is None:
+            raise HTTPException(400, "Provide addresses or tenant_id")
+        if addresses and len(addresses) > BATCH_MAX_ADDRESSES:
+            raise HTTPException(400, f"At most {BATCH_MAX_ADDRESSES} addresses per request")
+
+        requested = []
+        invalid = []
+
+        for address in addresses or []:
+            if self.web3.is_address(address):
+                requested.append(self.web3.to_checksum_address(address))
+            else:
+                invalid.append(address)
+
+        holders = self.dao.get_wallet_holders(
+            addresses=requested if addresses else None,
+            tenant_id=tenant_id
+        )
+
+        by_address = {}
+        by_tenant = {}
+
+        for holder in holders:
+            address = self.web3.to_checksum_address(holder.wallet_address)
+            by_address[address] = holder
+            by_tenant.setdefault(holder.tenant_id, []).append(address)
+
+        unknown = [a for a in requested if a not in by_address]
+
+        jobs = []
+        for holder_tenant_id, tenant_addresses in by_tenant.items():
+            engine, tokens = self._balance_engine_for_tenant(holder_tenant_id)
+            jobs.append((engine, tokens, tenant_addresses))
+
+        def generate():
+            for address in invalid:
+                yield json.dumps({"address": address, "error": "Invalid address"}) + "\n"
+
+            for address in unknown:
+                yield json.dumps({"address": address, "error": "Wallet not found"}) + "\n"
+
+            for address, balances, error in self._fetch_balances_concurrently(jobs):
+                holder = by_address[address]
+                line = {
+                    "address": address,
+                    "customer_id": holder.customer_id,
+                    "tenant_id": holder.tenant_id,
+                    "totalFiat": float(holder.fiat_bank_balance or 0),
+                }
+
+                if error:
+                    line["error"] = error
+                else:
+                    line["nativeBalance"] = float(balances["native"])
+                    line["stablecoins"] = [
+                        {"symbol": t["symbol"], "balance": float(t["balance"])}
+                        for t in balances["tokens"]
+                    ]
+                    line["totalStablecoinValue"] = float(
+                        sum(t["balance"] for t in balances["tokens"])
+                    )
+
+                yield json.dumps(line) + "\n"
+
+        return generate()
+
+    def list_wallets(self, limit=PAGE_DEFAULT_LIMIT, cursor=None):
+        """
+        List one page of wallets with their ETH / USDC balances
         (private keys are NEVER exposed)
         """
         try:
-            users = self.dao.get_all_users()
-            wallets = [{"user_id": u.customer_id, "email": u.mail, "address": u.wallet_address} for u in users]
-            safe_wallets = []
+            try:
+                after_id = decode_keyset_cursor(cursor, "wallets")
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid cursor")
 
-            for w in wallets:
-                address = self.web3.to_checksum_address(w["address"])
+            users, next_after = self.dao.get_wallet_users_page(
+                min(limit, PAGE_MAX_LIMIT), after_id
+            )
+            wallets = {
+                self.web3.to_checksum_address(u.wallet_address): u
+                for u in users
+            }
 
-                # ETH balance
-                eth_balance_wei = self.web3.eth.get_balance(address)
-                eth_balance = float(
-                    self.web3.from_wei(eth_balance_wei, "ether")
-                )
+            engine = BalanceEngine(self.web3)
+            tokens = [{"symbol": "USDC", "contract": self.usdc_contract, "decimals": None}]
 
-                # USDC balance
-                try:
-                    usdc_raw = self.usdc_contract.functions.balanceOf(address).call()
-                    usdc_decimals = self.usdc_contract.functions.decimals().call()
-                    usdc_balance = usdc_raw / (10 ** usdc_decimals)
-                except Exception:
-                    usdc_balance = 0.0
+            safe_wallets = []
+
+            for address, balances, error in self._fetch_balances_concurrently(
+                [(engine, tokens, list(wallets))]
+            ):
+                user = wallets[address]
+                usdc_balance = 0.0
+                eth_balance = 0.0
+
+                if not error:
+                    eth_balance = float(balances["native"])
+                    usdc_balance = next(
+                        (float(t["balance"]) for t in balances["tokens"]), 0.0
+                    )
 
                 safe_wallets.append({
-                    "user_id": w["user_id"],
-                    "email": w["email"],
-                    "address": w["address"],
+                    "user_id": user.customer_id,
+                    "email": user.mail,
+                    "address": user.wallet_address,
                     "balance_eth": eth_balance,
-                    "balance_usdc": float(usdc_balance)
+                    "balance_usdc": usdc_balance
                 })
 
             return {
                 "total_wallets": len(safe_wallets),
-                "wallets": safe_wallets
+                "wallets": safe_wallets,
+                "next_cursor": encode_keyset_cursor("wallets", next_after)
             }
 
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
 
-    def create_free_tokens(self, request):
+    def create_free_tokens(self, request, wait: bool = True, on_final=None):
+        reservation = None  # (wallet, amount) debited but not yet delivered
         try:
             if not self.web3.is_address(request.address):
                 raise HTTPException(400, "Invalid address")
 
             to_address = self.web3.to_checksum_address(request.address)
 
-            tenant_id = self.dao.get_tenant_id_by_address(to_address)
+            context = self.dao.load_wallet_context(to_address)
+            tenant_id = context["customer"].tenant_id if context else None
 
             token_amount = Decimal(str(request.amount))
             token_type = request.type.upper()
@@ -284,7 +469,7 @@ class WalletService:
             # Fiat Conversion
             # -----------------------------
             if request.type.upper() in ["USDC", "USDT"]:
-                INR_RATE = get_usd_to_inr_rate()
+                INR_RATE = get_usd_to_inr_rate("faucet")
             elif request.type.upper() == "ETH":
                 INR_RATE = Decimal("100")
             else:
@@ -296,8 +481,12 @@ class WalletService:
                 to_address
             )
 
-            if cust_balance < token_inr_value:
+            # Reserve the fiat before sending: the guarded UPDATE rejects an
+            # overdraft even when faucets for this wallet run concurrently.
+            # Released again if the tokens are not delivered.
+            if not self.dao.apply_fiat_deltas(wallet_deltas={to_address: -token_inr_value}):
                 raise HTTPException(400, "Insufficient fiat balance")
+            reservation = (to_address, token_inr_value)
 
             # ======================================================
             # CASE 1 — TENANT HAS NO TOKENS (DEFAULT NETWORK TRANSFER)
@@ -310,62 +499,82 @@ class WalletService:
 
                 private_key = self.dao.get_private_key_by_address(from_address)
 
-                nonce = self.web3.eth.get_transaction_count(
-                    from_address,
-                    "pending"
-                )
+                fees = FeeOracle.for_web3(self.web3)
+                nonces = NonceManager(self.web3, from_address)
 
-                if token_type == "ETH":
+                with nonces.reserve() as nonce:
 
-                    tx = {
-                        "from": from_address,
-                        "to": to_address,
-                        "value": self.web3.to_wei(token_amount, "ether"),
-                        "nonce": nonce,
-                        "chainId": self.web3.eth.chain_id,
-                        "gasPrice": self.web3.eth.gas_price,
-                        "gas": 21000
-                    }
+                    if token_type == "ETH":
 
-                else:
-                    contract = (
-                        self.usdc_contract
-                        if token_type == "USDC"
-                        else self.usdt_contract
-                    )
+                        tx = {
+                            "from": from_address,
+                            "to": to_address,
+                            "value": self.web3.to_wei(token_amount, "ether"),
+                            "nonce": nonce,
+                            "chainId": nonces.chain_id,
+                            "gasPrice": fees.gas_price(),
+                            "gas": 21000
+                        }
 
-                    decimals = contract.functions.decimals().call()
-                    amount = int(token_amount * (10 ** decimals))
-
-                    tx = contract.functions.transfer(
-                        to_address,
-                        amount
-                    ).build_transaction({
-                        "from": from_address,
-                        "nonce": nonce,
-                        "chainId": self.web3.eth.chain_id,
-                        "gasPrice": self.web3.eth.gas_price,
-                    })
+                    else:
+                        contract = (
+                            self.usdc_contract
+                            if token_type == "USDC"
+                            else self.usdt_contract
+                        )
 
-                    tx["gas"] = self.web3.eth.estimate_gas(tx)
+                        decimals = TokenRegistry.decimals(self.web3, contract.address)
+                        amount = int(token_amount * (10 ** decimals))
 
-                signed_tx = self.web3.eth.account.sign_transaction(
-                    tx,
-                    private_key
-                )
+                        transfer_call = contract.functions.transfer(
+                            to_address,
+                            amount
+                        )
 
-                raw_tx = (
-                    signed_tx.raw_transaction
-                    if hasattr(signed_tx, "raw_transaction")
-                    else signed_tx.rawTransaction
-                )
+                        # One estimate (or none, if cached): passing "gas"
+                        # keeps build_transaction from estimating again
+                        tx = transfer_call.build_transaction({
+                            "from": from_address,
+                            "nonce": nonce,
+                            "chainId": nonces.chain_id,
+                            "gasPrice": fees.gas_price(),
+                            "gas": fees.estimate_gas({
+                                "from": from_address,
+                                "to": contract.address,
+                                "data": transfer_call._encode_transaction_data()
+                            }),
+                        })
 
-                tx_hash = self.web3.eth.send_raw_transaction(raw_tx)
+                    signed_tx = self.web3.eth.account.sign_transaction(
+                        tx,
+                        private_key
+                    )
 
-                receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
+                    raw_tx = (
+                        signed_tx.raw_transaction
+                        if hasattr(signed_tx, "raw_transaction")
+                        else signed_tx.rawTransaction
+                    )
 
-                if receipt.status != 1:
-                    raise HTTPException(400, "Transaction failed")
+                    tx_hash = nonces.send(raw_tx)
+
+                # Broadcast: from here only a confirmed revert refunds the customer
+                reservation = None
+
+                rpc_url = os.getenv("PUBLIC_TENDERLY_RPC_URL")
+
+                if wait:
+                    try:
+                        receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
+                    except Exception as e:
+                        # The transaction can still be mined; settle it when it is
+                        logger.warning(f"⏱️ No receipt yet for faucet {tx_hash.hex()}, tracking it: {e}")
+                        wait = False
+                    else:
+                        if receipt.status != 1:
+                            fees.forget_gas_estimate(tx)
+                            self._release_fiat((to_address, token_inr_value))
+                            raise HTTPException(400, "Transaction failed")
 
             # ======================================================
             # CASE 2 — TENANT HAS OWN TOKEN CONFIG
@@ -429,19 +638,38 @@ class WalletService:
                     to_address,
                     token_amount
                 )
+                reservation = None
 
             # ======================================================
             # Fiat Settlement
             # ======================================================
             new_balance = cust_balance - token_inr_value
 
-            self.dao.update_fiat_bank_balance_by_wallet_address(
-                to_address,
-                new_balance
-            )
+            if not wait:
+                # Customer already debited; the admin is credited on
+                # confirmation, the customer refunded on revert
+                self.redis.invalidate_wallet_balance(to_address.lower())
 
-            self.dao.update_admin_fiat_bank_balance(tenant_id,
-                token_inr_value
+                status = get_receipt_tracker().track(
+                    tx_hash if isinstance(tx_hash, str) else tx_hash.hex(),
+                    rpc_url,
+                    settle_confirmed={
+                        "tenant_id": tenant_id,
+                        "admin_delta": str(token_inr_value)
+                    },
+                    settle_failed={
+                        "wallet": to_address,
+                        "wallet_delta": str(token_inr_value)
+                    },
+                    on_final=on_final,
+                    invalidate=[to_address],
+                    meta={"type": "Faucet"}
+                )
+                return {**status, "new_fiat_bank_balance": float(new_balance)}
+
+            self.dao.apply_fiat_deltas(
+                admin_deltas={tenant_id: token_inr_value},
+                guard=False
             )
 
             # invalidate cache
@@ -462,21 +690,198 @@ class WalletService:
             }
 
         except HTTPException as he:
+            self._release_fiat(reservation)
             raise he
         except Exception as e:
+            self._release_fiat(reservation)
             raise HTTPException(500, detail=str(e))
 
+    def _release_fiat(self, reservation):
+        """Refund a faucet debit whose tokens were never delivered"""
+        if reservation is None:
+            return
+
+        wallet, amount = reservation
+        try:
+            self.dao.apply_fiat_deltas(wallet_deltas={wallet: amount}, guard=False)
+            self.redis.invalidate_wallet_balance(wallet.lower())
+        except Exception as e:
+            logger.error(f"❌ Fiat refund failed for {wallet} ({amount}): {e}")
+
+
+
+
+    def create_free_tokens_batch(self, asset_type, recipients):
+        """
+        Faucet many wallets as a background job
+
+        Recipients are validated against their fiat balance with one query
+        and one rate lookup; each accepted item then runs the regular faucet
+        flow in submit-then-track mode on a pooled sender thread.
+
+        Returns:
+            Initial job status; poll GET /wallet/jobs/{job_id}
+        """
+        if not recipients:
+            raise HTTPException(400, "No recipients")
+
+        if len(recipients) > BATCH_MAX_RECIPIENTS:
+            raise HTTPException(400, f"At most {BATCH_MAX_RECIPIENTS} recipients per batch")
+
+        token_type = asset_type.upper()
+        if token_type in ["USDC", "USDT"]:
+            inr_rate = get_usd_to_inr_rate("faucet")
+        elif token_type == "ETH":
+            inr_rate = Decimal("100")
+        else:
+            raise HTTPException(400, "Unsupported asset")
+
+        valid = [r for r in recipients if self.web3.is_address(r.address)]
+        holders = {
+            holder.wallet_address.lower(): holder
+            for holder in self.dao.get_wallet_holders(
+                [self.web3.to_checksum_address(r.address) for r in valid]
+            )
+        }
+
+        items, rejected = [], []
+        for recipient in recipients:
+            holder = holders.get(recipient.address.lower())
+            amount = Decimal(str(recipient.amount))
+
+            if not self.web3.is_address(recipient.address):
+                error = "Invalid address"
+            elif holder is None:
+                error = "Wallet not registered"
+            elif Decimal(str(holder.fiat_bank_balance or 0)) < amount * inr_rate:
+                error = "Insufficient fiat balance"
+            else:
+                items.append({"address": holder.wallet_address, "amount": amount})
+                continue
+
+            rejected.append({"address": recipient.address, "error": error})
+
+        @contextmanager
+        def sender():
+            # One session + service per sender thread for the whole run
+            db = SessionLocal()
+            try:
+                service = WalletService(db)
+
+                def send(item, job):
+                    result = service.create_free_tokens(
+                        FaucetRequest(address=item["address"], type=asset_type, amount=float(item["amount"])),
+                        wait=False,
+                        on_final=job.record_final
+                    )
+                    return result["tx_hash"]
+
+                yield send
+            finally:
+                db.close()
+
+        return start_job(
+            "FAUCET",
+            items,
+            sender,
+            rejected=rejected,
+            meta={"asset": token_type}
+        )
 
+    def _track_transfer(self, tx_hash, rpc_url, tenant_id, from_addr, to_addr, main_wallet, token_inr_value):
+        """
+        Hand a broadcast transfer to the receipt tracker
 
+        A burn's admin debit is already reserved: confirmation credits the
+        customer, a revert returns the reservation to the admin.
+        """
+        is_burn = to_addr.lower() == main_wallet.lower()
+
+        settle_confirmed = settle_failed = None
+        if is_burn:
+            settle_confirmed = {"wallet": from_addr, "wallet_delta": str(token_inr_value)}
+            settle_failed = {"tenant_id": tenant_id, "admin_delta": str(token_inr_value)}
+
+        return get_receipt_tracker().track(
+            tx_hash if isinstance(tx_hash, str) else tx_hash.hex(),
+            rpc_url,
+            settle_confirmed=settle_confirmed,
+            settle_failed=settle_failed,
+            invalidate=[from_addr, to_addr],
+            meta={"type": "Burn" if is_burn else "Transfer"}
+        )
 
-    def transfer(self, req: TransferRequest):
+    def _reserve_burn_fiat(self, tenant_id, token_inr_value):
+        """
+        Debit the admin's fiat for a burn before it is sent
+
+        The guarded UPDATE rejects an overdraft even when burns for the
+        tenant run concurrently. Returned to the admin if the burn fails.
+        """
+        if not self.dao.apply_fiat_deltas(admin_deltas={tenant_id: -token_inr_value}):
+            raise HTTPException(400, "Admin has insufficient fiat balance to burn tokens")
+        return (tenant_id, token_inr_value)
+
+    def _release_burn_fiat(self, reservation):
+        """Return a reserved admin debit whose burn never happened"""
+        if reservation is None:
+            return
+
+        tenant_id, amount = reservation
+        try:
+            self.dao.apply_fiat_deltas(admin_deltas={tenant_id: amount}, guard=False)
+        except Exception as e:
+            logger.error(f"❌ Admin fiat refund failed for tenant {tenant_id} ({amount}): {e}")
+
+    def _confirm_burn(self, web3, tx_hash, rpc_url, tenant_id, from_addr, to_addr, main_wallet, token_inr_value):
+        """
+        Wait for a broadcast burn, then credit the customer
+
+        A revert returns the admin's reserved debit; without a receipt the
+        burn is handed to the receipt tracker, which settles it either way.
+        """
+        try:
+            receipt = web3.eth.wait_for_transaction_receipt(tx_hash)
+        except Exception as e:
+            logger.warning(f"⏱️ No receipt yet for burn {tx_hash}, tracking it: {e}")
+            return self._track_transfer(
+                tx_hash, rpc_url, tenant_id, from_addr, to_addr, main_wallet, token_inr_value
+            )
+
+        if receipt.status != 1:
+            self._release_burn_fiat((tenant_id, token_inr_value))
+            raise HTTPException(400, "Transaction failed on-chain")
+
+        cust_balance = self.dao.get_fiat_bank_balance_by_wallet_address(from_addr)
+
+        self.dao.apply_fiat_deltas(
+            wallet_deltas={from_addr: token_inr_value},
+            guard=False
+        )
+
+        self.redis.invalidate_wallet_balance(from_addr.lower())
+        self.redis.invalidate_wallet_balance(to_addr.lower())
+
+        return {
+            "tx_hash": tx_hash if isinstance(tx_hash, str) else tx_hash.hex(),
+            "status": "confirmed",
+            "type": "Burn",
+            "old_fiat_bank_balance": cust_balance,
+            "new_fiat_bank_balance": float(cust_balance) + float(token_inr_value)
+        }
+
+    def transfer(self, req: TransferRequest, wait: bool = True):
+        reservation = None  # (tenant_id, amount) admin fiat debited for a burn not yet sent
         try:
             if not self.web3.is_address(req.from_address):
                 raise HTTPException(400, "Invalid address")
 
             address = self.web3.to_checksum_address(req.from_address)
 
-            tenant_id = self.dao.get_tenant_id_by_address(address)
+            # One joined query for customer + tenant + tokens; the DAO
+            # lookups below are served from the session's identity cache
+            context = self.dao.load_wallet_context(address)
+            tenant_id = context["customer"].tenant_id if context else None
             
             asset = req.asset.upper()
             
@@ -497,18 +902,6 @@ class WalletService:
             if req.from_address.lower() == os.getenv("MAIN_WALLET_ADDRESS").lower():
                 raise HTTPException(400, "Sender cannot be the main wallet, If you to get tokens using another api '/free-tokens'")
             
-            if req.to_address.lower() == os.getenv("MAIN_WALLET_ADDRESS").lower():
-                admin_balance = self.dao.get_fiat_bank_balance_by_wallet_address(
-                    os.getenv("MAIN_WALLET_ADDRESS")
-                )
-                INR_RATE = get_usd_to_inr_rate()
-                print("inr rate", INR_RATE)
-                token_inr_value = Decimal(str(req.amount)) * INR_RATE
-                print("token inr value", token_inr_value)
-                if admin_balance < token_inr_value:
-                    raise HTTPException(400, "Admin has insufficient fiat balance to burn tokens")
-            
-            
             if not self.tenant_dao.tenant_has_tokens(tenant_id):
 
                 from_addr = self.web3.to_checksum_address(req.from_address)
@@ -516,6 +909,7 @@ class WalletService:
                 main_wallet = self.web3.to_checksum_address(
                     os.getenv("MAIN_WALLET_ADDRESS")
                 )
+                is_burn = to_addr.lower() == main_wallet.lower()
 
                 # 2 Load contract
                 
@@ -529,7 +923,7 @@ class WalletService:
                 
                 # 4 Convert amount safely
                 
-                decimals = contract.functions.decimals().call()
+                decimals = TokenRegistry.decimals(self.web3, contract.address)
                 token_amount = Decimal(str(req.amount))
                 amount = int(token_amount * (10 ** decimals))
 
@@ -539,6 +933,10 @@ class WalletService:
                 if balance < amount:
                     raise HTTPException(400, "Insufficient token balance")
 
+                if is_burn:
+                    INR_RATE = get_usd_to_inr_rate("burn")
+                    token_inr_value = token_amount * INR_RATE
+                    reservation = self._reserve_burn_fiat(tenant_id, token_inr_value)
 
                 # 6 Nonce (pending safe)
                 
@@ -546,19 +944,28 @@ class WalletService:
                     from_addr, "pending"
                 )
 
-                # 7 Build tx
-                
-                tx = contract.functions.transfer(
+                # 7 Build tx (fees, chain id and gas from the oracle)
+
+                fees = FeeOracle.for_web3(self.web3)
+
+                transfer_call = contract.functions.transfer(
                     to_addr,
                     amount
-                ).build_transaction({
+                )
+
+                # One estimate (or none, if cached): passing "gas" keeps
+                # build_transaction from estimating again
+                tx = transfer_call.build_transaction({
                     "from": from_addr,
                     "nonce": nonce,
-                    "chainId": self.web3.eth.chain_id,
-                    "gasPrice": self.web3.eth.gas_price
+                    "chainId": fees.chain_id(),
+                    "gasPrice": fees.gas_price(),
+                    "gas": fees.estimate_gas({
+                        "from": from_addr,
+                        "to": contract.address,
+                        "data": transfer_call._encode_transaction_data()
+                    })
                 })
-
-                tx["gas"] = self.web3.eth.estimate_gas(tx)
                 print(f"Estimated gas: {tx['gas']}")
                 
                 # 8 Sign + Send
@@ -574,47 +981,36 @@ class WalletService:
                 )
 
                 tx_hash = self.web3.eth.send_raw_transaction(raw_tx)
-                
-                # 9 WAIT FOR CONFIRMATION
-                
-                receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
-
-                if receipt.status != 1:
-                    raise HTTPException(400, "Transaction failed on-chain")
+                reservation = None  # broadcast: settlement owns the admin debit now
+                rpc_url = os.getenv("PUBLIC_TENDERLY_RPC_URL")
 
-                # 10 Fiat Settlement (Burn Logic)
-                
-                transfer_type = "Transfer"
+                if not wait:
+                    return self._track_transfer(
+                        tx_hash, rpc_url, tenant_id,
+                        from_addr, to_addr, main_wallet, token_inr_value
+                    )
 
-                if to_addr.lower() == main_wallet.lower() and tx_hash!="":
+                # 9 Burns: wait, then settle the customer credit
 
-                    transfer_type = "Burn"
+                if is_burn:
+                    try:
+                        return self._confirm_burn(
+                            self.web3, tx_hash, rpc_url, tenant_id,
+                            from_addr, to_addr, main_wallet, token_inr_value
+                        )
+                    except HTTPException:
+                        fees.forget_gas_estimate(tx)  # reverted
+                        raise
 
-                    self.dao.update_admin_fiat_bank_balance(tenant_id,
-                        -token_inr_value
-                    )
+                # 10 WAIT FOR CONFIRMATION
 
-                    cust_balance = (
-                        self.dao.get_fiat_bank_balance_by_wallet_address(
-                            from_addr
-                        )
-                    )
+                receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
 
-                    new_balance = float(cust_balance) + float(token_inr_value)
+                if receipt.status != 1:
+                    fees.forget_gas_estimate(tx)
+                    raise HTTPException(400, "Transaction failed on-chain")
 
-                    self.dao.update_fiat_bank_balance_by_wallet_address(
-                        from_addr,
-                        new_balance
-                    )
-                    tx_hash = tx_hash if isinstance(tx_hash, str) else tx_hash.hex()
-
-                    return {
-                        "tx_hash": tx_hash,
-                        "status": "confirmed",
-                        "type": transfer_type,
-                        "old_fiat_bank_balance": cust_balance,
-                        "new_fiat_bank_balance": float(new_balance)
-                    }
+                transfer_type = "Transfer"
             
             else:
                 from Business_Layer.onchain_sepolia_gateway.services.onchain_token_service import (
@@ -625,17 +1021,7 @@ class WalletService:
                 to_addr = self.web3.to_checksum_address(req.to_address)
                 admin = self.user_dao.get_admin_details(tenant_id)
                 main_wallet = admin.wallet_address
-
-                admin_balance = self.dao.get_fiat_bank_balance_by_wallet_address(
-                    main_wallet
-                )
-                
-                INR_RATE = get_usd_to_inr_rate()
-                print("inr rate", INR_RATE)
-                token_inr_value = Decimal(str(req.amount)) * INR_RATE
-                print("token inr value", token_inr_value)
-                if admin_balance < token_inr_value:
-                    raise HTTPException(400, "Admin has insufficient fiat balance to burn tokens")
+                is_burn = to_addr.lower() == main_wallet.lower()
 
                 tenant = self.tenant_dao.get_tenant_by_id(tenant_id)
                 token_config = self.token_dao.get_token_by_symbol(
@@ -670,31 +1056,27 @@ class WalletService:
 
                 if balance < amount_units:
                     raise HTTPException(400, "Insufficient token balance")
-                
-                tx_hash = token_service.transfer(to_addr, token_amount)
 
-                if to_addr.lower() == main_wallet.lower() and tx_hash!="":
+                if is_burn:
+                    INR_RATE = get_usd_to_inr_rate("burn")
+                    token_inr_value = token_amount * INR_RATE
+                    reservation = self._reserve_burn_fiat(tenant_id, token_inr_value)
 
-                    transfer_type = "Burn"
+                tx_hash = token_service.transfer(to_addr, token_amount)
+                reservation = None  # broadcast: settlement owns the admin debit now
 
-                    self.dao.update_admin_fiat_bank_balance(tenant_id,
-                        -token_inr_value
+                if not wait:
+                    return self._track_transfer(
+                        tx_hash, tenant.rpc_url, tenant_id,
+                        from_addr, to_addr, main_wallet, token_inr_value
                     )
 
-                    cust_balance = (
-                        self.dao.get_fiat_bank_balance_by_wallet_address(
-                            from_addr
-                        )
+                if is_burn:
+                    return self._confirm_burn(
+                        token_service.web3, tx_hash, tenant.rpc_url, tenant_id,
+                        from_addr, to_addr, main_wallet, token_inr_value
                     )
 
-                    new_balance = float(cust_balance) + float(token_inr_value)
-
-                    self.dao.update_fiat_bank_balance_by_wallet_address(
-                        from_addr,
-                        new_balance
-                    )
-
-                
 
             # Invalidate wallet balance cache for both wallets
             self.redis.invalidate_wallet_balance(from_addr.lower())
@@ -711,9 +1093,11 @@ class WalletService:
             }
 
         except HTTPException as he:
+            self._release_burn_fiat(reservation)
             raise he
 
         except Exception as e:
+            self._release_burn_fiat(reservation)
             raise HTTPException(500, str(e))
 
 
@@ -741,37 +1125,12 @@ class WalletService:
 
     
     
-    def search_users(self, query: str, tenant_id: int, current_customer_id: str):
-        try:
-
-            # First search in bank_customer_details
-            users = self.dao.get_users_by_search_query(query, tenant_id, current_customer_id)
-            # print("user details", users[0].customer_id if users else "No users found"   )
-            if not users:
-                raise HTTPException(status_code=404, detail="No users found matching the query")
-
-            return users
-        except HTTPException as he:
-            raise he
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e))
-    def search_payees(self, customer_id: str, tenant_id: int, query: str):
+    def search_users(self, query: str, tenant_id: int, current_customer_id: str, limit: int = None):
+        return SearchService(self.db).search_users(query, tenant_id, current_customer_id, limit)
 
-        payees = self.dao.search_payees_for_customer(customer_id, tenant_id, query)
+    def search_payees(self, customer_id: str, tenant_id: int, query: str, limit: int = None):
+        return SearchService(self.db).search_payees(customer_id, tenant_id, query, limit)
 
-        return [
-            {
-                "customer_id": str(customer_id),
-                "name": payee.payee_name,
-                "phone_number": payee.phone_number,
-                "wallet_address": payee.wallet_address
-            }
-            for payee in payees
-        ]
-
-        
-        
-        
     def get_fiat_balance_by_customer_id(self, customer_id: str,tenant_id: int):
         result = self.dao.get_fiat_balance_by_customer_id(customer_id,tenant_id)
         if not result:
@@ -0,0 +1,67 @@
+from sqlalchemy import select, exists
+from sqlalchemy.ext.asyncio import AsyncSession
+from DataAccess_Layer.models.model import BankCustomerDetails, TenantDetails, TokenConfig
+from DataAccess_Layer.utils.config_cache import CONFIG_CACHE, TENANT, TOKENS, snapshot
+from typing import Optional, List
+
+
+class AsyncWalletDAO:
+    """Read queries behind the async balance path (AsyncSession)"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_wallet_holder(self, wallet_address: str):
+        """(tenant_id, fiat_bank_balance) for a wallet, or None"""
+        result = await self.db.execute(
+            select(
+                BankCustomerDetails.tenant_id,
+                BankCustomerDetails.fiat_bank_balance
+            )
+            .where(BankCustomerDetails.wallet_address == wallet_address)
+            .limit(1)
+        )
+        return result.first()
+
+    async def tenant_has_tokens(self, tenant_id: int) -> bool:
+        result = await self.db.execute(
+            select(
+                exists().where(
+                    TokenConfig.tenant_id == TenantDetails.id,
+                    TenantDetails.id == tenant_id,
+                    TenantDetails.is_active == True
+                )
+            )
+        )
+        return bool(result.scalar())
+
+    # Tenant / token config shares the sync DAOs' process-wide cache
+
+    async def get_tenant_by_id(self, tenant_id: int) -> Optional[TenantDetails]:
+        cached = CONFIG_CACHE.get(TENANT, tenant_id)
+        if cached is not CONFIG_CACHE.MISSING:
+            return cached
+
+        generation = CONFIG_CACHE.generation()
+        result = await self.db.execute(
+            select(TenantDetails).where(
+                TenantDetails.id == tenant_id,
+                TenantDetails.is_active == True
+            )
+        )
+        tenant = snapshot(result.scalars().first())
+        CONFIG_CACHE.put(TENANT, tenant_id, tenant, generation)
+        return tenant
+
+    async def get_tokens_by_tenant(self, tenant_id: int) -> List[TokenConfig]:
+        tokens = CONFIG_CACHE.get(TOKENS, tenant_id)
+
+        if tokens is CONFIG_CACHE.MISSING:
+            generation = CONFIG_CACHE.generation()
+            result = await self.db.execute(
+                select(TokenConfig).where(TokenConfig.tenant_id == tenant_id)
+            )
+            tokens = [snapshot(token) for token in result.scalars().all()]
+            CONFIG_CACHE.put(TOKENS, tenant_id, tokens, generation)
+
+        return [t for t in tokens if t.is_active]
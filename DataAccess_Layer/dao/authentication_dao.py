@@ -1,7 +1,10 @@
 
 from sqlalchemy.orm import Session
 from DataAccess_Layer.models.model import BankCustomerDetails
-from typing import Optional, List
+from DataAccess_Layer.dao.tenant_dao import TenantDAO
+from DataAccess_Layer.utils.identity_cache import load_once, prime
+from DataAccess_Layer.utils.keyset import keyset_page
+from typing import Optional, List, Tuple
 from sqlalchemy import desc
 
 import logging
@@ -24,6 +27,9 @@ class UserAuthDAO:
     def get_user_by_email(self, email: str):
         return self.db.query(BankCustomerDetails).filter_by(mail=email).first()
 
+    def get_user_by_id(self, user_id: int) -> Optional[BankCustomerDetails]:
+        return self.db.get(BankCustomerDetails, user_id)
+
     def get_user_by_customer_id(self, customer_id: str) -> Optional[BankCustomerDetails]:
         return self.db.query(BankCustomerDetails).filter_by(customer_id=customer_id).first()
     
@@ -50,8 +56,31 @@ class UserAuthDAO:
     def count_active_users(self) -> int:
         return self.db.query(BankCustomerDetails).filter(BankCustomerDetails.is_active == True).count()
 
-    def get_all_users(self) -> List[BankCustomerDetails]:
-        return self.db.query(BankCustomerDetails).all()
+    def get_users_page(
+        self, limit: int, after_id: Optional[int] = None, tenant_id: Optional[int] = None
+    ) -> Tuple[List, Optional[int]]:
+        """
+        One keyset page of customers, without password / key columns
+
+        Returns:
+            (rows, next_after_id)
+        """
+        query = self.db.query(
+            BankCustomerDetails.id,
+            BankCustomerDetails.tenant_id,
+            BankCustomerDetails.customer_id,
+            BankCustomerDetails.name,
+            BankCustomerDetails.mail,
+            BankCustomerDetails.phone_number,
+            BankCustomerDetails.wallet_address,
+            BankCustomerDetails.is_active,
+            BankCustomerDetails.is_wallet,
+            BankCustomerDetails.created_at,
+        )
+        if tenant_id is not None:
+            query = query.filter(BankCustomerDetails.tenant_id == tenant_id)  # idx_customer_tenant
+
+        return keyset_page(query, BankCustomerDetails.id, limit, after_id)
 
     def create_user(self, tenant_id, customer_id, mail, name, password, phone_number, bank_account_number, is_active=True, is_wallet=False, fiat_bank_balance=0.00) -> BankCustomerDetails:
         new_user = BankCustomerDetails(
@@ -101,24 +130,18 @@ class UserAuthDAO:
         return user
     
     def get_main_wallet_address(self, tenant_id: int) -> Optional[str]:
-        main_wallet = (
-            self.db.query(BankCustomerDetails.wallet_address)
-            .filter(
-                BankCustomerDetails.tenant_id == tenant_id,
-                BankCustomerDetails.customer_id.ilike("ADMI%")  # starts with ADMI
-            )
-            .first()
-        )
-        return main_wallet[0] if main_wallet else None
+        admin = self.get_admin_details(tenant_id)
+        return admin.wallet_address if admin else None
     
     def get_admin_details(self, tenant_id) -> Optional[BankCustomerDetails]:
-        admin = (
-            self.db.query(BankCustomerDetails)
-            .filter(
-                BankCustomerDetails.tenant_id == tenant_id,
-                BankCustomerDetails.customer_id.ilike("ADMI%")  # starts with ADMI
-            )
-            .first()
-        )
-        return admin
+        def load():
+            # Primary-key hit through the tenant's cached admin reference
+            admin_id = TenantDAO(self.db).get_admin_id(tenant_id)
+            admin = self.db.get(BankCustomerDetails, admin_id) if admin_id is not None else None
+            # The admin's wallet lookups in this request reuse the row
+            if admin and admin.wallet_address:
+                prime(self.db, "bank_customer_details", admin.wallet_address.lower(), admin)
+            return admin
+
+        return load_once(self.db, "tenant_admin", tenant_id, load)
     
\ No newline at end of file
@@ -1,6 +1,9 @@
-from typing import Optional
+from typing import Optional, List, Tuple
+from decimal import Decimal
 from DataAccess_Layer.models.model import BankCustomerDetails, CustomerPayee
+from sqlalchemy import update, select, func
 from sqlalchemy.orm import Session
+from DataAccess_Layer.utils.keyset import keyset_page
 
 class BankDetailDAO:
     """Data Access Object for Bank Customer Details"""
@@ -40,13 +43,28 @@ class BankDetailDAO:
         self.db.refresh(user)
         return True
     def add_fiat_balance(self, tenant_id,customer_id, fiat_balance):
-        user = self.db.query(BankCustomerDetails).filter_by(customer_id=customer_id, tenant_id=tenant_id).first()
-        if not user:
+        # Atomic increment; the read-back runs in the same transaction
+        conditions = (
+            BankCustomerDetails.customer_id == customer_id,
+            BankCustomerDetails.tenant_id == tenant_id
+        )
+        updated = self.db.execute(
+            update(BankCustomerDetails)
+            .where(*conditions)
+            .values(
+                fiat_bank_balance=func.coalesce(BankCustomerDetails.fiat_bank_balance, 0)
+                + Decimal(str(fiat_balance)).quantize(Decimal("0.01"))
+            )
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if not updated:
+            self.db.rollback()
             return None
-        user.fiat_bank_balance = float(user.fiat_bank_balance or 0) + fiat_balance
+        new_balance = self.db.execute(
+            select(BankCustomerDetails.fiat_bank_balance).where(*conditions)
+        ).scalar()
         self.db.commit()
-        self.db.refresh(user)
-        return user.fiat_bank_balance
+        return new_balance
     def create_payee(self, id, request):
         new_payee = CustomerPayee(
             customer_id=id,
@@ -62,8 +80,21 @@ class BankDetailDAO:
         self.db.commit()
         self.db.refresh(new_payee)
         return new_payee
-    def get_payees(self, customer_id):
-        return self.db.query(CustomerPayee).filter_by(customer_id=customer_id).all()
+    def get_payees(self, customer_id, limit: int, after_id: Optional[int] = None) -> Tuple[List, Optional[int]]:
+        """One keyset page of a customer's payees, walked along (customer_id, id)"""
+        query = self.db.query(
+            CustomerPayee.id,
+            CustomerPayee.customer_id,
+            CustomerPayee.payee_name,
+            CustomerPayee.phone_number,
+            CustomerPayee.bank_account_number,
+            CustomerPayee.wallet_address,
+            CustomerPayee.nickname,
+            CustomerPayee.is_favorite,
+            CustomerPayee.is_active
+        ).filter(CustomerPayee.customer_id == customer_id)
+
+        return keyset_page(query, CustomerPayee.id, limit, after_id)
     def get_payee_by_id(self, payee_id):
         return self.db.query(CustomerPayee).filter_by(id=payee_id).first()
     def delete_payee(self, payee_id):
@@ -0,0 +1,207 @@
+import os
+import re
+from typing import List, Optional
+from sqlalchemy import or_, text
+from sqlalchemy.orm import Session
+from dotenv import load_dotenv
+
+from DataAccess_Layer.models.model import BankCustomerDetails, CustomerPayee
+
+load_dotenv()
+
+# Word-prefix name matches through the FULLTEXT index added in
+# MYSQL_DB_SCHEMA/migrations/001_search_indexes.sql; disable before migrating
+SEARCH_FULLTEXT = os.getenv("SEARCH_FULLTEXT", "true").lower() == "true"
+# InnoDB ignores FULLTEXT tokens shorter than innodb_ft_min_token_size
+FULLTEXT_MIN_TOKEN = 3
+
+ADDRESS_QUERY = re.compile(r"^0x[0-9a-fA-F]*$")
+PHONE_QUERY = re.compile(r"^\+?[0-9]+$")
+
+
+def like_prefix(query: str) -> str:
+    """LIKE pattern for a prefix match, with wildcards in the query escaped"""
+    escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"{escaped}%"
+
+
+# ---------------- MATCH SEMANTICS ---------------- #
+#
+# Python mirrors of the SQL conditions below, so a cached result set for a
+# shorter prefix can be narrowed exactly as the database would.
+
+def user_query_kind(query: str) -> str:
+    if ADDRESS_QUERY.match(query):
+        return "address"
+    if PHONE_QUERY.match(query):
+        return "phone"
+    return "name"
+
+
+def fulltext_words(query: str) -> List[str]:
+    if not SEARCH_FULLTEXT:
+        return []
+    return [w for w in re.split(r"\W+", query) if len(w) >= FULLTEXT_MIN_TOKEN]
+
+
+def user_matches(row, query: str) -> bool:
+    needle = query.lower()
+    kind = user_query_kind(query)
+
+    if kind == "address":
+        return (row.wallet_address or "").lower().startswith(needle)
+    if kind == "phone":
+        return (row.phone_number or "").startswith(needle)
+
+    name = (row.name or "").lower()
+    if name.startswith(needle):
+        return True
+
+    words = fulltext_words(needle)
+    name_words = re.split(r"\W+", name)
+    return bool(words) and all(
+        any(word.startswith(w) for word in name_words) for w in words
+    )
+
+
+def payee_matches(row, query: str) -> bool:
+    needle = query.lower()
+    name = (row.payee_name or "").lower()
+    return (
+        name.startswith(needle)
+        or f" {needle}" in name
+        or (row.phone_number or "").lower().startswith(needle)
+        or (row.wallet_address or "").lower().startswith(needle)
+    )
+
+
+class SearchDAO:
+    """
+    Prefix lookups for the user / payee search endpoints
+
+    Every query is anchored on an index: (tenant_id, wallet_address),
+    (tenant_id, phone_number), (tenant_id, name) or the name FULLTEXT
+    index for users, and the payee's customer_id for payees. Leading
+    wildcards are never used.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    # ---------------- USERS ---------------- #
+
+    def _users(self, tenant_id: int, current_customer_id: Optional[str], *conditions, limit: int, order=None):
+        query = self.db.query(
+            BankCustomerDetails.customer_id,
+            BankCustomerDetails.name,
+            BankCustomerDetails.phone_number,
+            BankCustomerDetails.wallet_address,
+        ).filter(
+            BankCustomerDetails.tenant_id == tenant_id,
+            BankCustomerDetails.customer_id.notilike("ADMI%"),  # Exclude admin accounts
+            BankCustomerDetails.wallet_address != None,  # Exclude users without wallet addresses
+            *conditions
+        )
+
+        if current_customer_id is not None:
+            query = query.filter(BankCustomerDetails.customer_id != current_customer_id)
+
+        # Ordering by the indexed column keeps the scan on the index range
+        if order is not None:
+            query = query.order_by(order)
+
+        return query.limit(limit).all()
+
+    def search_users(
+        self,
+        query: str,
+        tenant_id: int,
+        current_customer_id: Optional[str] = None,
+        limit: int = 20
+    ) -> List:
+        """
+        Candidate users for a query, best strategy first
+
+        0x... is an address prefix, digits a phone prefix, anything else
+        a name prefix plus (when enabled) a word-prefix FULLTEXT match so
+        "sharma" finds "Rohit Sharma". Rows may repeat across strategies;
+        the caller ranks and de-duplicates.
+        """
+        kind = user_query_kind(query)
+
+        if kind == "address":
+            return self._users(
+                tenant_id, current_customer_id,
+                BankCustomerDetails.wallet_address.like(like_prefix(query)),
+                limit=limit,
+                order=BankCustomerDetails.wallet_address
+            )
+
+        if kind == "phone":
+            return self._users(
+                tenant_id, current_customer_id,
+                BankCustomerDetails.phone_number.like(like_prefix(query)),
+                limit=limit,
+                order=BankCustomerDetails.phone_number
+            )
+
+        rows = self._users(
+            tenant_id, current_customer_id,
+            BankCustomerDetails.name.like(like_prefix(query)),
+            limit=limit,
+            order=BankCustomerDetails.name
+        )
+
+        words = fulltext_words(query)
+
+        if words and len(rows) < limit:
+            boolean_query = " ".join(f"+{word}*" for word in words)
+            rows += self._users(
+                tenant_id, current_customer_id,
+                text("MATCH (bank_customer_details.name) AGAINST (:q IN BOOLEAN MODE)")
+                .bindparams(q=boolean_query),
+                limit=limit
+            )
+
+        return rows
+
+    # ---------------- PAYEES ---------------- #
+
+    def search_payees(self, customer_id: str, tenant_id: int, query: str, limit: int = 20) -> List:
+        """
+        A customer's payees matching a name / word / phone / address prefix
+
+        Scoped to one customer through idx_payee_customer, so the prefix
+        conditions only ever run over that customer's payees.
+        """
+        owner_id = (
+            self.db.query(BankCustomerDetails.id)
+            .filter(
+                BankCustomerDetails.customer_id == customer_id,
+                BankCustomerDetails.tenant_id == tenant_id
+            )
+            .scalar()
+        )
+        if owner_id is None:
+            return []
+
+        pattern = like_prefix(query)
+
+        return (
+            self.db.query(
+                CustomerPayee.payee_name,
+                CustomerPayee.phone_number,
+                CustomerPayee.wallet_address,
+            )
+            .filter(
+                CustomerPayee.customer_id == owner_id,
+                or_(
+                    CustomerPayee.payee_name.like(pattern),
+                    CustomerPayee.payee_name.like(f"% {pattern}"),  # later word
+                    CustomerPayee.phone_number.like(pattern),
+                    CustomerPayee.wallet_address.like(pattern),
+                )
+            )
+            .limit(limit)
+            .all()
+        )
@@ -1,8 +1,12 @@
 from sqlalchemy.orm import Session, joinedload
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from datetime import datetime
 
-from DataAccess_Layer.models.model import TenantDetails
+from DataAccess_Layer.models.model import TenantDetails, BankCustomerDetails
+from DataAccess_Layer.dao.token_dao import TokenDAO
+from DataAccess_Layer.utils.identity_cache import load_once, forget
+from DataAccess_Layer.utils.config_cache import CONFIG_CACHE, TENANT, snapshot
+from DataAccess_Layer.utils.keyset import keyset_page
 
 
 class TenantDAO:
@@ -36,8 +40,8 @@ class TenantDAO:
     # -----------------------------
     # Get tenant by ID
     # -----------------------------
-    def get_tenant_by_id(self, tenant_id: int) -> Optional[TenantDetails]:
-
+    def _load_tenant(self, tenant_id: int) -> Optional[TenantDetails]:
+        """Attached row, for writes"""
         return (
             self.db.query(TenantDetails)
             .filter(
@@ -47,6 +51,16 @@ class TenantDAO:
             .first()
         )
 
+    def get_tenant_by_id(self, tenant_id: int) -> Optional[TenantDetails]:
+        """Read-only tenant config, served from the process-wide config cache"""
+        return load_once(
+            self.db, "tenant_details", tenant_id,
+            lambda: CONFIG_CACHE.get_or_load(
+                TENANT, tenant_id,
+                lambda: snapshot(self._load_tenant(tenant_id))
+            )
+        )
+
     # -----------------------------
     # Get tenant by name
     # -----------------------------
@@ -61,6 +75,67 @@ class TenantDAO:
             .first()
         )
 
+    # -----------------------------
+    # Tenant admin account
+    # -----------------------------
+    def get_admin_id(self, tenant_id: int) -> Optional[int]:
+        """
+        Primary key of the tenant's admin account, from the cached tenant
+        config. Tenants without admin_customer_id set fall back to the
+        legacy 'ADMI%' customer id convention.
+        """
+        tenant = self.get_tenant_by_id(tenant_id)
+        if tenant is None:
+            return None
+
+        if tenant.admin_customer_id is not None:
+            return tenant.admin_customer_id
+
+        return load_once(
+            self.db, "tenant_admin_id", tenant_id,
+            lambda: (
+                self.db.query(BankCustomerDetails.id)
+                .filter(
+                    BankCustomerDetails.tenant_id == tenant_id,
+                    BankCustomerDetails.customer_id.like("ADMI%")
+                )
+                .order_by(BankCustomerDetails.id)
+                .limit(1)
+                .scalar()
+            )
+        )
+
+    def set_admin(self, tenant_id: int, admin_customer_id: int) -> bool:
+        """
+        Point the tenant at its admin account
+
+        Returns:
+            False if the tenant is unknown or the customer is not one of
+            its accounts
+        """
+        tenant = self._load_tenant(tenant_id)
+        if not tenant:
+            return False
+
+        owned = (
+            self.db.query(BankCustomerDetails.id)
+            .filter(
+                BankCustomerDetails.id == admin_customer_id,
+                BankCustomerDetails.tenant_id == tenant_id
+            )
+            .first()
+        )
+        if owned is None:
+            return False
+
+        tenant.admin_customer_id = admin_customer_id
+        tenant.updated_at = datetime.utcnow()
+        self.db.commit()
+
+        forget(self.db, "tenant_admin_id", tenant_id)
+        self._config_changed(tenant_id)
+        return True
+
     # -----------------------------
     # Update tenant
     # -----------------------------
@@ -70,7 +145,7 @@ class TenantDAO:
         **kwargs
     ) -> Optional[TenantDetails]:
 
-        tenant = self.get_tenant_by_id(tenant_id)
+        tenant = self._load_tenant(tenant_id)
         if not tenant:
             return None
 
@@ -81,6 +156,8 @@ class TenantDAO:
         tenant.updated_at = datetime.utcnow()
         self.db.commit()
         self.db.refresh(tenant)
+
+        self._config_changed(tenant_id)
         return tenant
 
     # -----------------------------
@@ -88,42 +165,52 @@ class TenantDAO:
     # -----------------------------
     def deactivate_tenant(self, tenant_id: int) -> bool:
 
-        tenant = self.get_tenant_by_id(tenant_id)
+        tenant = self._load_tenant(tenant_id)
         if not tenant:
             return False
 
         tenant.is_active = False
         tenant.updated_at = datetime.utcnow()
         self.db.commit()
+
+        self._config_changed(tenant_id)
         return True
 
+    def _config_changed(self, tenant_id: int):
+        forget(self.db, "tenant_details", tenant_id)
+        forget(self.db, "tenant_has_tokens", tenant_id)
+        CONFIG_CACHE.notify(TENANT, tenant_id)
+
     # -----------------------------
-    # Get all active tenants
+    # Get active tenants, one page at a time
     # -----------------------------
-    def get_all_tenants(self) -> List[TenantDetails]:
+    def get_tenants_page(self, limit: int, after_id: Optional[int] = None) -> Tuple[List, Optional[int]]:
 
-        return (
-            self.db.query(TenantDetails)
+        query = (
+            self.db.query(
+                TenantDetails.id,
+                TenantDetails.tenant_name,
+                TenantDetails.chain_id,
+                TenantDetails.is_active,
+                TenantDetails.created_at
+            )
             .filter(TenantDetails.is_active == True)
-            .all()
         )
 
+        return keyset_page(query, TenantDetails.id, limit, after_id)
+
     # -----------------------------
     # Check tenant has tokens or not
     # -----------------------------
     def tenant_has_tokens(self, tenant_id: int) -> bool:
 
-        tenant = (
-            self.db.query(TenantDetails)
-            .options(joinedload(TenantDetails.tokens))
-            .filter(
-                TenantDetails.id == tenant_id,
-                TenantDetails.is_active == True
-            )
-            .first()
-        )
+        # Both lookups come from the config cache - no query in steady state
+        def load():
+            if not self.get_tenant_by_id(tenant_id):
+                return False
+            return bool(TokenDAO(self.db).get_all_tokens_by_tenant(tenant_id))
 
-        return bool(tenant and tenant.tokens)
+        return load_once(self.db, "tenant_has_tokens", tenant_id, load)
 
     # -----------------------------
     # Get tenant with tokens
@@ -3,6 +3,9 @@ from typing import Optional, List
 from datetime import datetime
 
 from DataAccess_Layer.models.model import TokenConfig
+from DataAccess_Layer.utils.identity_cache import load_once, forget
+from DataAccess_Layer.utils.config_cache import CONFIG_CACHE, TOKENS, snapshot
+from utils.token_registry import TokenRegistry
 
 
 class TokenDAO:
@@ -41,6 +44,8 @@ class TokenDAO:
         self.db.add(token)
         self.db.commit()
         self.db.refresh(token)
+
+        self._forget_tenant(tenant_id)
         return token
 
     # -----------------------------
@@ -51,7 +56,14 @@ class TokenDAO:
         tenant_id: int,
         token_symbol: str
     ) -> Optional[TokenConfig]:
-
+        """Read-only token config, picked from the tenant's cached token list"""
+        for token in self.get_tokens_by_tenant(tenant_id):
+            if token.token_symbol.upper() == token_symbol.upper():
+                return token
+        return None
+
+    def _load_token(self, tenant_id: int, token_symbol: str) -> Optional[TokenConfig]:
+        """Attached row, for writes"""
         return (
             self.db.query(TokenConfig)
             .filter(
@@ -72,10 +84,12 @@ class TokenDAO:
         **kwargs
     ) -> Optional[TokenConfig]:
 
-        token = self.get_token_by_symbol(tenant_id, token_symbol)
+        token = self._load_token(tenant_id, token_symbol)
         if not token:
             return None
 
+        previous_contract = token.contract_address
+
         for key, value in kwargs.items():
             if hasattr(token, key):
                 setattr(token, key, value)
@@ -83,6 +97,12 @@ class TokenDAO:
         token.updated_at = datetime.utcnow()
         self.db.commit()
         self.db.refresh(token)
+
+        self._forget_tenant(tenant_id)
+        TokenRegistry.invalidate(previous_contract)
+        if token.contract_address != previous_contract:
+            TokenRegistry.invalidate(token.contract_address)
+
         return token
 
     # -----------------------------
@@ -94,13 +114,16 @@ class TokenDAO:
         token_symbol: str
     ) -> bool:
 
-        token = self.get_token_by_symbol(tenant_id, token_symbol)
+        token = self._load_token(tenant_id, token_symbol)
         if not token:
             return False
 
         token.is_active = False
         token.updated_at = datetime.utcnow()
         self.db.commit()
+
+        self._forget_tenant(tenant_id)
+        TokenRegistry.invalidate(token.contract_address)
         return True
 
     # -----------------------------
@@ -183,11 +206,31 @@ class TokenDAO:
         tenant_id: int
     ) -> List[TokenConfig]:
 
-        return (
-            self.db.query(TokenConfig)
-            .filter(
-                TokenConfig.tenant_id == tenant_id,
-                TokenConfig.is_active == True
-            )
-            .all()
+        return load_once(
+            self.db, "token_config", tenant_id,
+            lambda: [t for t in self.get_all_tokens_by_tenant(tenant_id) if t.is_active]
         )
+
+    # -----------------------------
+    # Get all tokens for tenant (including inactive)
+    # -----------------------------
+    def get_all_tokens_by_tenant(
+        self,
+        tenant_id: int
+    ) -> List[TokenConfig]:
+
+        return CONFIG_CACHE.get_or_load(
+            TOKENS, tenant_id,
+            lambda: [
+                snapshot(token)
+                for token in self.db.query(TokenConfig)
+                .filter(TokenConfig.tenant_id == tenant_id)
+                .all()
+            ]
+        )
+
+    def _forget_tenant(self, tenant_id: int):
+        """Drop memoized token lookups after a write, here and on other workers"""
+        forget(self.db, "token_config", tenant_id)
+        forget(self.db, "tenant_has_tokens", tenant_id)
+        CONFIG_CACHE.notify(TOKENS, tenant_id)
@@ -1,20 +1,80 @@
 
+from decimal import Decimal
+from sqlalchemy import update, func
 from sqlalchemy.orm import Session
-from DataAccess_Layer.models.model import BankCustomerDetails, CustomerPayee
-from typing import Optional, List ,Tuple
+from DataAccess_Layer.models.model import BankCustomerDetails
+from DataAccess_Layer.dao.tenant_dao import TenantDAO
+from DataAccess_Layer.dao.token_dao import TokenDAO
+from DataAccess_Layer.utils.identity_cache import load_once
+from DataAccess_Layer.utils.keyset import keyset_page
+from typing import Optional, List ,Tuple, Dict
 
 class WalletDAO:
     def __init__(self, db):
         self.db = db
 
+    # ---------------- PER-REQUEST LOOKUPS ---------------- #
+
+    def get_customer_by_wallet(self, address: str) -> Optional[BankCustomerDetails]:
+        """Customer row for a wallet, loaded at most once per session"""
+        return load_once(
+            self.db, "bank_customer_details", address.lower(),
+            lambda: self.db.query(BankCustomerDetails).filter_by(wallet_address=address).first()
+        )
+
+    def load_wallet_context(self, address: str) -> Optional[dict]:
+        """
+        Customer, tenant and active tokens for a wallet
+
+        The customer row is the only query in steady state: tenant and
+        token config come from the process-wide config cache. Everything
+        is memoized in the identity cache, so later lookups by any DAO in
+        the same request hit memory.
+
+        Returns:
+            {"customer", "tenant", "tokens"}, None if the wallet is unknown
+        """
+        customer = self.get_customer_by_wallet(address)
+        if not customer:
+            return None
+
+        tenant = TenantDAO(self.db).get_tenant_by_id(customer.tenant_id)
+        tokens = TokenDAO(self.db).get_tokens_by_tenant(customer.tenant_id) if tenant else []
+
+        return {"customer": customer, "tenant": tenant, "tokens": tokens}
+
     def get_private_key_by_address(self, address: str) -> Optional[str]:
-        user = self.db.query(BankCustomerDetails).filter_by(wallet_address=address).first()
+        user = self.get_customer_by_wallet(address)
         if user:
             return user.encrypted_private_key
         return None
-    def get_all_users(self):
-        user = self.db.query(BankCustomerDetails.customer_id, BankCustomerDetails.mail, BankCustomerDetails.wallet_address).all()
-        return user
+    def get_wallet_users_page(self, limit: int, after_id: Optional[int] = None) -> Tuple[List, Optional[int]]:
+        """One keyset page of (id, customer_id, mail, wallet_address) for wallet holders"""
+        query = self.db.query(
+            BankCustomerDetails.id,
+            BankCustomerDetails.customer_id,
+            BankCustomerDetails.mail,
+            BankCustomerDetails.wallet_address
+        ).filter(BankCustomerDetails.wallet_address != None)
+
+        return keyset_page(query, BankCustomerDetails.id, limit, after_id)
+
+    def get_wallet_holders(self, addresses: Optional[List[str]] = None, tenant_id: Optional[int] = None):
+        """Projected wallet rows for bulk balance reads, loaded in one query"""
+        query = self.db.query(
+            BankCustomerDetails.customer_id,
+            BankCustomerDetails.tenant_id,
+            BankCustomerDetails.wallet_address,
+            BankCustomerDetails.fiat_bank_balance
+        ).filter(BankCustomerDetails.wallet_address != None)
+
+        if addresses is not None:
+            query = query.filter(BankCustomerDetails.wallet_address.in_(addresses))
+
+        if tenant_id is not None:
+            query = query.filter(BankCustomerDetails.tenant_id == tenant_id)
+
+        return query.all()
 
     def get_fiat_balance_by_customer_id(
         self, customer_id: str, tenant_id: int
@@ -32,82 +92,94 @@ class WalletDAO:
         return user.bank_account_number, user.fiat_bank_balance
     
     def get_fiat_bank_balance_by_wallet_address(self, wallet_address: str) -> Optional[float]:
-        user = self.db.query(BankCustomerDetails).filter_by(wallet_address=wallet_address).first()
+        user = self.get_customer_by_wallet(wallet_address)
         if user:
             return user.fiat_bank_balance
         return 0.0
     
-    def update_fiat_bank_balance_by_wallet_address(self, wallet_address: str, new_balance:float):
-        user = self.db.query(BankCustomerDetails).filter_by(wallet_address=wallet_address).first()
-        if not user:
+    def update_admin_fiat_bank_balance(self, tenant_id: int, amount: float):
+        """Atomic credit (or debit, if negative) of the tenant admin's fiat"""
+        if not self.apply_fiat_deltas(admin_deltas={tenant_id: amount}, guard=False):
             return None
-        user.fiat_bank_balance = new_balance
-        self.db.commit()
-        self.db.refresh(user)
-        return user.fiat_bank_balance
+        return True
 
-    def update_admin_fiat_bank_balance(self, tenant_id: int, amount: float):
-        admin = (
-            self.db.query(BankCustomerDetails)
-            .filter(
-                BankCustomerDetails.tenant_id == tenant_id,
-                BankCustomerDetails.customer_id.ilike("ADMI%")  # starts with ADMI
-            )
-            .first()
+    # ---------------- FIAT LEDGER ---------------- #
+    #
+    # Balances change through single UPDATE ... SET balance = balance + delta
+    # statements rather than read-modify-write in Python, so concurrent
+    # requests can't lose updates, and the optional guard makes the
+    # database reject an overdraft instead of a racy pre-check.
+
+    def _fiat_delta(self, conditions, delta, guard: bool) -> bool:
+        delta = Decimal(str(delta)).quantize(Decimal("0.01"))  # DECIMAL(18, 2)
+        balance = func.coalesce(BankCustomerDetails.fiat_bank_balance, 0)
+
+        stmt = (
+            update(BankCustomerDetails)
+            .where(*conditions)
+            .values(fiat_bank_balance=balance + delta)
+            .execution_options(synchronize_session=False)
         )
+        if guard:
+            stmt = stmt.where(balance + delta >= 0)
 
-        if not admin:
-            return None
+        return self.db.execute(stmt).rowcount > 0
 
-        admin.fiat_bank_balance += amount
-        self.db.commit()
-        self.db.refresh(admin)
+    def apply_fiat_deltas(
+        self,
+        wallet_deltas: Optional[Dict[str, Decimal]] = None,
+        admin_deltas: Optional[Dict[int, Decimal]] = None,
+        guard: bool = True
+    ) -> bool:
+        """
+        Apply fiat balance changes in one transaction
 
-        return admin.fiat_bank_balance
+        Args:
+            wallet_deltas: {wallet_address: delta}
+            admin_deltas: {tenant_id: delta} for the tenant's admin account
+            guard: Reject the whole set if any balance would go negative;
+                pass False for settlements of transactions already final
+                on-chain, which must be recorded regardless
 
-    
-    def get_users_by_search_query(self, query: str, tenant_id: int, current_customer_id: str) -> List[BankCustomerDetails]:
-        search_pattern = f"%{query}%"
-        users = self.db.query(BankCustomerDetails).filter(
-            (BankCustomerDetails.tenant_id == tenant_id) &
-            (BankCustomerDetails.customer_id != current_customer_id) & 
-            (BankCustomerDetails.customer_id.notilike("ADMI%")) & # Exclude admin accounts
-            (BankCustomerDetails.wallet_address != None) & # Exclude users without wallet addresses
-
-            (BankCustomerDetails.name.ilike(search_pattern)) |
-            (BankCustomerDetails.phone_number.ilike(search_pattern)) |
-            (BankCustomerDetails.wallet_address.ilike(search_pattern))
-        ).all()
-        return users
-    # check payees for particular customer and return results
-    
-    def search_payees_for_customer(self, customer_id: str, tenant_id: int, query: str):
+        Returns:
+            True if committed, False (nothing applied) if a wallet or
+            tenant admin is unknown or a guarded balance would be overdrawn
+        """
+        # Admin accounts are updated by primary key, via the tenant config
+        tenant_dao = TenantDAO(self.db)
+        admin_ids = {
+            tenant_id: tenant_dao.get_admin_id(tenant_id)
+            for tenant_id in (admin_deltas or {})
+        }
+        if None in admin_ids.values():
+            return False
 
-        search_pattern = f"%{query}%"
+        try:
+            for wallet_address, delta in (wallet_deltas or {}).items():
+                if not self._fiat_delta(
+                    [BankCustomerDetails.wallet_address == wallet_address],
+                    delta, guard
+                ):
+                    self.db.rollback()
+                    return False
 
-        return (
-            self.db.query(CustomerPayee)
-            .join(
-                BankCustomerDetails,
-                CustomerPayee.customer_id == BankCustomerDetails.id
-            )
-            .filter(
-                (BankCustomerDetails.customer_id == customer_id) &
-                (BankCustomerDetails.tenant_id == tenant_id) &
-                (
-                    (CustomerPayee.payee_name.ilike(search_pattern)) |
-                    (CustomerPayee.wallet_address.ilike(search_pattern)) |
-                    (CustomerPayee.phone_number.ilike(search_pattern))
-                )
-            )
-            .all()
-        )
+            for tenant_id, delta in (admin_deltas or {}).items():
+                if not self._fiat_delta(
+                    [BankCustomerDetails.id == admin_ids[tenant_id]],
+                    delta, guard
+                ):
+                    self.db.rollback()
+                    return False
 
+            self.db.commit()
+            return True
+
+        except Exception:
+            self.db.rollback()
+            raise
 
-        
-    
     def get_tenant_id_by_address(self, wallet_address: str) -> Optional[int]:
-        user = self.db.query(BankCustomerDetails).filter_by(wallet_address=wallet_address).first()
+        user = self.get_customer_by_wallet(wallet_address)
         if user:
             return user.tenant_id
         return None
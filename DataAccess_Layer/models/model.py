@@ -20,10 +20,20 @@ class TenantDetails(Base):
     chain_id = Column(Integer, nullable=False)
     is_active = Column(Boolean, default=True)
 
+    # The tenant's admin account: central fiat balance and main wallet
+    admin_customer_id = Column(
+        Integer,
+        ForeignKey("bank_customer_details.id", ondelete="SET NULL", use_alter=True, name="fk_tenant_admin"),
+        nullable=True
+    )
+
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
-    customers = relationship("BankCustomerDetails", back_populates="tenant", cascade="all, delete")
+    customers = relationship(
+        "BankCustomerDetails", back_populates="tenant", cascade="all, delete",
+        foreign_keys="BankCustomerDetails.tenant_id"
+    )
 
     # NEW relationship (added only this line)
     tokens = relationship("TokenConfig", back_populates="tenant", cascade="all, delete")
@@ -99,7 +109,7 @@ class BankCustomerDetails(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
-    tenant = relationship("TenantDetails", back_populates="customers")
+    tenant = relationship("TenantDetails", back_populates="customers", foreign_keys=[tenant_id])
     payees = relationship("CustomerPayee", back_populates="customer", cascade="all, delete")
 
     __table_args__ = (
@@ -111,10 +121,14 @@ class BankCustomerDetails(Base):
 
         Index("idx_customer_tenant", "tenant_id"),
         Index("idx_customer_active", "is_active"),
+        UniqueConstraint("wallet_address", name="unique_customer_wallet_address"),
+
+        Index("idx_customer_customer_id", "customer_id"),
         Index("idx_customer_mail", "mail"),
         Index("idx_customer_phone", "phone_number"),
-        Index("idx_customer_wallet", "wallet_address"),
         Index("idx_customer_bank_account", "bank_account_number"),
+        Index("idx_customer_tenant_name", "tenant_id", "name"),
+        Index("ft_customer_name", "name", mysql_prefix="FULLTEXT"),
     )
 
 
@@ -156,4 +170,6 @@ class CustomerPayee(Base):
         Index("idx_payee_wallet", "wallet_address"),
         Index("idx_payee_active", "is_active"),
         Index("idx_payee_favorite", "customer_id", "is_favorite"),
+        Index("idx_payee_customer_name", "customer_id", "payee_name"),
+        Index("idx_payee_customer_phone", "customer_id", "phone_number"),
     )
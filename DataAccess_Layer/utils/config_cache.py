@@ -0,0 +1,178 @@
+"""
+Config Cache - Process-wide read-through cache of tenant / token config
+
+Tenant and token rows change a few times a month but are read on every
+balance, mint, burn and transfer. Reads are served from memory as
+detached snapshots (plain attribute objects, safe to share across
+sessions and threads).
+
+Writes through TenantDAO / TokenDAO bump a version in Redis and publish
+the change, stamped with it, on CONFIG_CHANNEL; every worker's subscriber
+thread drops the affected entries. A worker that resubscribes compares
+the version with the last one it saw and flushes everything only if it
+missed a change. CONFIG_CACHE_TTL bounds staleness while Redis is
+unreachable.
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from types import SimpleNamespace
+from typing import Any, Callable, Hashable, Optional
+from sqlalchemy import inspect
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+CONFIG_CACHE_TTL = int(os.getenv("CONFIG_CACHE_TTL", 300))
+CONFIG_CHANNEL = "config_changes"
+
+TENANT = "tenant"
+TOKENS = "tokens"  # every token of a tenant (active or not), keyed by tenant id
+
+_MISSING = object()
+
+
+def snapshot(row) -> Optional[SimpleNamespace]:
+    """Detached copy of an ORM row's column attributes"""
+    if row is None:
+        return None
+
+    return SimpleNamespace(**{
+        attr.key: getattr(row, attr.key)
+        for attr in inspect(row).mapper.column_attrs
+    })
+
+
+class ConfigCache:
+
+    MISSING = _MISSING
+
+    def __init__(self):
+        self._entries = {}        # (kind, key) -> (value, cached_at)
+        self._generation = 0      # bumped on every invalidation
+        self._version = None      # last Redis config_version this process caught up to
+        self._lock = threading.Lock()
+        self._listener = None
+        self._redis = None
+
+    # ---------------- READS ---------------- #
+
+    def get(self, kind: str, key: Hashable) -> Any:
+        """Cached value, or _MISSING"""
+        self._listen()
+
+        entry = self._entries.get((kind, key))
+        if entry is None or time.monotonic() - entry[1] > CONFIG_CACHE_TTL:
+            return _MISSING
+        return entry[0]
+
+    def generation(self) -> int:
+        return self._generation
+
+    def put(self, kind: str, key: Hashable, value: Any, generation: int):
+        """
+        Store a loaded value unless an invalidation arrived while it was
+        being loaded (the value may then predate the change)
+        """
+        if value is None:
+            return  # a tenant created later must not stay a miss
+
+        with self._lock:
+            if generation == self._generation:
+                self._entries[(kind, key)] = (value, time.monotonic())
+
+    def get_or_load(self, kind: str, key: Hashable, loader: Callable[[], Any]) -> Any:
+        value = self.get(kind, key)
+        if value is not _MISSING:
+            return value
+
+        generation = self.generation()
+        value = loader()
+        self.put(kind, key, value, generation)
+        return value
+
+    # ---------------- INVALIDATION ---------------- #
+
+    def invalidate(self, kind: Optional[str] = None, key: Hashable = None):
+        with self._lock:
+            self._generation += 1
+
+            if kind is None:
+                self._entries.clear()
+            else:
+                self._entries.pop((kind, key), None)
+
+    def _shared(self):
+        if self._redis is None:
+            from utils.redis_client import RedisClient
+            self._redis = RedisClient()
+        return self._redis
+
+    def notify(self, kind: str, key: Hashable):
+        """Invalidate locally and on every other worker"""
+        self.invalidate(kind, key)
+
+        version = self._shared().publish_config_change(
+            CONFIG_CHANNEL, json.dumps({"kind": kind, "key": key})
+        )
+        logger.info(f"📣 Config change {kind}:{key} (version {version})")
+
+    # ---------------- SUBSCRIBER ---------------- #
+
+    def _run_listener(self):
+        while True:
+            pubsub = None
+            try:
+                pubsub = self._shared().subscribe_config_changes(CONFIG_CHANNEL)
+                if pubsub is None:
+                    time.sleep(CONFIG_CACHE_TTL)
+                    continue
+
+                # Changes may have been missed while unsubscribed
+                version = self._shared().get_config_version()
+                if version is None or version != self._version:
+                    self.invalidate()
+                self._version = version
+
+                while True:
+                    # Short polls rather than listen(): a blocking read
+                    # would trip the pool's socket timeout when idle
+                    message = pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message is None:
+                        continue
+
+                    change = json.loads(message["data"])
+                    self.invalidate(change["kind"], change["key"])
+
+                    if change.get("version") is not None:
+                        self._version = max(self._version or 0, change["version"])
+
+            except Exception as e:
+                logger.warning(f"Config change listener reconnecting: {e}")
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+                time.sleep(5)
+
+    def _listen(self):
+        if self._listener is not None:
+            return
+
+        with self._lock:
+            if self._listener is None:
+                self._listener = threading.Thread(
+                    target=self._run_listener,
+                    name="config-changes",
+                    daemon=True
+                )
+                self._listener.start()
+
+
+CONFIG_CACHE = ConfigCache()
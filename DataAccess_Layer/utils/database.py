@@ -3,6 +3,7 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker,Session
 from dotenv import load_dotenv
 import os
+import threading
 from contextvars import ContextVar
 
 
@@ -18,19 +19,70 @@ DB_NAME = os.getenv("DB_NAME")
 DB_DRIVER = os.getenv("DB_DRIVER")
 
 DB_URL = f"{DB_DRIVER}://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
-engine = create_engine(
-    DB_URL,
-    pool_size=15,           # a bit higher base pool
-    max_overflow=30,        # handle burst traffic
-    pool_timeout=15,        # fail fast if pool exhausted
-    pool_recycle=1800,      # 30 min recycling (less chance of stale)
-    pool_pre_ping=True,     # 🔥 must enable this for cloud DBs
-    connect_args={"connect_timeout": 10},  # abort quickly on bad network
-    echo=False,
-)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Built on first use, so the models (Base) import without DB_* settings,
+# e.g. for query_plan_check.py against another database
+_engine = None
+_engine_lock = threading.Lock()
+_session_factory = sessionmaker(autocommit=False, autoflush=False)
+
+def get_engine():
+    global _engine
+
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = create_engine(
+                    DB_URL,
+                    pool_size=15,           # a bit higher base pool
+                    max_overflow=30,        # handle burst traffic
+                    pool_timeout=15,        # fail fast if pool exhausted
+                    pool_recycle=1800,      # 30 min recycling (less chance of stale)
+                    pool_pre_ping=True,     # 🔥 must enable this for cloud DBs
+                    connect_args={"connect_timeout": 10},  # abort quickly on bad network
+                    echo=False,
+                )
+                _session_factory.configure(bind=_engine)
+
+    return _engine
+
+def SessionLocal() -> Session:
+    get_engine()
+    return _session_factory()
+
 Base = declarative_base()
 
+# Async engine for the async routes (e.g. mysql+aiomysql). Built on first
+# use so the sync app still starts when the async driver isn't installed.
+ASYNC_DB_DRIVER = os.getenv("ASYNC_DB_DRIVER", "mysql+aiomysql")
+ASYNC_DB_URL = f"{ASYNC_DB_DRIVER}://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+
+_async_session_factory = None
+
+def get_async_session_factory():
+    global _async_session_factory
+
+    if _async_session_factory is None:
+        from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+        async_engine = create_async_engine(
+            ASYNC_DB_URL,
+            pool_size=15,
+            max_overflow=30,
+            pool_timeout=15,
+            pool_recycle=1800,
+            pool_pre_ping=True,
+            connect_args={"connect_timeout": 10},
+            echo=False,
+        )
+        _async_session_factory = async_sessionmaker(
+            bind=async_engine,
+            autoflush=False,
+            expire_on_commit=False,
+        )
+
+    return _async_session_factory
+
 # ✅ Context variable for session
 _db_context: ContextVar[Session] = ContextVar("db_session", default=None)
 
@@ -0,0 +1,61 @@
+"""
+Identity Cache - Per-session memo of DAO lookups
+
+A request shares one Session across its DAOs, so lookups are memoized in
+session.info under (table, key) and each row is loaded at most once per
+request. Cached ORM objects are still expired on commit as usual, so a
+value read after a write reflects the write; rollbacks drop the cache.
+
+DAO writes that change which row a key maps to call forget().
+"""
+
+from typing import Any, Callable, Hashable
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+IDENTITY_CACHE_KEY = "identity_cache"
+
+_MISSING = object()
+
+
+def _cache(db: Session) -> dict:
+    return db.info.setdefault(IDENTITY_CACHE_KEY, {})
+
+
+def load_once(db: Session, table: str, key: Hashable, loader: Callable[[], Any]) -> Any:
+    """Return the memoized value for (table, key), calling loader on first use"""
+    cache = _cache(db)
+
+    value = cache.get((table, key), _MISSING)
+    if value is _MISSING:
+        value = loader()
+        cache[(table, key)] = value
+
+    return value
+
+
+def peek(db: Session, table: str, key: Hashable, default: Any = None) -> Any:
+    """Memoized value if already loaded, without querying"""
+    return _cache(db).get((table, key), default)
+
+
+def prime(db: Session, table: str, key: Hashable, value: Any):
+    """Seed the cache with a value loaded by a wider query"""
+    _cache(db)[(table, key)] = value
+
+
+def forget(db: Session, table: str, key: Hashable = _MISSING):
+    """Drop one key, or every key of a table"""
+    cache = _cache(db)
+
+    if key is not _MISSING:
+        cache.pop((table, key), None)
+        return
+
+    for cached in [k for k in cache if k[0] == table]:
+        del cache[cached]
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_on_rollback(session):
+    session.info.pop(IDENTITY_CACHE_KEY, None)
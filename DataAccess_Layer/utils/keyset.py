@@ -0,0 +1,38 @@
+"""
+Keyset - Constant-cost pagination over an auto-increment id
+
+Pages are read as WHERE id > :after ORDER BY id LIMIT n, which walks the
+primary key (or the id suffix of a secondary index) from the last row
+seen. Unlike OFFSET, page 10,000 costs the same as page 1.
+"""
+
+from typing import List, Optional, Tuple
+
+PAGE_DEFAULT_LIMIT = 100
+PAGE_MAX_LIMIT = 500
+
+
+def keyset_page(query, id_column, limit: int, after_id: Optional[int] = None) -> Tuple[List, Optional[int]]:
+    """
+    One page of `query` ordered by `id_column`
+
+    Args:
+        query: Filtered SQLAlchemy query whose rows expose `id_column`
+        id_column: Monotonic key column, e.g. Model.id
+        limit: Page size
+        after_id: Last id of the previous page, None for the first page
+
+    Returns:
+        (rows, next_after_id); next_after_id is None on the last page
+    """
+    if after_id is not None:
+        query = query.filter(id_column > after_id)
+
+    # One extra row tells whether another page exists
+    rows = query.order_by(id_column).limit(limit + 1).all()
+
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    return rows, getattr(rows[-1], id_column.key)
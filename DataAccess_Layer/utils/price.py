@@ -1,14 +1,64 @@
+"""
+Price Oracle - USD -> INR rate with in-process + Redis caching
+
+Steady-state lookups are served from memory. Once a value is older than
+PRICE_FRESH_SECONDS it is still served (up to the caller's max staleness)
+while one background thread refreshes it; only a missing or too-stale
+value blocks, and concurrent callers share that single fetch.
+"""
+
+import os
+import json
+import time
+import threading
+import logging
 import requests
 from decimal import Decimal
+from typing import Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
 
 COINGECKO_URL = (
     "https://api.coingecko.com/api/v3/simple/price"
     "?ids=tether,usd-coin&vs_currencies=inr"
 )
 
-def get_usd_to_inr_rate() -> Decimal:
-    try:
-        response = requests.get(COINGECKO_URL, timeout=5)
+PRICE_SOURCE = os.getenv("PRICE_SOURCE", "coingecko")
+PRICE_FRESH_SECONDS = int(os.getenv("PRICE_FRESH_SECONDS", 60))
+PRICE_MIN_FETCH_INTERVAL = int(os.getenv("PRICE_MIN_FETCH_INTERVAL", 10))
+
+# Oldest rate each operation may settle fiat with (override with
+# PRICE_MAX_STALENESS_<OPERATION>); payouts are the strictest.
+OPERATION_MAX_STALENESS = {
+    "faucet": 300,
+    "mint": 300,
+    "burn": 120,
+}
+DEFAULT_MAX_STALENESS = 900
+
+
+def max_staleness_for(operation: Optional[str]) -> int:
+    if operation is None:
+        return DEFAULT_MAX_STALENESS
+    return int(os.getenv(
+        f"PRICE_MAX_STALENESS_{operation.upper()}",
+        OPERATION_MAX_STALENESS.get(operation, DEFAULT_MAX_STALENESS)
+    ))
+
+
+# ---------------- SOURCES ---------------- #
+
+class CoinGeckoSource:
+    name = "coingecko"
+
+    def __init__(self):
+        self.session = requests.Session()
+
+    def fetch(self) -> Decimal:
+        response = self.session.get(COINGECKO_URL, timeout=5)
         response.raise_for_status()
 
         data = response.json()
@@ -24,5 +74,163 @@ def get_usd_to_inr_rate() -> Decimal:
 
         return Decimal(str(inr_rate))
 
-    except Exception as e:
-        raise RuntimeError(f"Failed to fetch INR rate: {e}")
+
+class StaticSource:
+    """Fixed rate from PRICE_STATIC_USD_INR - for offline runs and tests"""
+    name = "static"
+
+    def fetch(self) -> Decimal:
+        return Decimal(os.getenv("PRICE_STATIC_USD_INR", "83"))
+
+
+class FileSource:
+    """Rate read from a JSON file ({"usd_inr": 83.2}) at PRICE_FILE"""
+    name = "file"
+
+    def fetch(self) -> Decimal:
+        with open(os.getenv("PRICE_FILE", "price.json")) as f:
+            return Decimal(str(json.load(f)["usd_inr"]))
+
+
+PRICE_SOURCES = {
+    "coingecko": CoinGeckoSource,
+    "static": StaticSource,
+    "file": FileSource,
+}
+
+
+# ---------------- ORACLE ---------------- #
+
+class PriceOracle:
+
+    def __init__(self, source=None):
+        self.source = source or PRICE_SOURCES[PRICE_SOURCE]()
+
+        self._rate: Optional[Decimal] = None
+        self._fetched_at = 0.0       # wall clock, shared with other workers via Redis
+        self._last_attempt = 0.0
+
+        self._fetch_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self._refreshing = False
+        self._redis = None
+
+    # ---------------- SHARED COPY ---------------- #
+
+    def _shared(self):
+        if self._redis is None:
+            from utils.redis_client import RedisClient
+            self._redis = RedisClient()
+        return self._redis
+
+    def _adopt_shared(self) -> bool:
+        """Take another worker's newer rate from Redis, if there is one"""
+        cached = self._shared().cache_get("fx_rate", "usd_inr", self.source.name)
+        if cached and cached["fetched_at"] > self._fetched_at:
+            self._rate = Decimal(cached["rate"])
+            self._fetched_at = cached["fetched_at"]
+            return True
+        return False
+
+    def _store(self, rate: Decimal):
+        self._rate = rate
+        self._fetched_at = time.time()
+        self._shared().cache_set(
+            "fx_rate", "usd_inr", self.source.name,
+            value={"rate": str(rate), "fetched_at": self._fetched_at}
+        )
+
+    # ---------------- FETCHING ---------------- #
+
+    def _age(self) -> float:
+        return time.time() - self._fetched_at if self._rate is not None else float("inf")
+
+    def _fetch(self):
+        """Refresh from the source; caller holds _fetch_lock"""
+        if self._adopt_shared() and self._age() <= PRICE_FRESH_SECONDS:
+            return
+
+        # Rate-limit the upstream even when every fetch is failing
+        if time.time() - self._last_attempt < PRICE_MIN_FETCH_INTERVAL:
+            return
+
+        self._last_attempt = time.time()
+        rate = self.source.fetch()
+        self._store(rate)
+        logger.info(f"💱 USD/INR refreshed from {self.source.name}: {rate}")
+
+    def _refresh_in_background(self):
+        with self._state_lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def run():
+            try:
+                with self._fetch_lock:
+                    self._fetch()
+            except Exception as e:
+                logger.warning(f"Background price refresh failed: {e}")
+            finally:
+                self._refreshing = False
+
+        threading.Thread(target=run, name="price-refresh", daemon=True).start()
+
+    def warm(self):
+        """Start loading the rate so the first request doesn't wait on it"""
+        self._refresh_in_background()
+
+    def get_rate(self, operation: Optional[str] = None) -> Decimal:
+        """
+        Current USD -> INR rate
+
+        Args:
+            operation: "faucet", "mint", "burn"... selects the max staleness
+
+        Raises:
+            RuntimeError: If no rate within the operation's max staleness
+                can be obtained
+        """
+        max_staleness = max_staleness_for(operation)
+
+        age = self._age()
+        if age <= PRICE_FRESH_SECONDS:
+            return self._rate
+
+        if age <= max_staleness:
+            self._refresh_in_background()
+            return self._rate
+
+        # Missing or too stale: block, but only one caller fetches
+        with self._fetch_lock:
+            if self._age() > max_staleness:
+                try:
+                    self._fetch()
+                except Exception as e:
+                    logger.error(f"Price fetch from {self.source.name} failed: {e}")
+
+            if self._age() > max_staleness:
+                raise RuntimeError(
+                    f"Failed to fetch INR rate: none within {max_staleness}s"
+                )
+
+            return self._rate
+
+
+_oracle: Optional[PriceOracle] = None
+_oracle_lock = threading.Lock()
+
+
+def get_price_oracle() -> PriceOracle:
+    global _oracle
+
+    if _oracle is None:
+        with _oracle_lock:
+            if _oracle is None:
+                _oracle = PriceOracle()
+
+    return _oracle
+
+
+def get_usd_to_inr_rate(operation: Optional[str] = None) -> Decimal:
+    return get_price_oracle().get_rate(operation)
@@ -1,4 +1,4 @@
-from ..utils.database import SessionLocal
+from ..utils.database import SessionLocal, get_async_session_factory
 
 def get_db():
     db = SessionLocal()
@@ -6,3 +6,7 @@ def get_db():
         yield db
     finally:
         db.close()
+
+async def get_async_db():
+    async with get_async_session_factory()() as db:
+        yield db
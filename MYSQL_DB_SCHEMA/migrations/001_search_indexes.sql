@@ -0,0 +1,19 @@
+-- Indexes behind /wallet/search-users and /wallet/search-payees
+--
+-- Searches are prefix lookups inside one tenant (or one customer's payees):
+--   wallet address prefix -> unique_tenant_wallet    (tenant_id, wallet_address)
+--   phone prefix          -> unique_tenant_phone     (tenant_id, phone_number)
+--   name prefix           -> idx_customer_tenant_name (tenant_id, name)
+--   name word prefix      -> ft_customer_name        FULLTEXT (name)
+--
+-- Set SEARCH_FULLTEXT=false on the API until this has been applied.
+
+USE stablecoin_bank_core;
+
+ALTER TABLE bank_customer_details
+    ADD INDEX idx_customer_tenant_name (tenant_id, name),
+    ADD FULLTEXT INDEX ft_customer_name (name);
+
+ALTER TABLE customer_payees
+    ADD INDEX idx_payee_customer_name (customer_id, payee_name),
+    ADD INDEX idx_payee_customer_phone (customer_id, phone_number);
@@ -0,0 +1,21 @@
+-- Indexes behind the remaining DAO lookups
+--
+-- Every DAO query is matched to an index (verify with query_plan_check.py):
+--   customer_id alone                  -> idx_customer_customer_id       (new)
+--   (customer_id, tenant_id)           -> unique_tenant_customer_id      (tenant_id, customer_id)
+--   tenant admin, customer_id 'ADMI%'  -> unique_tenant_customer_id      range on the prefix
+--   wallet_address                     -> unique_customer_wallet_address (new, replaces idx_customer_wallet)
+--   (tenant_id, token_symbol)          -> unique_token_per_tenant        is_active filters the single row
+--   payee (customer_id, id) pages      -> idx_payee_customer             InnoDB appends the primary key
+--
+-- The wallet address becomes globally unique. Check for existing duplicates
+-- first; this should return no rows:
+--   SELECT wallet_address, COUNT(*) FROM bank_customer_details
+--   WHERE wallet_address IS NOT NULL GROUP BY wallet_address HAVING COUNT(*) > 1;
+
+USE stablecoin_bank_core;
+
+ALTER TABLE bank_customer_details
+    ADD INDEX idx_customer_customer_id (customer_id),
+    ADD UNIQUE KEY unique_customer_wallet_address (wallet_address),
+    DROP INDEX idx_customer_wallet;
@@ -0,0 +1,26 @@
+-- Explicit tenant admin reference
+--
+-- The admin account (central fiat balance, main wallet) was found with
+-- customer_id LIKE 'ADMI%' on every mint, burn, faucet and history call.
+-- tenant_details.admin_customer_id now points at it, so the lookup is a
+-- primary-key read through the cached tenant config. Tenants left NULL
+-- keep working through the old lookup until set.
+
+USE stablecoin_bank_core;
+
+ALTER TABLE tenant_details
+    ADD COLUMN admin_customer_id INT NULL AFTER is_active,
+    ADD CONSTRAINT fk_tenant_admin
+        FOREIGN KEY (admin_customer_id)
+        REFERENCES bank_customer_details(id)
+        ON DELETE SET NULL;
+
+-- Backfill from the existing 'ADMI%' accounts (lowest id per tenant)
+UPDATE tenant_details t
+JOIN (
+    SELECT tenant_id, MIN(id) AS admin_id
+    FROM bank_customer_details
+    WHERE customer_id LIKE 'ADMI%'
+    GROUP BY tenant_id
+) a ON a.tenant_id = t.id
+SET t.admin_customer_id = a.admin_id;
@@ -8,6 +8,7 @@ CREATE TABLE tenant_details (
     rpc_url VARCHAR(200) NOT NULL,
     chain_id INT NOT NULL,
     is_active BOOLEAN DEFAULT TRUE,
+    admin_customer_id INT NULL, -- Tenant admin account (fk_tenant_admin, added below)
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     INDEX idx_tenant_active (is_active),
@@ -37,16 +38,43 @@ CREATE TABLE bank_customer_details (
         ON DELETE CASCADE,
     INDEX idx_customer_tenant (tenant_id),
     INDEX idx_customer_active (is_active),
+    INDEX idx_customer_customer_id (customer_id),
     INDEX idx_customer_mail (mail),
     INDEX idx_customer_phone (phone_number),
-    INDEX idx_customer_wallet (wallet_address),
     INDEX idx_customer_bank_account (bank_account_number),
+    INDEX idx_customer_tenant_name (tenant_id, name),
+    FULLTEXT INDEX ft_customer_name (name),
     -- Unique constraints per tenant
     UNIQUE KEY unique_tenant_customer_id (tenant_id, customer_id),
     UNIQUE KEY unique_tenant_mail (tenant_id, mail),
     UNIQUE KEY unique_tenant_phone (tenant_id, phone_number),
     UNIQUE KEY unique_tenant_bank_account (tenant_id, bank_account_number),
-    UNIQUE KEY unique_tenant_wallet (tenant_id, wallet_address)
+    UNIQUE KEY unique_tenant_wallet (tenant_id, wallet_address),
+    -- A wallet belongs to one customer across all tenants
+    UNIQUE KEY unique_customer_wallet_address (wallet_address)
+);
+
+-- Token contracts configured per tenant
+CREATE TABLE token_config (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    tenant_id INT NOT NULL,
+    token_symbol VARCHAR(20) NOT NULL,
+    contract_address VARCHAR(100) NOT NULL,
+    central_wallet_address VARCHAR(100) NOT NULL,
+    encrypted_private_key TEXT NOT NULL,
+    mint_enabled BOOLEAN DEFAULT FALSE,
+    burn_enabled BOOLEAN DEFAULT FALSE,
+    decimals INT DEFAULT 18,
+    is_active BOOLEAN DEFAULT TRUE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    CONSTRAINT fk_token_tenant
+        FOREIGN KEY (tenant_id)
+        REFERENCES tenant_details(id)
+        ON DELETE CASCADE,
+    INDEX idx_token_tenant (tenant_id),
+    INDEX idx_token_active (is_active),
+    UNIQUE KEY unique_token_per_tenant (tenant_id, token_symbol)
 );
 
 -- Customer's Payees (beneficiaries/recipients)
@@ -74,6 +102,15 @@ CREATE TABLE customer_payees (
     INDEX idx_payee_wallet (wallet_address),
     INDEX idx_payee_active (is_active),
     INDEX idx_payee_favorite (customer_id, is_favorite),
+    INDEX idx_payee_customer_name (customer_id, payee_name),
+    INDEX idx_payee_customer_phone (customer_id, phone_number),
     -- Each customer can save each wallet address only once
     UNIQUE KEY unique_customer_wallet (customer_id, wallet_address)
-);
\ No newline at end of file
+);
+
+-- Tenant admin reference, added once bank_customer_details exists
+ALTER TABLE tenant_details
+    ADD CONSTRAINT fk_tenant_admin
+        FOREIGN KEY (admin_customer_id)
+        REFERENCES bank_customer_details(id)
+        ON DELETE SET NULL;
@@ -1,7 +1,17 @@
 import os
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+import logging
 from API_Layer.Routes import wallet_routes, authentication_route, transaction_history_route, bank_detail_route,stablecoin_behaviour_route
+from Business_Layer.transaction_indexer import INDEXER_ENABLED, get_tenderly_indexer
+from utils.redis_client import RedisClient
+from DataAccess_Layer.utils.price import get_price_oracle
+from utils.web3_client import rpc_health
+from Business_Layer.search_service import SEARCH_CACHE
+from Business_Layer.receipt_tracker import get_receipt_tracker
+from Business_Layer.batch_job_service import start_reconciler
+
+logger = logging.getLogger(__name__)
 
 FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:3000")
 
@@ -13,7 +23,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
-    expose_headers=["Content-Disposition"],
+    expose_headers=["Content-Disposition", "X-Next-Cursor"],
     max_age=3600,
 )
 
@@ -23,6 +33,35 @@ app.include_router(transaction_history_route.router, prefix="/transactions", tag
 app.include_router(bank_detail_route.router, prefix="/bank_details", tags=["Bank Details"])
 app.include_router(stablecoin_behaviour_route.router, prefix="/stablecoin", tags=["Stablecoin Behaviour"])
 
+@app.on_event("startup")
+def start_background_workers():
+    if INDEXER_ENABLED:
+        try:
+            get_tenderly_indexer().start()
+        except Exception as e:
+            logger.error(f"Transaction indexer not started: {e}")
+
+    # Resume settlements a previous process left pending
+    get_receipt_tracker().start()
+
+    # Refund batch reservations of jobs a previous process never finished
+    start_reconciler()
+
+    # Load the FX rate before the first mint / faucet request needs it
+    get_price_oracle().warm()
+
 @app.get("/")
 def root():
     return {"message": "Tenderly Wallet API running"}
+
+@app.get("/cache/stats")
+def cache_stats():
+    """Per-namespace cache hit/miss counters for this worker"""
+    stats = RedisClient.get_cache_stats()
+    stats["search_sessions"] = SEARCH_CACHE.stats()
+    return stats
+
+@app.get("/health/rpc")
+def rpc_health_status():
+    """Background reachability checks of the RPCs this worker has used"""
+    return rpc_health()
@@ -0,0 +1,327 @@
+"""
+Query Plan Check - Fail when a DAO query can't use an index
+
+Runs every public DAO method in DataAccess_Layer/dao against a database,
+captures every statement they issue and EXPLAINs it. A statement that
+scans a whole table with no usable index is reported and the script
+exits non-zero, so it can gate schema or DAO changes in CI. So does a
+DAO method that is neither checked (CHECKS) nor deliberately skipped
+(SKIPPED), so a new query can't go unchecked.
+
+    python query_plan_check.py                  # DB_* settings from .env (MySQL)
+    python query_plan_check.py --url sqlite://  # in-memory SQLite stand-in
+
+Fixture rows are inserted inside a transaction that is rolled back, so a
+shared database is left untouched; each check runs in its own savepoint,
+so writes (deactivations, deletes) don't leak into the next one.
+FULLTEXT searches are only checked on MySQL.
+"""
+
+import re
+import sys
+import asyncio
+import inspect
+import argparse
+from types import SimpleNamespace
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from DataAccess_Layer.utils.database import Base, DB_URL
+from DataAccess_Layer.utils.config_cache import CONFIG_CACHE
+from DataAccess_Layer.models.model import TenantDetails, TokenConfig, BankCustomerDetails, CustomerPayee
+from DataAccess_Layer.dao.authentication_dao import UserAuthDAO
+from DataAccess_Layer.dao.bank_detail_dao import BankDetailDAO
+from DataAccess_Layer.dao.search_dao import SearchDAO
+from DataAccess_Layer.dao.tenant_dao import TenantDAO
+from DataAccess_Layer.dao.token_dao import TokenDAO
+from DataAccess_Layer.dao.wallet_dao import WalletDAO
+from DataAccess_Layer.dao.async_wallet_dao import AsyncWalletDAO
+
+WALLET = "0x" + "1" * 40
+ADMIN_WALLET = "0x" + "2" * 40
+PAYEE_WALLET = "0x" + "3" * 40
+
+EXPLAINED = re.compile(r"^\s*(SELECT|UPDATE|DELETE)\b", re.IGNORECASE)
+
+
+# ---------------- FIXTURES ---------------- #
+
+def seed(db: Session) -> SimpleNamespace:
+    """One tenant, customer, admin, payee and token, so every DAO path runs"""
+    tenant = TenantDetails(tenant_name="query-plan-check", rpc_url="http://localhost:8545", chain_id=1)
+    db.add(tenant)
+    db.flush()
+
+    customer = BankCustomerDetails(
+        tenant_id=tenant.id, customer_id="PLANCHK1", mail="plan@check.local",
+        name="Plan Check", password="-", phone_number="9000000001",
+        wallet_address=WALLET, fiat_bank_balance=100
+    )
+    admin = BankCustomerDetails(
+        tenant_id=tenant.id, customer_id="ADMIPLAN", mail="admin@check.local",
+        name="Plan Admin", password="-", phone_number="9000000002",
+        wallet_address=ADMIN_WALLET, fiat_bank_balance=100
+    )
+    db.add_all([customer, admin])
+    db.flush()
+    tenant.admin_customer_id = admin.id
+
+    payee = CustomerPayee(
+        customer_id=customer.id, payee_name="Plan Payee",
+        phone_number="9000000003", wallet_address=PAYEE_WALLET
+    )
+    token = TokenConfig(
+        tenant_id=tenant.id, token_symbol="PLN", contract_address=PAYEE_WALLET,
+        central_wallet_address=ADMIN_WALLET, encrypted_private_key="-"
+    )
+    db.add_all([payee, token])
+    db.flush()
+
+    return SimpleNamespace(
+        tenant_id=tenant.id, customer_id=customer.customer_id,
+        owner_id=customer.id, admin_id=admin.id, payee_id=payee.id
+    )
+
+
+def profile(**overrides) -> SimpleNamespace:
+    """Request body for the customer profile updates"""
+    fields = dict(
+        mail="plan@check.local", name="Plan Check", password="-",
+        phone_number="9000000001", bank_account_number=None,
+        is_active=True, fiat_bank_balance=None
+    )
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+class AsyncSessionShim:
+    """Runs AsyncWalletDAO's statements on the check's sync session"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    async def execute(self, statement):
+        return self.db.execute(statement)
+
+
+def run_async(db: Session, method: str, *args):
+    return asyncio.run(getattr(AsyncWalletDAO(AsyncSessionShim(db)), method)(*args))
+
+
+# ---------------- CHECKS ---------------- #
+#
+# (name, call, mysql_only). Listings are checked past the first page: the
+# first page starts the primary key walk that later pages resume. Names
+# are "Class.method", optionally followed by " (variant)".
+
+CHECKS = [
+    ("UserAuthDAO.get_last_customer_id", lambda db, f: UserAuthDAO(db).get_last_customer_id(f.tenant_id), False),
+    ("UserAuthDAO.get_user_by_email", lambda db, f: UserAuthDAO(db).get_user_by_email("plan@check.local"), False),
+    ("UserAuthDAO.get_user_by_customer_id", lambda db, f: UserAuthDAO(db).get_user_by_customer_id(f.customer_id), False),
+    ("UserAuthDAO.get_user_by_customer_id_tenant_id", lambda db, f: UserAuthDAO(db).get_user_by_customer_id_tenant_id(f.customer_id, f.tenant_id), False),
+    ("UserAuthDAO.checking_customer_existing", lambda db, f: UserAuthDAO(db).checking_customer_existing(f.customer_id, f.tenant_id, "9000000001"), False),
+    ("UserAuthDAO.get_users_page", lambda db, f: UserAuthDAO(db).get_users_page(50, after_id=0), False),
+    ("UserAuthDAO.get_users_page (tenant)", lambda db, f: UserAuthDAO(db).get_users_page(50, after_id=0, tenant_id=f.tenant_id), False),
+    ("UserAuthDAO.get_main_wallet_address", lambda db, f: UserAuthDAO(db).get_main_wallet_address(f.tenant_id), False),
+    ("UserAuthDAO.get_admin_details", lambda db, f: UserAuthDAO(db).get_admin_details(f.tenant_id), False),
+    ("UserAuthDAO.get_user_by_id", lambda db, f: UserAuthDAO(db).get_user_by_id(f.owner_id), False),
+    ("UserAuthDAO.create_user", lambda db, f: UserAuthDAO(db).create_user(f.tenant_id, "PLANCHK2", "plan2@check.local", "Plan Two", "-", "9000000004", None), False),
+    ("UserAuthDAO.create_wallet_for_user", lambda db, f: UserAuthDAO(db).create_wallet_for_user(f.customer_id, f.tenant_id, WALLET, "-"), False),
+    ("UserAuthDAO.update_user", lambda db, f: UserAuthDAO(db).update_user(f.owner_id, name="Plan Check"), False),
+    ("UserAuthDAO.update_user_password", lambda db, f: UserAuthDAO(db).update_user_password(f.owner_id, "-"), False),
+
+    ("BankDetailDAO.get_user_by_customer_id", lambda db, f: BankDetailDAO(db).get_user_by_customer_id(f.customer_id), False),
+    ("BankDetailDAO.get_user_by_customer_id_and_tenant_id", lambda db, f: BankDetailDAO(db).get_user_by_customer_id_and_tenant_id(f.customer_id, f.tenant_id), False),
+    ("BankDetailDAO.add_fiat_balance", lambda db, f: BankDetailDAO(db).add_fiat_balance(f.tenant_id, f.customer_id, 1), False),
+    ("BankDetailDAO.get_payees", lambda db, f: BankDetailDAO(db).get_payees(f.owner_id, 50, after_id=0), False),
+    ("BankDetailDAO.get_payee_by_id", lambda db, f: BankDetailDAO(db).get_payee_by_id(f.payee_id), False),
+    ("BankDetailDAO.get_payee_by_wallet_address_and_user_id", lambda db, f: BankDetailDAO(db).get_payee_by_wallet_address_and_user_id(PAYEE_WALLET, f.owner_id), False),
+    ("BankDetailDAO.update_user_details", lambda db, f: BankDetailDAO(db).update_user_details(f.customer_id, profile()), False),
+    ("BankDetailDAO.admin_update_user_details", lambda db, f: BankDetailDAO(db).admin_update_user_details(f.customer_id, profile(bank_account_number="000111")), False),
+    ("BankDetailDAO.create_payee", lambda db, f: BankDetailDAO(db).create_payee(f.owner_id, SimpleNamespace(payee_name="Plan Payee 2", phone_number="9000000005", bank_account_number=None, wallet_address=ADMIN_WALLET, nickname=None, is_favorite=False, is_active=True)), False),
+    ("BankDetailDAO.delete_payee", lambda db, f: BankDetailDAO(db).delete_payee(f.payee_id), False),
+
+    ("TenantDAO.get_tenant_by_id", lambda db, f: TenantDAO(db).get_tenant_by_id(f.tenant_id), False),
+    ("TenantDAO.get_tenant_by_name", lambda db, f: TenantDAO(db).get_tenant_by_name("query-plan-check"), False),
+    ("TenantDAO.get_admin_id", lambda db, f: TenantDAO(db).get_admin_id(f.tenant_id), False),
+    ("TenantDAO.get_tenants_page", lambda db, f: TenantDAO(db).get_tenants_page(50, after_id=0), False),
+    ("TenantDAO.tenant_has_tokens", lambda db, f: TenantDAO(db).tenant_has_tokens(f.tenant_id), False),
+    ("TenantDAO.get_tenant_with_tokens", lambda db, f: TenantDAO(db).get_tenant_with_tokens(f.tenant_id), False),
+    ("TenantDAO.get_rpc_by_tenant_id", lambda db, f: TenantDAO(db).get_rpc_by_tenant_id(f.tenant_id), False),
+    ("TenantDAO.create_tenant", lambda db, f: TenantDAO(db).create_tenant("query-plan-check-2", "http://localhost:8545", 1), False),
+    ("TenantDAO.set_admin", lambda db, f: TenantDAO(db).set_admin(f.tenant_id, f.admin_id), False),
+    ("TenantDAO.update_tenant", lambda db, f: TenantDAO(db).update_tenant(f.tenant_id, rpc_url="http://localhost:8546"), False),
+    ("TenantDAO.deactivate_tenant", lambda db, f: TenantDAO(db).deactivate_tenant(f.tenant_id), False),
+
+    ("TokenDAO.get_token_by_symbol", lambda db, f: TokenDAO(db).get_token_by_symbol(f.tenant_id, "PLN"), False),
+    ("TokenDAO._load_token", lambda db, f: TokenDAO(db)._load_token(f.tenant_id, "PLN"), False),
+    ("TokenDAO.get_contract_address", lambda db, f: TokenDAO(db).get_contract_address(f.tenant_id, "PLN"), False),
+    ("TokenDAO.get_central_wallet", lambda db, f: TokenDAO(db).get_central_wallet(f.tenant_id, "PLN"), False),
+    ("TokenDAO.get_private_key", lambda db, f: TokenDAO(db).get_private_key(f.tenant_id, "PLN"), False),
+    ("TokenDAO.is_mint_enabled", lambda db, f: TokenDAO(db).is_mint_enabled(f.tenant_id, "PLN"), False),
+    ("TokenDAO.is_burn_enabled", lambda db, f: TokenDAO(db).is_burn_enabled(f.tenant_id, "PLN"), False),
+    ("TokenDAO.get_token_decimals", lambda db, f: TokenDAO(db).get_token_decimals(f.tenant_id, "PLN"), False),
+    ("TokenDAO.get_tokens_by_tenant", lambda db, f: TokenDAO(db).get_tokens_by_tenant(f.tenant_id), False),
+    ("TokenDAO.get_all_tokens_by_tenant", lambda db, f: TokenDAO(db).get_all_tokens_by_tenant(f.tenant_id), False),
+    ("TokenDAO.create_token", lambda db, f: TokenDAO(db).create_token(f.tenant_id, "PLN2", WALLET, ADMIN_WALLET, "-", True, True, 18), False),
+    ("TokenDAO.update_token", lambda db, f: TokenDAO(db).update_token(f.tenant_id, "PLN", mint_enabled=False), False),
+    ("TokenDAO.deactivate_token", lambda db, f: TokenDAO(db).deactivate_token(f.tenant_id, "PLN"), False),
+
+    ("WalletDAO.get_customer_by_wallet", lambda db, f: WalletDAO(db).get_customer_by_wallet(WALLET), False),
+    ("WalletDAO.load_wallet_context", lambda db, f: WalletDAO(db).load_wallet_context(WALLET), False),
+    ("WalletDAO.get_private_key_by_address", lambda db, f: WalletDAO(db).get_private_key_by_address(WALLET), False),
+    ("WalletDAO.get_tenant_id_by_address", lambda db, f: WalletDAO(db).get_tenant_id_by_address(WALLET), False),
+    ("WalletDAO.get_fiat_bank_balance_by_wallet_address", lambda db, f: WalletDAO(db).get_fiat_bank_balance_by_wallet_address(WALLET), False),
+    ("WalletDAO.update_admin_fiat_bank_balance", lambda db, f: WalletDAO(db).update_admin_fiat_bank_balance(f.tenant_id, 1), False),
+    ("WalletDAO.get_wallet_users_page", lambda db, f: WalletDAO(db).get_wallet_users_page(50, after_id=0), False),
+    ("WalletDAO.get_wallet_holders (addresses)", lambda db, f: WalletDAO(db).get_wallet_holders([WALLET, ADMIN_WALLET]), False),
+    ("WalletDAO.get_wallet_holders (tenant)", lambda db, f: WalletDAO(db).get_wallet_holders(tenant_id=f.tenant_id), False),
+    ("WalletDAO.get_fiat_balance_by_customer_id", lambda db, f: WalletDAO(db).get_fiat_balance_by_customer_id(f.customer_id, f.tenant_id), False),
+    ("WalletDAO.apply_fiat_deltas", lambda db, f: WalletDAO(db).apply_fiat_deltas({WALLET: -1}, {f.tenant_id: 1}), False),
+
+    ("SearchDAO.search_users (address)", lambda db, f: SearchDAO(db).search_users("0x111", f.tenant_id, f.customer_id), False),
+    ("SearchDAO.search_users (phone)", lambda db, f: SearchDAO(db).search_users("90000", f.tenant_id, f.customer_id), False),
+    ("SearchDAO.search_users (name prefix)", lambda db, f: SearchDAO(db).search_users("Pl", f.tenant_id, f.customer_id), False),
+    ("SearchDAO.search_users (name words)", lambda db, f: SearchDAO(db).search_users("check", f.tenant_id, f.customer_id), True),
+    ("SearchDAO.search_payees", lambda db, f: SearchDAO(db).search_payees(f.customer_id, f.tenant_id, "Pla"), False),
+
+    ("AsyncWalletDAO.get_wallet_holder", lambda db, f: run_async(db, "get_wallet_holder", WALLET), False),
+    ("AsyncWalletDAO.tenant_has_tokens", lambda db, f: run_async(db, "tenant_has_tokens", f.tenant_id), False),
+    ("AsyncWalletDAO.get_tenant_by_id", lambda db, f: run_async(db, "get_tenant_by_id", f.tenant_id), False),
+    ("AsyncWalletDAO.get_tokens_by_tenant", lambda db, f: run_async(db, "get_tokens_by_tenant", f.tenant_id), False),
+]
+
+# Public DAO methods deliberately left out of CHECKS, with the reason
+SKIPPED = {
+    "UserAuthDAO.count_users": "whole-table count, a scan by definition",
+    "UserAuthDAO.count_active_users": "whole-table count, a scan by definition",
+}
+
+DAOS = [UserAuthDAO, BankDetailDAO, SearchDAO, TenantDAO, TokenDAO, WalletDAO, AsyncWalletDAO]
+
+
+def unchecked() -> list:
+    """Public DAO methods that are neither in CHECKS nor in SKIPPED"""
+    checked = {name.split(" (")[0] for name, _, _ in CHECKS}
+
+    return [
+        f"{dao.__name__}.{method}"
+        for dao in DAOS
+        for method, _ in inspect.getmembers(dao, inspect.isfunction)
+        if not method.startswith("_")
+        and f"{dao.__name__}.{method}" not in checked
+        and f"{dao.__name__}.{method}" not in SKIPPED
+    ]
+
+
+# ---------------- PLANS ---------------- #
+
+def full_scans(conn, statement: str, parameters, is_mysql: bool) -> list:
+    """Tables the statement reads without any usable index"""
+    if is_mysql:
+        rows = conn.exec_driver_sql(f"EXPLAIN {statement}", parameters).mappings().all()
+        # The optimizer may still pick ALL on tiny tables; possible_keys
+        # says whether an index could serve the query at all
+        return [
+            row["table"] for row in rows
+            if row["type"] == "ALL" and not row["possible_keys"]
+        ]
+
+    rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+    return [
+        row[-1] for row in rows
+        if re.match(r"SCAN (?!CONSTANT)", row[-1]) and "INDEX" not in row[-1]
+    ]
+
+
+def run(url: str) -> int:
+    engine = create_engine(url)
+    is_mysql = engine.dialect.name == "mysql"
+
+    if engine.dialect.name == "sqlite":
+        # pysqlite needs its own BEGIN for savepoints to nest correctly
+        @event.listens_for(engine, "connect")
+        def _connect(dbapi_connection, _):
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(engine, "begin")
+        def _begin(conn):
+            conn.exec_driver_sql("BEGIN")
+
+        Base.metadata.create_all(engine)
+
+    captured = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if conn.info.get("capturing") and EXPLAINED.match(statement):
+            captured.append((statement, parameters))
+
+    failures = 0
+
+    for name in unchecked():
+        failures += 1
+        print(f"❌ {name}: not in CHECKS or SKIPPED")
+
+    for name, reason in SKIPPED.items():
+        print(f"⏭️  {name} ({reason})")
+
+    with engine.connect() as conn:
+        outer = conn.begin()
+        try:
+            with Session(bind=conn, join_transaction_mode="create_savepoint") as db:
+                fixtures = seed(db)
+                db.commit()  # releases the savepoint; the outer transaction still rolls back
+
+            for name, call, mysql_only in CHECKS:
+                if mysql_only and not is_mysql:
+                    print(f"⏭️  {name} (MySQL only)")
+                    continue
+
+                # Config reads must reach the database, not this process' cache
+                CONFIG_CACHE.invalidate()
+                captured.clear()
+
+                # DAO writes commit their session, i.e. release its
+                # savepoint into this one, which is rolled back afterwards
+                checkpoint = conn.begin_nested()
+                conn.info["capturing"] = True
+                try:
+                    with Session(bind=conn, join_transaction_mode="create_savepoint") as db:
+                        call(db, fixtures)
+
+                    scans = [
+                        (statement, table)
+                        for statement, parameters in captured
+                        for table in full_scans(conn, statement, parameters, is_mysql)
+                    ]
+                except Exception as e:
+                    failures += 1
+                    print(f"❌ {name}: raised {e!r}")
+                    continue
+                finally:
+                    conn.info["capturing"] = False
+                    checkpoint.rollback()
+
+                if not captured:
+                    print(f"⚠️  {name}: issued no query")
+                elif scans:
+                    failures += 1
+                    print(f"❌ {name}")
+                    for statement, table in scans:
+                        print(f"     full scan of {table}: {' '.join(statement.split())}")
+                else:
+                    print(f"✅ {name} ({len(captured)} statement(s))")
+        finally:
+            outer.rollback()
+
+    print(f"\n{len(CHECKS)} checks, {failures} with full table scans")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="EXPLAIN every DAO query and fail on full table scans")
+    parser.add_argument("--url", default=DB_URL, help="Database URL (default: DB_* settings from .env)")
+    args = parser.parse_args()
+
+    sys.exit(run(args.url))
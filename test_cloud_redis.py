@@ -25,9 +25,12 @@ def test_redis_caching():
         print("   Start Redis: redis-server")
         return
     
+    # Cache entries are scoped per tenant, chain and address
+    scope = (1, 1, "0xabc123")
+
     # Test 2: Cache MISS (first time)
     print("📋 Test 2: Cache Miss (First Request)")
-    result = redis.get_full_chain_transactions()
+    result = redis.cache_get("tx_history", *scope)
     if result is None:
         print("✅ Cache miss as expected (no data yet)\n")
     else:
@@ -53,8 +56,8 @@ def test_redis_caching():
             "timestamp": "09-02-2026 15:45:00"
         }
     ]
-    
-    success = redis.set_full_chain_transactions(sample_transactions, ttl=60)  # 60 sec TTL for testing
+
+    success = redis.cache_set("tx_history", *scope, value=sample_transactions, ttl=60)  # 60 sec TTL for testing
     if success:
         print("✅ Sample data cached successfully\n")
     else:
@@ -63,7 +66,7 @@ def test_redis_caching():
     
     # Test 4: Cache HIT (retrieve cached data)
     print("📦 Test 4: Cache Hit (Second Request)")
-    cached = redis.get_full_chain_transactions()
+    cached = redis.cache_get("tx_history", *scope)
     if cached and len(cached) == 2:
         print("✅ Cache hit! Retrieved cached transactions")
         print(f"   Found {len(cached)} transactions\n")
@@ -73,15 +76,15 @@ def test_redis_caching():
     
     # Test 5: Check TTL
     print("⏱️  Test 5: Check Cache TTL")
-    ttl = redis.get_cache_ttl()
-    if ttl:
+    ttl = redis.client.ttl(redis.cache_key("tx_history", *scope))
+    if ttl and ttl > 0:
         print(f"✅ Cache expires in {ttl} seconds\n")
     else:
         print("⚠️  No TTL found\n")
     
     # Test 6: Invalidate cache (simulate transaction)
     print("🗑️  Test 6: Cache Invalidation (Transaction Occurred)")
-    invalidated = redis.invalidate_full_chain_cache()
+    invalidated = redis.cache_delete("tx_history", *scope)
     if invalidated:
         print("✅ Cache invalidated successfully\n")
     else:
@@ -89,7 +92,7 @@ def test_redis_caching():
     
     # Test 7: Verify cache is gone
     print("🔍 Test 7: Verify Cache is Empty After Invalidation")
-    after_invalidation = redis.get_full_chain_transactions()
+    after_invalidation = redis.cache_get("tx_history", *scope)
     if after_invalidation is None:
         print("✅ Cache is empty as expected\n")
     else:
@@ -98,19 +101,27 @@ def test_redis_caching():
     # Test 8: Simulate real flow
     print("🔄 Test 8: Simulate Real Request Flow")
     print("   Request 1: Cache miss → Fetch from Tenderly → Cache")
-    redis.set_full_chain_transactions(sample_transactions, ttl=300)
+    redis.cache_set("tx_history", *scope, value=sample_transactions, ttl=300)
     
     print("   Request 2: Cache hit → Return cached data")
-    cached_again = redis.get_full_chain_transactions()
+    cached_again = redis.cache_get("tx_history", *scope)
     print(f"   ✅ Served from cache: {len(cached_again)} transactions")
     
     print("\n   🔥 Transaction happens...")
-    redis.invalidate_full_chain_cache()
+    redis.cache_delete("tx_history", *scope)
     
     print("   Request 3: Cache miss → Fetch fresh from Tenderly")
-    miss_again = redis.get_full_chain_transactions()
+    miss_again = redis.cache_get("tx_history", *scope)
     print(f"   ✅ Cache miss as expected: {miss_again is None}\n")
     
+    # Test 9: Namespace isolation
+    print("🧱 Test 9: Other Tenants Do Not See This Entry")
+    redis.cache_set("tx_history", *scope, value=sample_transactions, ttl=60)
+    other_tenant = redis.cache_get("tx_history", 2, 11155111, "0xabc123")
+    print(f"   ✅ Other tenant misses: {other_tenant is None}")
+    print(f"   📊 Stats: {redis.get_cache_stats()}\n")
+    redis.cache_delete("tx_history", *scope)
+    
     print("="*60)
     print("✅ ALL TESTS PASSED - Redis caching is working correctly!")
     print("="*60 + "\n")
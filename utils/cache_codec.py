@@ -0,0 +1,174 @@
+"""
+Cache Codec - Compact encoding for values stored in Redis
+
+Values are framed with a one-byte header naming the serializer and
+whether the body is zstd-compressed:
+
+    0x01  JSON (orjson when installed, stdlib json otherwise)
+    0x02  msgpack
+    +0x80 body is zstd-compressed
+
+Entries written before the codec existed are plain JSON text, whose first
+byte is never a header value, so they still decode.
+
+msgpack, orjson and zstandard are optional; CACHE_CODEC / CACHE_COMPRESSION
+pick among whatever is installed.
+"""
+
+import os
+import json
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+from dotenv import load_dotenv
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+JSON_FORMAT = 0x01
+MSGPACK_FORMAT = 0x02
+ZSTD_FLAG = 0x80
+
+CACHE_CODEC = os.getenv("CACHE_CODEC", "msgpack" if msgpack else "json")
+CACHE_COMPRESSION = os.getenv("CACHE_COMPRESSION", "zstd" if zstandard else "none")
+# Small values are not worth a compression frame
+CACHE_COMPRESS_MIN_BYTES = int(os.getenv("CACHE_COMPRESS_MIN_BYTES", 1024))
+CACHE_ZSTD_LEVEL = int(os.getenv("CACHE_ZSTD_LEVEL", 3))
+
+_compressor = zstandard.ZstdCompressor(level=CACHE_ZSTD_LEVEL) if zstandard else None
+_decompressor = zstandard.ZstdDecompressor() if zstandard else None
+
+
+# ---------------- SERIALIZERS ---------------- #
+
+def _json_dumps(value: Any) -> bytes:
+    if orjson:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+def _json_loads(body: bytes) -> Any:
+    return orjson.loads(body) if orjson else json.loads(body)
+
+
+def encode(value: Any) -> bytes:
+    """Serialize (and maybe compress) a JSON-compatible value"""
+    fmt = JSON_FORMAT
+    body = None
+
+    if CACHE_CODEC == "msgpack" and msgpack:
+        try:
+            body = msgpack.packb(value, use_bin_type=True)
+            fmt = MSGPACK_FORMAT
+        except (TypeError, OverflowError, ValueError):
+            body = None  # e.g. ints beyond 64 bits - JSON handles them
+
+    if body is None:
+        body = _json_dumps(value)
+
+    if (
+        CACHE_COMPRESSION == "zstd"
+        and _compressor
+        and len(body) >= CACHE_COMPRESS_MIN_BYTES
+    ):
+        compressed = _compressor.compress(body)
+        if len(compressed) < len(body):
+            body = compressed
+            fmt |= ZSTD_FLAG
+
+    return bytes([fmt]) + body
+
+
+def decode(data) -> Any:
+    """Inverse of encode; also accepts legacy plain-JSON entries"""
+    if isinstance(data, str):
+        data = data.encode()
+
+    header = data[0] if data else 0
+
+    if header & 0x7F not in (JSON_FORMAT, MSGPACK_FORMAT):
+        return _json_loads(data)
+
+    body = data[1:]
+
+    if header & ZSTD_FLAG:
+        if not _decompressor:
+            raise ValueError("zstd-compressed cache entry but zstandard is not installed")
+        body = _decompressor.decompress(body)
+
+    if header & 0x7F == MSGPACK_FORMAT:
+        if not msgpack:
+            raise ValueError("msgpack cache entry but msgpack is not installed")
+        return msgpack.unpackb(body, raw=False)
+
+    return _json_loads(body)
+
+
+# ---------------- TRANSACTION RECORDS ---------------- #
+#
+# History records are stored positionally - the key names are the bulk of a
+# small record - in this fixed field order. Append new fields at the end.
+
+TX_RECORD_FIELDS = (
+    "tx_hash",
+    "from_address",
+    "to_address",
+    "amount",
+    "asset",
+    "status",
+    "timestamp",
+)
+
+
+def pack_record(record: Dict[str, Any]) -> List[Any]:
+    return [record.get(field) for field in TX_RECORD_FIELDS]
+
+
+def unpack_record(packed) -> Dict[str, Any]:
+    if isinstance(packed, dict):
+        return packed  # written before records were packed
+    return dict(zip(TX_RECORD_FIELDS, packed))
+
+
+# ---------------- ALCHEMY PAGES ---------------- #
+
+def project_transfers(transfers: Iterable[dict]) -> List[dict]:
+    """Keep only the asset-transfer fields the history service reads"""
+    return [
+        {
+            "hash": tx.get("hash"),
+            "from": tx.get("from"),
+            "to": tx.get("to"),
+            "value": tx.get("value"),
+            "asset": tx.get("asset"),
+            "blockNum": tx.get("blockNum"),
+            "metadata": {
+                "blockTimestamp": (tx.get("metadata") or {}).get("blockTimestamp")
+            },
+        }
+        for tx in transfers
+    ]
+
+
+def project_page(page: Optional[dict]) -> Optional[dict]:
+    if page is None:
+        return None
+    return {
+        "transfers": project_transfers(page.get("transfers", [])),
+        "pageKey": page.get("pageKey"),
+    }
@@ -0,0 +1,56 @@
+"""
+Cursor - Opaque pagination tokens handed to API clients
+"""
+
+import base64
+import json
+from typing import Dict, Any, Optional
+
+
+def encode_cursor(state: Dict[str, Any]) -> str:
+    """Serialise pagination state into a URL-safe token"""
+    raw = json.dumps(state, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> Dict[str, Any]:
+    """
+    Parse a token produced by encode_cursor
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        state = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+    if not isinstance(state, dict):
+        raise ValueError("Invalid cursor")
+
+    return state
+
+
+def encode_keyset_cursor(scope: str, after_id: Optional[int]) -> Optional[str]:
+    """Token for the page after `after_id` of a listing, None when there is none"""
+    if after_id is None:
+        return None
+    return encode_cursor({"k": scope, "after": after_id})
+
+
+def decode_keyset_cursor(token: Optional[str], scope: str) -> Optional[int]:
+    """
+    Last id seen, from a token produced by encode_keyset_cursor
+
+    Raises:
+        ValueError: If the token is malformed or belongs to another listing
+    """
+    if not token:
+        return None
+
+    state = decode_cursor(token)
+    if state.get("k") != scope or not isinstance(state.get("after"), int):
+        raise ValueError("Invalid cursor")
+
+    return state["after"]
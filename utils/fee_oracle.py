@@ -0,0 +1,212 @@
+"""
+Fee Oracle - Per-RPC cache of fee parameters, chain id and gas estimates
+
+Transaction building used to spend three or four round trips per send
+(latest block, priority fee / gas price, chain id, estimate_gas). The
+oracle keeps those values warm: fees are refreshed in the background once
+per new block, the chain id is read once per RPC, and gas estimates are
+reused per (contract, function selector). A send that reverts drops its
+cached estimate, so the next one is estimated against current state.
+"""
+
+import os
+import time
+import threading
+import logging
+from decimal import Decimal
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+FEE_REFRESH_INTERVAL = float(os.getenv("FEE_REFRESH_INTERVAL", 12))
+FEE_IDLE_TIMEOUT = float(os.getenv("FEE_IDLE_TIMEOUT", 300))
+
+GAS_ESTIMATE_TTL = int(os.getenv("GAS_ESTIMATE_TTL", 600))
+# Margin on a fresh estimate, and on a cached one - larger because the
+# cached call may have had a cheaper path (e.g. a recipient whose token
+# balance slot was already non-zero). Unused gas is refunded.
+GAS_SAFETY_MARGIN = Decimal(os.getenv("GAS_SAFETY_MARGIN", "1.2"))
+GAS_CACHE_MARGIN = Decimal(os.getenv("GAS_CACHE_MARGIN", "1.6"))
+
+PLAIN_TRANSFER_GAS = 21000
+
+
+class FeeOracle:
+    """Fee / chain-id / gas-estimate cache for one RPC endpoint"""
+
+    # endpoint -> FeeOracle
+    ORACLES = {}
+    LOCK = threading.Lock()
+
+    @classmethod
+    def for_web3(cls, web3) -> "FeeOracle":
+        endpoint = getattr(web3.provider, "endpoint_uri", None) or id(web3.provider)
+
+        oracle = cls.ORACLES.get(endpoint)
+        if oracle is None:
+            with cls.LOCK:
+                oracle = cls.ORACLES.setdefault(endpoint, cls(web3, endpoint))
+
+        return oracle
+
+    def __init__(self, web3, endpoint):
+        self.web3 = web3
+        self.endpoint = endpoint
+
+        self._chain_id = None
+        self._fees = None
+        self._block_number = None
+        self._fetched_at = 0.0
+        self._last_used = 0.0
+
+        self._gas_estimates = {}  # (to, selector) -> (raw estimate, cached_at)
+
+        self._lock = threading.Lock()
+        self._thread = None
+
+    # ---------------- CHAIN ID ---------------- #
+
+    def chain_id(self) -> int:
+        """Immutable per RPC, so read once per process"""
+        if self._chain_id is None:
+            self._chain_id = int(self.web3.eth.chain_id)
+        return self._chain_id
+
+    # ---------------- FEES ---------------- #
+
+    def _refresh(self):
+        block = self.web3.eth.get_block("latest")
+
+        # Same block as last time: the cached fees still apply
+        if self._fees is not None and block["number"] == self._block_number:
+            self._fetched_at = time.monotonic()
+            return
+
+        base_fee = block.get("baseFeePerGas")
+
+        if base_fee is not None:
+            priority_fee = int(self.web3.eth.max_priority_fee)
+            fees = {
+                "eip1559": {
+                    "maxFeePerGas": int(Decimal(base_fee) * 2 + Decimal(priority_fee)),
+                    "maxPriorityFeePerGas": priority_fee,
+                },
+                # What eth_gasPrice would suggest: base fee plus tip
+                "gasPrice": int(base_fee) + priority_fee,
+            }
+        else:
+            fees = {"eip1559": None, "gasPrice": int(self.web3.eth.gas_price)}
+
+        with self._lock:
+            self._fees = fees
+            self._block_number = block["number"]
+            self._fetched_at = time.monotonic()
+
+    def _current(self) -> dict:
+        self._last_used = time.monotonic()
+
+        stale = time.monotonic() - self._fetched_at > FEE_REFRESH_INTERVAL
+        if self._fees is None or stale:
+            try:
+                self._refresh()
+            except Exception as e:
+                if self._fees is None:
+                    raise
+                logger.warning(f"Fee refresh failed for {self.endpoint}, using last values: {e}")
+
+        self._start()
+        return self._fees
+
+    def fee_params(self) -> dict:
+        """EIP-1559 fee fields when the chain supports them, else legacy gasPrice"""
+        fees = self._current()
+        return dict(fees["eip1559"]) if fees["eip1559"] else {"gasPrice": fees["gasPrice"]}
+
+    def gas_price(self) -> int:
+        """Legacy gasPrice for the type-0 transactions built on Tenderly"""
+        return self._current()["gasPrice"]
+
+    # ---------------- GAS ESTIMATES ---------------- #
+
+    @staticmethod
+    def _gas_key(tx: dict):
+        """(to, 4-byte selector) of a contract call, None for a plain transfer"""
+        data = tx.get("data") or tx.get("input") or "0x"
+        if isinstance(data, bytes):
+            data = "0x" + data.hex()
+
+        if data in ("0x", ""):
+            return None
+
+        return (tx.get("to") or "").lower(), data[:10]
+
+    def estimate_gas(self, tx: dict) -> int:
+        """
+        Gas limit for a transaction, with safety margin applied
+
+        Plain ETH transfers are 21000 without asking. Contract calls are
+        keyed by (to, 4-byte selector); the largest estimate seen is reused
+        for GAS_ESTIMATE_TTL seconds. Pass the result as "gas" to
+        build_transaction, or web3 estimates a second time.
+        """
+        key = self._gas_key(tx)
+        if key is None:
+            return PLAIN_TRANSFER_GAS
+
+        cached = self._gas_estimates.get(key)
+
+        if cached and time.monotonic() - cached[1] < GAS_ESTIMATE_TTL:
+            return int(Decimal(cached[0]) * GAS_CACHE_MARGIN)
+
+        estimate = int(self.web3.eth.estimate_gas(tx))
+
+        previous = cached[0] if cached else 0
+        self._gas_estimates[key] = (max(estimate, previous), time.monotonic())
+
+        return int(Decimal(estimate) * GAS_SAFETY_MARGIN)
+
+    def forget_gas_estimate(self, tx: dict):
+        """
+        Drop the cached estimate after a send reverted or failed
+
+        A cached estimate skips eth_estimateGas, which is what would have
+        caught the revert; the next send of this call is estimated fresh.
+        """
+        key = self._gas_key(tx)
+        if key is not None:
+            self._gas_estimates.pop(key, None)
+
+    # ---------------- BACKGROUND REFRESH ---------------- #
+
+    def _run(self):
+        while True:
+            # Idle RPCs stop polling until the next send restarts the
+            # thread; checked under the lock _start takes, so a send can't
+            # see this thread as running after it decided to exit
+            with self._lock:
+                if time.monotonic() - self._last_used >= FEE_IDLE_TIMEOUT:
+                    self._thread = None
+                    return
+
+            time.sleep(FEE_REFRESH_INTERVAL / 2)
+            try:
+                self._refresh()
+            except Exception as e:
+                logger.warning(f"Background fee refresh failed for {self.endpoint}: {e}")
+
+    def _start(self):
+        if self._thread is not None:
+            return
+
+        with self._lock:
+            if self._thread is not None:
+                return
+
+            self._thread = threading.Thread(
+                target=self._run,
+                name="fee-oracle",
+                daemon=True
+            )
+            self._thread.start()
@@ -0,0 +1,238 @@
+"""
+Multicall - Batches read-only contract calls into a single round trip
+"""
+
+import os
+import asyncio
+import logging
+from typing import List, Any
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Multicall3 is deployed at the same address on mainnet, Sepolia and
+# Tenderly forks of either; override for private chains.
+MULTICALL3_ADDRESS = os.getenv(
+    "MULTICALL3_ADDRESS",
+    "0xcA11bde05977b3631167028862bE2a173976CA11"
+)
+
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"}
+                ],
+                "name": "calls",
+                "type": "tuple[]"
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"}
+                ],
+                "name": "returnData",
+                "type": "tuple[]"
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function"
+    },
+    {
+        "inputs": [{"name": "addr", "type": "address"}],
+        "name": "getEthBalance",
+        "outputs": [{"name": "balance", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function"
+    }
+]
+
+
+class Multicall:
+    """Aggregates contract reads through Multicall3 (JSON-RPC batch fallback)"""
+
+    # endpoint -> bool, so the get_code probe runs once per RPC per process
+    AVAILABILITY_CACHE = {}
+
+    def __init__(self, web3):
+        self.web3 = web3
+        self.contract = web3.eth.contract(
+            address=web3.to_checksum_address(MULTICALL3_ADDRESS),
+            abi=MULTICALL3_ABI
+        )
+
+    # ---------------- CALL BUILDERS ---------------- #
+
+    def eth_balance(self, address):
+        """Native balance read expressed as a call on Multicall3 itself"""
+        return self.contract.functions.getEthBalance(
+            self.web3.to_checksum_address(address)
+        )
+
+    # ---------------- AVAILABILITY ---------------- #
+
+    def _endpoint(self):
+        provider = self.web3.provider
+        return getattr(provider, "endpoint_uri", None) or id(provider)
+
+    def is_available(self) -> bool:
+        endpoint = self._endpoint()
+
+        if endpoint not in Multicall.AVAILABILITY_CACHE:
+            try:
+                code = self.web3.eth.get_code(self.contract.address)
+                Multicall.AVAILABILITY_CACHE[endpoint] = len(code) > 0
+            except Exception as e:
+                logger.warning(f"Multicall3 probe failed: {e}")
+                return False
+
+            if not Multicall.AVAILABILITY_CACHE[endpoint]:
+                logger.info(f"Multicall3 not deployed on {endpoint}, using JSON-RPC batch")
+
+        return Multicall.AVAILABILITY_CACHE[endpoint]
+
+    # ---------------- EXECUTION ---------------- #
+
+    def aggregate(self, calls: List[Any]) -> List[Any]:
+        """
+        Execute contract function calls in one round trip
+
+        Args:
+            calls: Bound contract functions, e.g. contract.functions.balanceOf(addr)
+
+        Returns:
+            Decoded result per call (in order), None for calls that reverted
+        """
+        if not calls:
+            return []
+
+        if self.is_available():
+            try:
+                return self._aggregate3(calls)
+            except Exception as e:
+                logger.warning(f"Multicall3 aggregate3 failed, falling back to batch: {e}")
+
+        return self._batch(calls)
+
+    def _aggregate3(self, calls):
+        payload = [
+            (call.address, True, call._encode_transaction_data())
+            for call in calls
+        ]
+
+        results = self.contract.functions.aggregate3(payload).call()
+
+        return [
+            self._decode(call, success, data)
+            for call, (success, data) in zip(calls, results)
+        ]
+
+    def _decode(self, call, success, data):
+        if not success or not data:
+            return None
+
+        output_types = [output["type"] for output in call.abi["outputs"]]
+        decoded = self.web3.codec.decode(output_types, data)
+
+        return decoded[0] if len(decoded) == 1 else decoded
+
+    def _is_eth_balance(self, call):
+        return (
+            call.address == self.contract.address
+            and call.fn_name == "getEthBalance"
+        )
+
+    def _batch(self, calls):
+        batch_requests = getattr(self.web3, "batch_requests", None)
+
+        # web3 < 7 has no JSON-RPC batching
+        if batch_requests is None:
+            return self._sequential(calls)
+
+        try:
+            with batch_requests() as batch:
+                for call in calls:
+                    if self._is_eth_balance(call):
+                        batch.add(self.web3.eth.get_balance(call.args[0]))
+                    else:
+                        batch.add(call)
+                return list(batch.execute())
+        except Exception as e:
+            logger.warning(f"JSON-RPC batch failed, reading sequentially: {e}")
+            return self._sequential(calls)
+
+    def _sequential(self, calls):
+        results = []
+
+        for call in calls:
+            try:
+                if self._is_eth_balance(call):
+                    results.append(self.web3.eth.get_balance(call.args[0]))
+                else:
+                    results.append(call.call())
+            except Exception:
+                results.append(None)
+
+        return results
+
+
+class AsyncMulticall(Multicall):
+    """Multicall for AsyncWeb3; the JSON-RPC batch fallback becomes concurrent reads"""
+
+    async def is_available(self) -> bool:
+        endpoint = self._endpoint()
+
+        if endpoint not in Multicall.AVAILABILITY_CACHE:
+            try:
+                code = await self.web3.eth.get_code(self.contract.address)
+                Multicall.AVAILABILITY_CACHE[endpoint] = len(code) > 0
+            except Exception as e:
+                logger.warning(f"Multicall3 probe failed: {e}")
+                return False
+
+        return Multicall.AVAILABILITY_CACHE[endpoint]
+
+    async def aggregate(self, calls: List[Any]) -> List[Any]:
+        if not calls:
+            return []
+
+        if await self.is_available():
+            try:
+                return await self._aggregate3(calls)
+            except Exception as e:
+                logger.warning(f"Multicall3 aggregate3 failed, falling back to concurrent reads: {e}")
+
+        return await self._concurrent(calls)
+
+    async def _aggregate3(self, calls):
+        payload = [
+            (call.address, True, call._encode_transaction_data())
+            for call in calls
+        ]
+
+        results = await self.contract.functions.aggregate3(payload).call()
+
+        return [
+            self._decode(call, success, data)
+            for call, (success, data) in zip(calls, results)
+        ]
+
+    async def _concurrent(self, calls):
+
+        async def read(call):
+            try:
+                if self._is_eth_balance(call):
+                    return await self.web3.eth.get_balance(call.args[0])
+                return await call.call()
+            except Exception:
+                return None
+
+        return list(await asyncio.gather(*(read(call) for call in calls)))
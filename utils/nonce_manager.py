@@ -0,0 +1,177 @@
+"""
+Nonce Manager - Hands out nonces for hot wallets without per-send RPC reads
+
+Nonces are reserved per (chain id, sender) from a Redis counter shared by
+every worker, falling back to an in-process counter when Redis is down.
+The chain is only asked for the pending nonce when a counter is seeded -
+first use, every NONCE_RESYNC_INTERVAL seconds - or after a send fails in
+a way that means the counter drifted or may have.
+"""
+
+import os
+import time
+import heapq
+import threading
+import logging
+import requests
+from contextlib import contextmanager
+from typing import Optional
+from dotenv import load_dotenv
+
+from utils.redis_client import RedisClient
+from utils.fee_oracle import FeeOracle
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Counters expire and are reseeded from the chain this often, so a gap
+# nobody noticed does not outlive it
+NONCE_RESYNC_INTERVAL = int(os.getenv("NONCE_RESYNC_INTERVAL", 300))
+
+# Node errors meaning our counter disagrees with the chain
+DRIFT_ERRORS = (
+    "nonce too low",
+    "nonce too high",
+    "already known",
+    "replacement transaction underpriced",
+    "known transaction",
+)
+
+_redis: Optional[RedisClient] = None
+
+
+def _shared_redis() -> RedisClient:
+    global _redis
+
+    if _redis is None:
+        _redis = RedisClient()
+
+    return _redis
+
+
+class NonceManager:
+    """
+    Usage:
+        nonces = NonceManager(web3, sender, chain_id)
+        with nonces.reserve() as nonce:
+            ...build, sign and send with nonce...
+
+    Send through nonces.send(raw_tx) inside the block. A nonce whose block
+    raises before that send (building, signing), or whose send the node
+    explicitly rejected, is released and reused by the next send, so
+    failures leave no gap. When the send failed ambiguously (timeout,
+    dropped connection) the node may hold the transaction, so the counter
+    is resynced from the chain instead.
+    """
+
+    # "{chain_id}:{sender}" -> {"next": int, "released": heap, "seeded_at": float}
+    LOCAL_STATE = {}
+    LOCK = threading.Lock()
+
+    def __init__(self, web3, sender: str, chain_id: Optional[int] = None):
+        self.web3 = web3
+        self.sender = web3.to_checksum_address(sender)
+        self.chain_id = chain_id or FeeOracle.for_web3(web3).chain_id()
+        self.key = f"{self.chain_id}:{self.sender.lower()}"
+        self.redis = _shared_redis()
+        self._sent = False
+
+    def _chain_nonce(self) -> int:
+        return self.web3.eth.get_transaction_count(self.sender, "pending")
+
+    # ---------------- RESERVATION ---------------- #
+
+    def _reserve(self) -> int:
+        nonce = self.redis.reserve_nonce(self.key)
+
+        if nonce == -1:
+            self.redis.seed_nonce(self.key, self._chain_nonce(), ttl=NONCE_RESYNC_INTERVAL)
+            nonce = self.redis.reserve_nonce(self.key)
+
+        if nonce is not None and nonce >= 0:
+            return nonce
+
+        return self._reserve_local()
+
+    def _reserve_local(self) -> int:
+        with NonceManager.LOCK:
+            state = NonceManager.LOCAL_STATE.get(self.key)
+
+            if state is None or time.time() - state["seeded_at"] > NONCE_RESYNC_INTERVAL:
+                state = {"next": self._chain_nonce(), "released": [], "seeded_at": time.time()}
+                NonceManager.LOCAL_STATE[self.key] = state
+
+            if state["released"]:
+                return heapq.heappop(state["released"])
+
+            nonce = state["next"]
+            state["next"] += 1
+            return nonce
+
+    @contextmanager
+    def reserve(self):
+        nonce = self._reserve()
+        self._sent = False
+        try:
+            yield nonce
+        except Exception as e:
+            self._recover(nonce, e)
+            raise
+
+    def send(self, raw_tx):
+        """Broadcast the signed transaction for the current reservation"""
+        self._sent = True
+        return self.web3.eth.send_raw_transaction(raw_tx)
+
+    # ---------------- RECOVERY ---------------- #
+
+    def release(self, nonce: int):
+        """Return a nonce that was never broadcast so the next send fills the gap"""
+        if self.redis.release_nonce(self.key, nonce):
+            return
+
+        with NonceManager.LOCK:
+            state = NonceManager.LOCAL_STATE.get(self.key)
+            if state is not None:
+                heapq.heappush(state["released"], nonce)
+
+    def resync(self):
+        """Reset the counter to the chain's pending nonce"""
+        chain_nonce = self._chain_nonce()
+
+        self.redis.seed_nonce(self.key, chain_nonce, force=True, ttl=NONCE_RESYNC_INTERVAL)
+
+        with NonceManager.LOCK:
+            NonceManager.LOCAL_STATE[self.key] = {
+                "next": chain_nonce, "released": [], "seeded_at": time.time()
+            }
+
+        logger.warning(f"🔁 Nonce resynced for {self.key} at {chain_nonce}")
+
+    @staticmethod
+    def _rejected(error: Exception) -> bool:
+        """Whether the node answered the send with an error, i.e. holds nothing"""
+        if isinstance(error, requests.exceptions.RequestException):
+            return False  # timeout / connection: the node may have it
+
+        try:
+            from web3.exceptions import Web3RPCError
+        except ImportError:
+            Web3RPCError = ValueError  # web3 < 7 raises ValueError with the RPC error
+
+        return isinstance(error, (Web3RPCError, ValueError))
+
+    def _recover(self, nonce: int, error: Exception):
+        message = str(error).lower()
+
+        try:
+            if any(marker in message for marker in DRIFT_ERRORS):
+                self.resync()
+            elif not self._sent or self._rejected(error):
+                self.release(nonce)
+            else:
+                logger.warning(f"⚠️ Send with nonce {nonce} may have reached the node: {error}")
+                self.resync()
+        except Exception as e:
+            logger.error(f"Nonce recovery failed for {self.key}: {e}")
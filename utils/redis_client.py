@@ -4,161 +4,275 @@ Redis Client - Handles caching for transaction history
 
 import os
 import redis
-import json
+import redis.asyncio as aioredis
 import logging
+import threading
+import time
+from collections import defaultdict, deque
 from typing import Optional, List, Dict, Any
 from dotenv import load_dotenv
 
+from utils.cache_codec import encode, decode, pack_record, unpack_record
+
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Per-namespace TTLs in seconds (override with CACHE_TTL_<NAMESPACE>)
+CACHE_TTLS = {
+    "wallet_balance": 60,
+    "tx_index_meta": 300,
+    "alchemy_page": 60,
+    "tx_status": 86400,
+    "batch_job": 86400,
+    "fx_rate": 86400,
+}
+DEFAULT_CACHE_TTL = 300
+
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", 50))
+# Idle connections are PINGed before reuse after this many seconds
+REDIS_HEALTH_CHECK_INTERVAL = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", 30))
+# Breaker opens after this many connection errors within the window...
+REDIS_BREAKER_THRESHOLD = int(os.getenv("REDIS_BREAKER_THRESHOLD", 3))
+REDIS_BREAKER_WINDOW = float(os.getenv("REDIS_BREAKER_WINDOW", 30))
+# ...and short-circuits every call for this long before trying again
+REDIS_BREAKER_COOLDOWN = float(os.getenv("REDIS_BREAKER_COOLDOWN", 30))
+
+
+def _connection_settings() -> Dict[str, Any]:
+    """Connection kwargs shared by the sync and asyncio clients"""
+    return {
+        "host": os.getenv("REDIS_HOST", "localhost"),
+        "port": int(os.getenv("REDIS_PORT", 6379)),
+        "password": os.getenv("REDIS_PASSWORD", None),
+        "db": int(os.getenv("REDIS_DB", 0)),
+        "decode_responses": False,  # values are binary (see utils.cache_codec)
+        "socket_connect_timeout": 5,
+        "socket_timeout": 5,
+        "ssl": True,
+        "ssl_cert_reqs": None,
+    }
+
+
+# ---------------- CIRCUIT BREAKER ---------------- #
+
+class CircuitBreaker:
+    """
+    Skips Redis while it is failing instead of pinging before every call
+
+    Connection / timeout errors raised by real commands are counted; too
+    many within REDIS_BREAKER_WINDOW open the breaker, and callers treat
+    Redis as unavailable (cache miss) until the cooldown has passed.
+    """
+
+    def __init__(self):
+        self._failures = deque()
+        self._open_until = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        return time.monotonic() >= self._open_until
+
+    def record_failure(self, error: Exception):
+        if not isinstance(error, (redis.ConnectionError, redis.TimeoutError, OSError)):
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            self._failures.append(now)
+            while self._failures and now - self._failures[0] > REDIS_BREAKER_WINDOW:
+                self._failures.popleft()
+
+            if len(self._failures) >= REDIS_BREAKER_THRESHOLD:
+                self._failures.clear()
+                self._open_until = now + REDIS_BREAKER_COOLDOWN
+                logger.error(
+                    f"🔌 Redis circuit open for {REDIS_BREAKER_COOLDOWN:.0f}s: {error}"
+                )
+
+
+BREAKER = CircuitBreaker()
+
+
+# ---------------- SHARED CONNECTION POOL ---------------- #
+
+_client: Optional[redis.Redis] = None
+_client_lock = threading.Lock()
+
+
+def get_redis_connection() -> Optional[redis.Redis]:
+    """
+    Process-wide redis.Redis backed by one ConnectionPool
+
+    Connections are opened lazily by the first command, so this never
+    blocks on the network.
+    """
+    global _client
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                settings = _connection_settings()
+                if settings.pop("ssl"):
+                    settings["connection_class"] = redis.SSLConnection
+                else:
+                    settings.pop("ssl_cert_reqs")
+
+                try:
+                    pool = redis.ConnectionPool(
+                        max_connections=REDIS_MAX_CONNECTIONS,
+                        health_check_interval=REDIS_HEALTH_CHECK_INTERVAL,
+                        **settings
+                    )
+                    _client = redis.Redis(connection_pool=pool)
+                    logger.info(f"✅ Redis pool created: {settings['host']}:{settings['port']}")
+                except Exception as e:
+                    logger.error(f"❌ Redis initialization error: {e}")
+                    return None
+
+    return _client
+
 
 class RedisClient:
     """Redis client for caching transaction data"""
+
+    STATS = defaultdict(lambda: {
+        "hits": 0, "misses": 0,
+        "reads": 0, "read_bytes": 0, "read_ms": 0.0,
+        "writes": 0, "write_bytes": 0, "write_ms": 0.0,
+    })
+    STATS_LOCK = threading.Lock()
     
     def __init__(self):
-        """Initialize Redis connection"""
-        redis_host = os.getenv("REDIS_HOST", "localhost")
-        redis_port = int(os.getenv("REDIS_PORT", 6379))
-        redis_password = os.getenv("REDIS_PASSWORD", None)
-        redis_db = int(os.getenv("REDIS_DB", 0))
-        
-        try:
-            self.client = redis.Redis(
-                host=redis_host,
-                port=redis_port,
-                password=redis_password,
-                db=redis_db,
-                decode_responses=True,  # Auto-decode bytes to strings
-                socket_connect_timeout=5,
-                socket_timeout=5,
-                ssl=True,
-                ssl_cert_reqs=None
-            )
-            
-            # Test connection
-            self.client.ping()
-            logger.info(f"✅ Redis connected: {redis_host}:{redis_port}")
-            
-        except redis.ConnectionError as e:
-            logger.error(f"❌ Redis connection failed: {e}")
-            self.client = None
-        except Exception as e:
-            logger.error(f"❌ Redis initialization error: {e}")
-            self.client = None
+        """Use the shared connection pool (no network I/O here)"""
+        self.client = get_redis_connection()
     
     def is_connected(self) -> bool:
-        """Check if Redis is connected and available"""
-        if not self.client:
-            return False
-        
-        try:
-            self.client.ping()
-            return True
-        except:
-            return False
-    
-    # ========== FULL CHAIN TRANSACTION CACHE ==========
+        """
+        Whether Redis should be tried - no PING; failures are detected
+        from the commands themselves by the circuit breaker
+        """
+        return self.client is not None and BREAKER.allow()
     
-    def get_full_chain_transactions(self) -> Optional[List[Dict[str, Any]]]:
+    # ========== NAMESPACED CACHE ==========
+    #
+    # Keys are cache:{namespace}:{scope...}, where the scope is whatever
+    # makes the value unique - typically (tenant_id, chain_id, address) -
+    # so tenants and chains never share an entry.
+
+    @staticmethod
+    def cache_key(namespace: str, *scope) -> str:
+        return ":".join(["cache", namespace, *(str(part).lower() for part in scope)])
+
+    @staticmethod
+    def cache_ttl(namespace: str) -> int:
+        """TTL for a namespace, overridable with CACHE_TTL_<NAMESPACE>"""
+        return int(os.getenv(
+            f"CACHE_TTL_{namespace.upper()}",
+            CACHE_TTLS.get(namespace, DEFAULT_CACHE_TTL)
+        ))
+
+    @staticmethod
+    def _record(namespace: str, outcome: str):
+        with RedisClient.STATS_LOCK:
+            RedisClient.STATS[namespace][outcome] += 1
+
+    @staticmethod
+    def _measure(namespace: str, op: str, size: int, started: float):
+        """Record payload size and round-trip + codec time for a read or write"""
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with RedisClient.STATS_LOCK:
+            counts = RedisClient.STATS[namespace]
+            counts[f"{op}s"] += 1
+            counts[f"{op}_bytes"] += size
+            counts[f"{op}_ms"] += elapsed_ms
+
+    def cache_get(self, namespace: str, *scope) -> Optional[Any]:
         """
-        Get cached full chain transaction list
-        
+        Read a namespaced cache entry
+
         Returns:
-            List of all transactions if cached, None if cache miss
+            Decoded value on hit, None on miss or when Redis is unavailable
         """
         if not self.is_connected():
-            logger.warning("Redis not connected, skipping cache read")
             return None
-        
+
+        key = self.cache_key(namespace, *scope)
         try:
-            cached_data = self.client.get("tx_history:all_chain")
-            
-            if cached_data:
-                logger.info("✅ Cache HIT: Full chain transactions")
-                return json.loads(cached_data)
-            else:
-                logger.info("❌ Cache MISS: Full chain transactions")
+            started = time.perf_counter()
+            data = self.client.get(key)
+            if data is None:
+                self._record(namespace, "misses")
+                logger.info(f"❌ Cache MISS: {key}")
                 return None
-                
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON decode error: {e}")
-            return None
+
+            value = decode(data)
+            self._measure(namespace, "read", len(data), started)
+            self._record(namespace, "hits")
+            logger.info(f"✅ Cache HIT: {key}")
+            return value
+
         except Exception as e:
+            BREAKER.record_failure(e)
             logger.error(f"Redis GET error: {e}")
             return None
-    
-    def set_full_chain_transactions(
-        self,
-        transactions: List[Dict[str, Any]],
-        ttl: int = 30000  # 5 minutes default
-    ) -> bool:
-        """
-        Cache full chain transaction list
-        
-        Args:
-            transactions: List of all chain transactions
-            ttl: Time to live in seconds (default: 300 = 5 minutes)
-            
-        Returns:
-            True if cached successfully, False otherwise
-        """
+
+    def cache_set(self, namespace: str, *scope, value: Any, ttl: Optional[int] = None) -> bool:
         if not self.is_connected():
-            logger.warning("Redis not connected, skipping cache write")
             return False
-        
+
+        key = self.cache_key(namespace, *scope)
+        ttl = ttl or self.cache_ttl(namespace)
         try:
-            serialized = json.dumps(transactions)
-            self.client.setex(
-                "tx_history:all_chain",
-                ttl,
-                serialized
-            )
-            logger.info(f"✅ Cached full chain transactions (TTL: {ttl}s)")
+            started = time.perf_counter()
+            payload = encode(value)
+            self.client.setex(key, ttl, payload)
+            self._measure(namespace, "write", len(payload), started)
+            logger.info(f"💾 Cached {key} ({len(payload)}B, TTL={ttl}s)")
             return True
-            
         except Exception as e:
+            BREAKER.record_failure(e)
             logger.error(f"Redis SET error: {e}")
             return False
-    
-    def invalidate_full_chain_cache(self) -> bool:
-        """
-        Delete the full chain transaction cache
-        Called when ANY transaction occurs
-        
-        Returns:
-            True if deleted, False otherwise
-        """
+
+    def cache_delete(self, namespace: str, *scope) -> bool:
         if not self.is_connected():
-            logger.warning("Redis not connected, skipping cache invalidation")
             return False
-        
+
+        key = self.cache_key(namespace, *scope)
         try:
-            deleted = self.client.delete("tx_history:all_chain")
+            deleted = self.client.delete(key)
             if deleted:
-                logger.info("✅ Cache INVALIDATED: Full chain transactions")
-            else:
-                logger.info("ℹ️  No cache to invalidate")
+                logger.info(f"🗑️ Cache INVALIDATED: {key}")
             return bool(deleted)
-            
         except Exception as e:
+            BREAKER.record_failure(e)
             logger.error(f"Redis DELETE error: {e}")
             return False
-    
+
+    @classmethod
+    def get_cache_stats(cls) -> Dict[str, Dict[str, Any]]:
+        """Hit/miss counters, payload sizes and latencies per namespace for this worker process"""
+        def average(total, count, digits):
+            return round(total / count, digits) if count else None
+
+        with cls.STATS_LOCK:
+            stats = {}
+            for namespace, counts in cls.STATS.items():
+                total = counts["hits"] + counts["misses"]
+                stats[namespace] = {
+                    "hits": counts["hits"],
+                    "misses": counts["misses"],
+                    "hit_rate": round(counts["hits"] / total, 4) if total else None,
+                    "avg_read_bytes": average(counts["read_bytes"], counts["reads"], 1),
+                    "avg_read_ms": average(counts["read_ms"], counts["reads"], 3),
+                    "avg_write_bytes": average(counts["write_bytes"], counts["writes"], 1),
+                    "avg_write_ms": average(counts["write_ms"], counts["writes"], 3),
+                }
+            return stats
+
     # ========== HELPER METHODS ==========
     
-    def get_cache_ttl(self) -> Optional[int]:
-        """Get remaining TTL for full chain cache"""
-        if not self.is_connected():
-            return None
-        
-        try:
-            ttl = self.client.ttl("tx_history:all_chain")
-            return ttl if ttl > 0 else None
-        except:
-            return None
-    
     def flush_all(self):
         """⚠️ DELETE ALL CACHE - Use only for testing/debugging"""
         if not self.is_connected():
@@ -169,51 +283,441 @@ class RedisClient:
             logger.warning("🗑️  FLUSHED ALL REDIS CACHE")
             return True
         except Exception as e:
+            BREAKER.record_failure(e)
             logger.error(f"Redis FLUSH error: {e}")
             return False
 
-        # ========== WALLET BALANCE CACHE ==========
+    # ========== WALLET BALANCE CACHE ==========
+    #
+    # Wallet addresses are unique per chain, so the address alone scopes
+    # the entry.
 
     def get_wallet_balance(self, address: str):
+        return self.cache_get("wallet_balance", address)
+
+    def set_wallet_balance(self, address: str, balance_data: dict, ttl: Optional[int] = None):
+        return self.cache_set("wallet_balance", address, value=balance_data, ttl=ttl)
+
+    def invalidate_wallet_balance(self, address: str):
+        return self.cache_delete("wallet_balance", address)
+
+    # ========== TRANSACTION INDEX ==========
+    #
+    # Durable (no TTL) per-address index maintained by the background
+    # indexers:
+    #   tx_index:{ns}:tx            hash    tx_hash -> codec-framed positional list (pack_record)
+    #   tx_index:{ns}:addr:{addr}   zset    tx_hash scored by block number
+    #   tx_index:{ns}:hwm           string  highest indexed block number
+    #   tx_index:{ns}:resume        string  where an unfinished catch-up walk continues
+
+    def index_transactions(self, namespace: str, entries: List[Dict[str, Any]]) -> bool:
+        """
+        Append transactions to the per-address index
+
+        Args:
+            namespace: Index namespace (e.g. "tenderly")
+            entries: Dicts with tx_hash, score, record and addresses keys
+
+        Returns:
+            True if written, False otherwise
+        """
+        if not entries:
+            return True
+
+        if not self.is_connected():
+            logger.warning("Redis not connected, skipping index write")
+            return False
+
+        try:
+            pipe = self.client.pipeline(transaction=False)
+
+            pipe.hset(
+                f"tx_index:{namespace}:tx",
+                mapping={e["tx_hash"]: encode(pack_record(e["record"])) for e in entries}
+            )
+
+            for entry in entries:
+                for address in entry["addresses"]:
+                    pipe.zadd(
+                        f"tx_index:{namespace}:addr:{address.lower()}",
+                        {entry["tx_hash"]: entry["score"]}
+                    )
+
+            pipe.execute()
+            logger.info(f"📥 Indexed {len(entries)} transactions ({namespace})")
+            return True
+
+        except Exception as e:
+            BREAKER.record_failure(e)
+            logger.error(f"Redis index write error: {e}")
+            return False
+
+    def get_indexed_transactions(
+        self,
+        namespace: str,
+        address: str,
+        offset: int = 0,
+        limit: int = 50
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Read one page of an address's transactions, newest first
+
+        Returns:
+            List of records, None if Redis is unavailable
+        """
         if not self.is_connected():
             return None
 
-        key = f"wallet:balance:{address}"
         try:
-            data = self.client.get(key)
-            if data:
-                logger.info(f"✅ Cache HIT: Wallet balance {address}")
-                return json.loads(data)
-            logger.info(f"❌ Cache MISS: Wallet balance {address}")
+            tx_hashes = self.client.zrevrange(
+                f"tx_index:{namespace}:addr:{address.lower()}",
+                offset,
+                offset + limit - 1
+            )
+
+            if not tx_hashes:
+                return []
+
+            rows = self.client.hmget(f"tx_index:{namespace}:tx", tx_hashes)
+            return [unpack_record(decode(row)) for row in rows if row]
+
+        except Exception as e:
+            BREAKER.record_failure(e)
+            logger.error(f"Redis index read error: {e}")
+            return None
+
+    def get_index_high_water(self, namespace: str) -> Optional[int]:
+        if not self.is_connected():
             return None
+
+        try:
+            value = self.client.get(f"tx_index:{namespace}:hwm")
+            return int(value) if value is not None else None
         except Exception as e:
+            BREAKER.record_failure(e)
             logger.error(f"Redis GET error: {e}")
             return None
 
+    def set_index_high_water(self, namespace: str, block_number: int) -> bool:
+        if not self.is_connected():
+            return False
+
+        try:
+            self.client.set(f"tx_index:{namespace}:hwm", int(block_number))
+            return True
+        except Exception as e:
+            BREAKER.record_failure(e)
+            logger.error(f"Redis SET error: {e}")
+            return False
+
+    def get_index_resume(self, namespace: str) -> Optional[Dict[str, Any]]:
+        if not self.is_connected():
+            return None
+
+        try:
+            value = self.client.get(f"tx_index:{namespace}:resume")
+            return decode(value) if value is not None else None
+        except Exception as e:
+            BREAKER.record_failure(e)
+            logger.error(f"Redis GET error: {e}")
+            return None
 
-    def set_wallet_balance(self, address: str, balance_data: dict, ttl: int = 60):
+    def set_index_resume(self, namespace: str, position: Optional[Dict[str, Any]]) -> bool:
+        """Store the catch-up position, or clear it with None"""
         if not self.is_connected():
             return False
 
-        key = f"wallet:balance:{address}"
         try:
-            self.client.setex(key, ttl, json.dumps(balance_data))
-            logger.info(f"💾 Cached wallet balance {address} (TTL={ttl}s)")
+            if position is None:
+                self.client.delete(f"tx_index:{namespace}:resume")
+            else:
+                self.client.set(f"tx_index:{namespace}:resume", encode(position))
             return True
         except Exception as e:
+            BREAKER.record_failure(e)
             logger.error(f"Redis SET error: {e}")
             return False
 
+    # ========== NONCE RESERVATION ==========
+    #
+    # Shared nonce counters for hot wallets sending from several workers:
+    #   nonce:{chain_id}:{sender}:next      string  next never-issued nonce (expires)
+    #   nonce:{chain_id}:{sender}:released  zset    issued but never broadcast
+    #
+    # Reservation is a single Lua script, so workers never need a lock
+    # round trip per send. Once the counter expires, its released nonces
+    # are dropped too: the reseeded counter starts at the chain's pending
+    # nonce, which already re-covers them.
 
-    def invalidate_wallet_balance(self, address: str):
+    RESERVE_NONCE_SCRIPT = """
+    if redis.call('EXISTS', KEYS[1]) == 0 then
+        redis.call('DEL', KEYS[2])
+        return -1
+    end
+    local released = redis.call('ZPOPMIN', KEYS[2])
+    if released[1] then
+        return tonumber(released[1])
+    end
+    return redis.call('INCR', KEYS[1]) - 1
+    """
+
+    def reserve_nonce(self, key: str) -> Optional[int]:
+        """
+        Take the lowest released nonce, else the next fresh one
+
+        Returns:
+            The nonce, -1 when the counter has not been seeded yet,
+            None when Redis is unavailable
+        """
+        if not self.is_connected():
+            return None
+
+        try:
+            return int(self.client.eval(
+                self.RESERVE_NONCE_SCRIPT, 2,
+                f"nonce:{key}:next", f"nonce:{key}:released"
+            ))
+        except Exception as e:
+            BREAKER.record_failure(e)
+            logger.error(f"Redis nonce reserve error: {e}")
+            return None
+
+    def seed_nonce(self, key: str, nonce: int, force: bool = False, ttl: Optional[int] = None) -> bool:
+        """
+        Initialise the counter (force=True overwrites it and drops released
+        nonces); with a ttl it expires and is reseeded after that long
+        """
+        if not self.is_connected():
+            return False
+
+        try:
+            pipe = self.client.pipeline(transaction=True)
+            if force:
+                pipe.delete(f"nonce:{key}:released")
+            pipe.set(f"nonce:{key}:next", int(nonce), nx=not force, ex=ttl)
+            pipe.execute()
+            return True
+        except Exception as e:
+            BREAKER.record_failure(e)
+            logger.error(f"Redis nonce seed error: {e}")
+            return False
+
+    def release_nonce(self, key: str, nonce: int) -> bool:
         if not self.is_connected():
             return False
 
-        key = f"wallet:balance:{address}"
         try:
-            self.client.delete(key)
-            logger.info(f"🗑️ Invalidated wallet balance cache {address}")
+            self.client.zadd(f"nonce:{key}:released", {str(nonce): int(nonce)})
             return True
         except Exception as e:
+            BREAKER.record_failure(e)
+            logger.error(f"Redis nonce release error: {e}")
+            return False
+
+    # ========== DURABLE RECORDS ==========
+    #
+    # Work that has to survive a restart (pending settlements, batch jobs):
+    #   records:{kind}   hash   record id -> codec-encoded record
+    #
+    # Deleting a field is the claim: HDEL removes it for exactly one worker.
+
+    def put_record(self, kind: str, record_id: str, value: Any) -> bool:
+        if not self.is_connected():
+            return False
+
+        try:
+            self.client.hset(f"records:{kind}", record_id, encode(value))
+            return True
+        except Exception as e:
+            BREAKER.record_failure(e)
+            logger.error(f"Redis HSET error: {e}")
+            return False
+
+    def get_records(self, kind: str) -> Optional[Dict[str, Any]]:
+        """Every record of a kind by id, None when Redis is unavailable"""
+        if not self.is_connected():
+            return None
+
+        try:
+            rows = self.client.hgetall(f"records:{kind}")
+            return {
+                (record_id.decode() if isinstance(record_id, bytes) else record_id): decode(data)
+                for record_id, data in rows.items()
+            }
+        except Exception as e:
+            BREAKER.record_failure(e)
+            logger.error(f"Redis HGETALL error: {e}")
+            return None
+
+    def claim_record(self, kind: str, record_id: str) -> Optional[bool]:
+        """
+        Remove a record for the caller
+
+        Returns:
+            True if this call removed it, False if it was already gone,
+            None when Redis is unavailable
+        """
+        if not self.is_connected():
+            return None
+
+        try:
+            return bool(self.client.hdel(f"records:{kind}", record_id))
+        except Exception as e:
+            BREAKER.record_failure(e)
+            logger.error(f"Redis HDEL error: {e}")
+            return None
+
+    # ========== CONFIG CHANGE NOTIFICATIONS ==========
+    #
+    #   config_version   string  bumped on every tenant / token config write
+    #
+    # Workers subscribe to the channel and drop the changed entries. Each
+    # message carries the version it created; a worker that resubscribes
+    # compares config_version with the last one it saw and only flushes
+    # its whole cache when a change was missed in between.
+
+    PUBLISH_CONFIG_SCRIPT = """
+    local change = cjson.decode(ARGV[2])
+    change['version'] = redis.call('INCR', KEYS[1])
+    redis.call('PUBLISH', ARGV[1], cjson.encode(change))
+    return change['version']
+    """
+
+    def publish_config_change(self, channel: str, message: str) -> Optional[int]:
+        """
+        Bump the config version and broadcast the change (a JSON object),
+        stamped with that version; returns the version
+        """
+        if not self.is_connected():
+            return None
+
+        try:
+            return int(self.client.eval(
+                self.PUBLISH_CONFIG_SCRIPT, 1, "config_version", channel, message
+            ))
+        except Exception as e:
+            BREAKER.record_failure(e)
+            logger.error(f"Redis PUBLISH error: {e}")
+            return None
+
+    def get_config_version(self) -> Optional[int]:
+        """Current config version (0 before the first change), None when unavailable"""
+        if not self.is_connected():
+            return None
+
+        try:
+            return int(self.client.get("config_version") or 0)
+        except Exception as e:
+            BREAKER.record_failure(e)
+            logger.error(f"Redis GET error: {e}")
+            return None
+
+    def subscribe_config_changes(self, channel: str):
+        """PubSub subscribed to the channel, None when Redis is unavailable"""
+        if not self.is_connected():
+            return None
+
+        try:
+            pubsub = self.client.pubsub()
+            pubsub.subscribe(channel)
+            return pubsub
+        except Exception as e:
+            BREAKER.record_failure(e)
+            logger.error(f"Redis SUBSCRIBE error: {e}")
+            return None
+
+
+class AsyncRedisClient:
+    """
+    asyncio Redis client for the async routes
+
+    Shares key layout, TTLs and hit/miss counters with RedisClient, so
+    entries written on either path are visible to the other. The client
+    connects lazily; failures degrade to cache misses and feed the same
+    circuit breaker as the sync client.
+    """
+
+    def __init__(self):
+        try:
+            self.client = aioredis.Redis(**_connection_settings())
+        except Exception as e:
+            logger.error(f"❌ Async Redis initialization error: {e}")
+            self.client = None
+
+    async def cache_get(self, namespace: str, *scope) -> Optional[Any]:
+        if not self.client or not BREAKER.allow():
+            return None
+
+        key = RedisClient.cache_key(namespace, *scope)
+        try:
+            started = time.perf_counter()
+            data = await self.client.get(key)
+            if data is None:
+                RedisClient._record(namespace, "misses")
+                logger.info(f"❌ Cache MISS: {key}")
+                return None
+
+            value = decode(data)
+            RedisClient._measure(namespace, "read", len(data), started)
+            RedisClient._record(namespace, "hits")
+            logger.info(f"✅ Cache HIT: {key}")
+            return value
+
+        except Exception as e:
+            BREAKER.record_failure(e)
+            logger.error(f"Redis GET error: {e}")
+            return None
+
+    async def cache_set(self, namespace: str, *scope, value: Any, ttl: Optional[int] = None) -> bool:
+        if not self.client or not BREAKER.allow():
+            return False
+
+        key = RedisClient.cache_key(namespace, *scope)
+        ttl = ttl or RedisClient.cache_ttl(namespace)
+        try:
+            started = time.perf_counter()
+            payload = encode(value)
+            await self.client.setex(key, ttl, payload)
+            RedisClient._measure(namespace, "write", len(payload), started)
+            logger.info(f"💾 Cached {key} ({len(payload)}B, TTL={ttl}s)")
+            return True
+        except Exception as e:
+            BREAKER.record_failure(e)
+            logger.error(f"Redis SET error: {e}")
+            return False
+
+    async def cache_delete(self, namespace: str, *scope) -> bool:
+        if not self.client or not BREAKER.allow():
+            return False
+
+        key = RedisClient.cache_key(namespace, *scope)
+        try:
+            return bool(await self.client.delete(key))
+        except Exception as e:
+            BREAKER.record_failure(e)
             logger.error(f"Redis DELETE error: {e}")
             return False
+
+    # ========== WALLET BALANCE CACHE ==========
+
+    async def get_wallet_balance(self, address: str):
+        return await self.cache_get("wallet_balance", address)
+
+    async def set_wallet_balance(self, address: str, balance_data: dict, ttl: Optional[int] = None):
+        return await self.cache_set("wallet_balance", address, value=balance_data, ttl=ttl)
+
+    async def invalidate_wallet_balance(self, address: str):
+        return await self.cache_delete("wallet_balance", address)
+
+
+_async_redis: Optional[AsyncRedisClient] = None
+
+
+def get_async_redis() -> AsyncRedisClient:
+    """Process-wide AsyncRedisClient (its connection pool is reused across requests)"""
+    global _async_redis
+
+    if _async_redis is None:
+        _async_redis = AsyncRedisClient()
+
+    return _async_redis
@@ -0,0 +1,201 @@
+"""
+Token Registry - Process-wide token metadata (decimals, symbol, name)
+"""
+
+import threading
+import logging
+from typing import Optional
+
+from utils.multicall import Multicall, AsyncMulticall
+
+logger = logging.getLogger(__name__)
+
+METADATA_ABI = [
+    {
+        "inputs": [],
+        "name": "decimals",
+        "outputs": [{"name": "", "type": "uint8"}],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [],
+        "name": "symbol",
+        "outputs": [{"name": "", "type": "string"}],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [],
+        "name": "name",
+        "outputs": [{"name": "", "type": "string"}],
+        "stateMutability": "view",
+        "type": "function"
+    }
+]
+
+
+class TokenRegistry:
+    """
+    Token metadata loaded once per process from TokenConfig and verified
+    on-chain a single time, so decimals() never runs on the hot path.
+
+    Entries are keyed by (rpc endpoint, checksum contract address) and
+    dropped by invalidate() whenever TokenDAO changes a token.
+    """
+
+    CACHE = {}
+    LOCK = threading.Lock()
+
+    # ---------------- KEYS ---------------- #
+
+    @staticmethod
+    def _key(web3, contract_address):
+        endpoint = getattr(web3.provider, "endpoint_uri", None) or id(web3.provider)
+        return endpoint, web3.to_checksum_address(contract_address)
+
+    # ---------------- LOADING ---------------- #
+
+    @classmethod
+    def load(cls, web3, contract_addresses, token_configs=None) -> list:
+        """
+        Ensure metadata for every contract is cached
+
+        Missing entries are verified on-chain in one multicall round trip.
+        TokenConfig values are used when the chain read fails.
+
+        Args:
+            web3: Web3 instance for the chain the contracts live on
+            contract_addresses: Contracts to resolve
+            token_configs: Optional TokenConfig rows for those contracts
+
+        Returns:
+            Metadata dicts in the same order as contract_addresses; None
+            for a token whose decimals neither the chain nor its
+            TokenConfig could supply
+        """
+        configs = {
+            web3.to_checksum_address(config.contract_address): config
+            for config in (token_configs or [])
+        }
+
+        keys = [cls._key(web3, address) for address in contract_addresses]
+        missing = [key for key in dict.fromkeys(keys) if key not in cls.CACHE]
+
+        if missing:
+            with cls.LOCK:
+                missing = [key for key in missing if key not in cls.CACHE]
+                if missing:
+                    cls._verify(web3, missing, configs)
+
+        return [cls.CACHE.get(key) for key in keys]
+
+    @classmethod
+    async def aload(cls, web3, contract_addresses, token_configs=None) -> list:
+        """
+        load() for AsyncWeb3 - same cache, verification awaited
+
+        Keys are identical to the sync path, so a token verified by either
+        is served from memory to both.
+        """
+        configs = {
+            web3.to_checksum_address(config.contract_address): config
+            for config in (token_configs or [])
+        }
+
+        keys = [cls._key(web3, address) for address in contract_addresses]
+        missing = [key for key in dict.fromkeys(keys) if key not in cls.CACHE]
+
+        if missing:
+            # No lock: a concurrent duplicate verification is harmless
+            results = await AsyncMulticall(web3).aggregate(cls._metadata_calls(web3, missing))
+            with cls.LOCK:
+                cls._store(missing, results, configs)
+
+        return [cls.CACHE.get(key) for key in keys]
+
+    @staticmethod
+    def _metadata_calls(web3, keys) -> list:
+        calls = []
+
+        for _, address in keys:
+            contract = web3.eth.contract(address=address, abi=METADATA_ABI)
+            calls.extend([
+                contract.functions.decimals(),
+                contract.functions.symbol(),
+                contract.functions.name(),
+            ])
+
+        return calls
+
+    @classmethod
+    def _verify(cls, web3, keys, configs):
+        results = Multicall(web3).aggregate(cls._metadata_calls(web3, keys))
+        cls._store(keys, results, configs)
+
+    @classmethod
+    def _store(cls, keys, results, configs):
+        for i, key in enumerate(keys):
+            address = key[1]
+            decimals, symbol, name = results[i * 3:i * 3 + 3]
+            config = configs.get(address)
+
+            if config is not None:
+                if decimals is not None and config.decimals is not None and decimals != config.decimals:
+                    logger.warning(
+                        f"TokenConfig decimals mismatch for {address}: "
+                        f"config={config.decimals} chain={decimals}, using chain value"
+                    )
+                decimals = decimals if decimals is not None else (config.decimals or 18)
+                symbol = symbol or config.token_symbol
+
+            if decimals is None:
+                # Not cached, so the next load retries the chain read
+                logger.error(f"❌ Unable to resolve decimals for token {address}, skipping it")
+                continue
+
+            cls.CACHE[key] = {
+                "address": address,
+                "decimals": int(decimals),
+                "symbol": symbol,
+                "name": name,
+            }
+            logger.info(f"📒 Registered token {symbol} ({address}) decimals={decimals}")
+
+    # ---------------- LOOKUPS ---------------- #
+
+    @classmethod
+    def get(cls, web3, contract_address, token_config=None) -> dict:
+        key = cls._key(web3, contract_address)
+        metadata = cls.CACHE.get(key)
+        if metadata is not None:
+            return metadata
+
+        configs = [token_config] if token_config is not None else None
+        metadata = cls.load(web3, [contract_address], configs)[0]
+
+        if metadata is None:
+            # A send can't pick an amount scale without decimals
+            raise RuntimeError(f"Unable to resolve decimals for token {contract_address}")
+
+        return metadata
+
+    @classmethod
+    def decimals(cls, web3, contract_address, token_config=None) -> int:
+        return cls.get(web3, contract_address, token_config)["decimals"]
+
+    # ---------------- INVALIDATION ---------------- #
+
+    @classmethod
+    def invalidate(cls, contract_address: Optional[str] = None):
+        """Drop cached metadata for one contract (all chains), or everything"""
+        with cls.LOCK:
+            if contract_address is None:
+                cls.CACHE.clear()
+                return
+
+            address = contract_address.lower()
+            for key in [k for k in cls.CACHE if k[1].lower() == address]:
+                del cls.CACHE[key]
+
+        logger.info(f"🗑️ Token metadata invalidated for {contract_address or 'all tokens'}")
@@ -1,15 +1,130 @@
 import os
-from web3 import Web3
+import time
+import logging
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from web3 import Web3, AsyncWeb3
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+WEB3_POOL_SIZE = int(os.getenv("WEB3_POOL_SIZE", 20))
+WEB3_TIMEOUT = float(os.getenv("WEB3_TIMEOUT", 10))
+WEB3_HEALTH_INTERVAL = float(os.getenv("WEB3_HEALTH_INTERVAL", 30))
+
+
+# ---------------- SYNC REGISTRY ---------------- #
+
+# rpc_url -> Web3; one pooled keep-alive session per RPC per process
+WEB3_CACHE = {}
+# rpc_url -> {"healthy": bool, "checked_at": float, "error": str | None}
+RPC_HEALTH = {}
+
+_registry_lock = threading.Lock()
+_health_thread = None
+
+
+def _pooled_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=WEB3_POOL_SIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_web3(rpc_url: str = None) -> Web3:
+    """
+    Shared Web3 for an RPC endpoint (Tenderly when rpc_url is None)
+
+    Like get_async_web3 there is no connectivity probe on construction;
+    reachability is checked in the background (see rpc_health).
+    """
+    rpc_url = rpc_url or os.getenv("PUBLIC_TENDERLY_RPC_URL")
+    if not rpc_url:
+        raise RuntimeError("PUBLIC_TENDERLY_RPC_URL not set")
+
+    web3 = WEB3_CACHE.get(rpc_url)
+    if web3 is None:
+        with _registry_lock:
+            web3 = WEB3_CACHE.get(rpc_url)
+            if web3 is None:
+                web3 = Web3(Web3.HTTPProvider(
+                    rpc_url,
+                    request_kwargs={"timeout": WEB3_TIMEOUT},
+                    session=_pooled_session()
+                ))
+                WEB3_CACHE[rpc_url] = web3
+                _start_health_checks()
+
+    return web3
+
+
+# ---------------- HEALTH CHECKS ---------------- #
+
+def _check_all():
+    for rpc_url, web3 in list(WEB3_CACHE.items()):
+        try:
+            healthy, error = web3.is_connected(), None
+        except Exception as e:
+            healthy, error = False, str(e)
+
+        if not healthy and RPC_HEALTH.get(rpc_url, {}).get("healthy", True):
+            logger.warning(f"⚠️ RPC unreachable: {rpc_url}")
+
+        RPC_HEALTH[rpc_url] = {
+            "healthy": healthy,
+            "checked_at": time.time(),
+            "error": error,
+        }
+
+
+def _run_health_checks():
+    while True:
+        _check_all()
+        time.sleep(WEB3_HEALTH_INTERVAL)
+
+
+def _start_health_checks():
+    global _health_thread
+
+    if _health_thread is None:
+        _health_thread = threading.Thread(
+            target=_run_health_checks,
+            name="rpc-health",
+            daemon=True
+        )
+        _health_thread.start()
+
+
+def rpc_health() -> dict:
+    """Last background check per RPC (unchecked endpoints are omitted)"""
+    return dict(RPC_HEALTH)
+
+
 class Web3Client:
     def __init__(self):
-        rpc_url = os.getenv("PUBLIC_TENDERLY_RPC_URL")
-        if not rpc_url:
-            raise RuntimeError("PUBLIC_TENDERLY_RPC_URL not set")
+        self.w3 = get_web3()
+
+
+# rpc_url -> AsyncWeb3; one aiohttp-backed provider per RPC per process
+ASYNC_WEB3_CACHE = {}
+
+
+def get_async_web3(rpc_url: str = None) -> AsyncWeb3:
+    """
+    AsyncWeb3 for an RPC endpoint (Tenderly when rpc_url is None)
+
+    No connectivity probe here - a dead RPC surfaces on the first call
+    instead of blocking construction.
+    """
+    rpc_url = rpc_url or os.getenv("PUBLIC_TENDERLY_RPC_URL")
+    if not rpc_url:
+        raise RuntimeError("PUBLIC_TENDERLY_RPC_URL not set")
+
+    if rpc_url not in ASYNC_WEB3_CACHE:
+        ASYNC_WEB3_CACHE[rpc_url] = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(rpc_url))
 
-        self.w3 = Web3(Web3.HTTPProvider(rpc_url))
-        if not self.w3.is_connected():
-            raise RuntimeError("Failed to connect to Tenderly RPC")
+    return ASYNC_WEB3_CACHE[rpc_url]